@@ -0,0 +1,350 @@
+import asyncio
+import contextvars
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from time import time
+from typing import Any, AsyncIterator, Callable, Optional, Union
+
+from Pody.configuration import Configuration
+from Pody.driver.driver import Driver
+from Pody.factory.fetch import Fetch
+from Pody.factory.query import Query
+from Pody.handle import Handle
+from Pody.pool import Pool
+from Pody.querylog import QueryLog
+from Pody.resultcache import ResultCache
+from Pody.statistics import Statistics
+
+
+
+class AsyncConnection:
+    """Objet de connexion asynchrone à la base de données.
+    
+    Les sockets sont partagés par toutes les tâches via un pool, une tâche n'en
+    occupe un que le temps de l'exécution de sa requête, les appels bloquants
+    étant délégués à un nombre de threads égal à la taille maximale du pool.
+    
+    Hors d'un bloc transaction(), chaque emprunt est validé à sa fin, même sans autocommit,
+    une transaction non validée étant sinon annulée au retour du socket dans le pool.
+    
+    Il ne s'agit pas d'un pilote asynchrone : chaque requête occupe un thread, le
+    nombre de requêtes simultanées est limité par la taille maximale du pool, et une
+    requête en cours ne peut être interrompue. Une tâche annulée (par asyncio.wait_for
+    par exemple) ne l'est donc qu'une fois la requête de son thread terminée, son
+    socket n'étant rendu au pool qu'à ce moment.
+    """
+    
+    
+    __instances = {} # type: dict[str, AsyncConnection] # Liste des instances de connexion asynchrone à la base de données.
+    __lock = threading.Lock() # type: threading.Lock # Verrou de la liste des instances.
+    
+    
+    @classmethod
+    def getAllInstances(cls) -> 'dict[str, AsyncConnection]':
+        """Retourne la liste des instances de connexion asynchrone à la base de données.
+
+        Returns:
+            dict[str, AsyncConnection]: Liste des instances de connexion asynchrone à la base de données.
+        """
+        with cls.__lock:
+            return dict(cls.__instances)
+    
+    
+    @classmethod
+    def getInstance(cls, database : str) -> 'AsyncConnection':
+        """Retourne l'instance de connexion asynchrone correspondant au nom de la base de données.
+
+        Args:
+            database (str): Nom de la base de données.
+
+        Raises:
+            Exception: Aucune instance de connexion asynchrone à la base de données n'a été trouvée.
+
+        Returns:
+            AsyncConnection: Instance de connexion asynchrone à la base de données.
+        """
+        instance = cls.__instances.get(database)
+        if not instance is None:
+            return instance
+        else:
+            raise Exception(f'Aucune connexion asynchrone à la base de données "{database}" n\'a été établie !')
+    
+    
+    @classmethod
+    async def closeAllInstances(cls) -> None:
+        """Ferme toutes les instances de connexion asynchrone à la base de données.
+        """
+        logging.info('Fermeture de toutes les instances de connexion asynchrone à la base de données...')
+        for instance in cls.getAllInstances().values():
+            await instance.closeSocket()
+        logging.info('Toutes les instances asynchrones ont été fermées.')
+    
+    
+    def __init__(self, configuration : Configuration) -> None:
+        """Constructeur de la classe.
+
+        Args:
+            configuration (Configuration): Objet de configuration de la connexion à la base de données.
+
+        Raises:
+            error: Erreur de connexion à la base de données.
+        """
+        self.__configuration = configuration
+        self.__results = ResultCache.of(configuration)
+        self.__log = QueryLog(configuration)
+        try:
+            logging.info(f'Connexion asynchrone à la base de données "{configuration.getDatabase()}"...')
+            self.__pool = Pool(configuration)
+            self.__semaphore = asyncio.Semaphore(configuration.getPoolmax())
+            self.__executor = ThreadPoolExecutor(configuration.getPoolmax(), 'Pody')
+            self.__waits = 0
+            self.__bound = contextvars.ContextVar(f'pody-{configuration.getDatabase()}', default = None) # type: contextvars.ContextVar # Socket et verrou de la transaction de la tâche courante (voir transaction()).
+            with self.__lock:
+                self.__instances[configuration.getDatabase()] = self
+            logging.info(f'La connexion asynchrone a été établie.')
+        except Driver.ERRORS as error:
+            logging.error(f'Impossible de se connecter !')
+            logging.error(error)
+            raise error
+    
+    
+    def getConfiguration(self) -> Configuration:
+        """Retourne l'objet de configuration de la connexion à la base de données.
+
+        Returns:
+            Configuration: Objet de configuration de la connexion à la base de données.
+        """
+        return self.__configuration
+    
+    
+    def getPool(self) -> Pool:
+        """Retourne le pool de sockets de la connexion.
+
+        Returns:
+            Pool: Pool de sockets.
+        """
+        return self.__pool
+    
+    
+    def getResultCache(self) -> Optional[ResultCache]:
+        """Retourne le cache des résultats de lecture de la base de données.
+
+        Returns:
+            Optional[ResultCache]: Cache des résultats, None s'il est désactivé.
+        """
+        return self.__results
+    
+    
+    def getStatistics(self) -> Optional[Statistics]:
+        """Retourne les statistiques des requêtes exécutées sur la base de données.
+
+        Returns:
+            Optional[Statistics]: Statistiques par requête normalisée et requêtes lentes, None si elles sont désactivées.
+        """
+        return Statistics.of(self.__configuration)
+    
+    
+    def getStats(self) -> dict:
+        """Retourne les statistiques du pool de sockets.
+
+        Returns:
+            dict: Statistiques du pool, ainsi que le nombre de tâches ayant attendu un socket libre.
+        """
+        stats = self.__pool.getStats()
+        stats['waits'] += self.__waits
+        return stats
+    
+    
+    @asynccontextmanager
+    async def borrow(self) -> AsyncIterator[Handle]:
+        """Emprunte un socket du pool le temps du bloc.
+
+        Dans un bloc transaction(), le socket de la transaction est prêté, une requête à la fois.
+        Sinon, sans autocommit, la transaction ouverte par le bloc est validée à sa fin.
+
+        Raises:
+            Exception: Aucun socket ne s'est libéré à temps.
+
+        Yields:
+            Handle: Socket emprunté.
+        """
+        bound = self.__bound.get()
+        if not bound is None:
+            handle, lock = bound
+            async with lock:
+                yield handle
+            return
+        semaphore = self.__semaphore
+        if not semaphore.locked():
+            await semaphore.acquire()
+        else:
+            self.__waits += 1
+            try:
+                await asyncio.wait_for(semaphore.acquire(), self.__configuration.getPooltimeout())
+            except asyncio.TimeoutError:
+                raise Exception(f'Aucun socket libre dans le pool de la base de données "{self.__configuration.getDatabase()}" !')
+        try:
+            handle = await self.__run(self.__pool.borrow, abandon = self.__pool.release)
+            broken = False
+            try:
+                yield handle
+                if not self.__configuration.isAutocommit() and handle.getConnection().in_transaction:
+                    await self.__run(handle.commit)
+            except Driver.ERRORS as error:
+                broken = await self.__run(handle.isBroken, error)
+                raise
+            finally:
+                await self.__run(self.__pool.release, handle, broken)
+        finally:
+            semaphore.release()
+    
+    
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[Handle]:
+        """Ouvre une transaction sur un socket réservé le temps du bloc.
+        
+        Les requêtes du bloc (runFetch, runWith et méthodes asynchrones des modèles), y compris
+        celles des tâches qu'il lance, passent par ce socket l'une après l'autre. La transaction
+        est validée à la fin du bloc, et annulée au retour du socket dans le pool si une exception
+        en sort. Un bloc imbriqué rejoint la transaction en cours.
+
+        Raises:
+            Exception: Aucun socket ne s'est libéré à temps.
+
+        Yields:
+            Handle: Socket de la transaction.
+        """
+        bound = self.__bound.get()
+        if not bound is None:
+            yield bound[0]
+            return
+        async with self.borrow() as handle:
+            await self.__run(handle.begin)
+            token = self.__bound.set((handle, asyncio.Lock()))
+            try:
+                yield handle
+            finally:
+                self.__bound.reset(token)
+            await self.__run(handle.commit)
+    
+    
+    async def runFetch(self, query : Query, parameters : Union[tuple, Any] = (), fetch : str = Fetch.NONE, class_ : type = None) -> Any:
+        """Exécute une requête SQL et récupère son résultat sur un socket emprunté.
+
+        Args:
+            query (Query): Objet de requête.
+            parameters (Union[tuple, Any], optional): Liste des paramètres de la requête. Par défaut, la liste est vide.
+            fetch (str, optional): Mode de récupération du résultat (voir Fetch). Par défaut Fetch.NONE.
+            class_ (type, optional): Type des objets pour les modes Fetch.OBJECT, Fetch.OBJECTS et Fetch.VIEWS. Par défaut None.
+
+        Returns:
+            Any: Résultat de la requête selon le mode de récupération.
+        """
+        if type(parameters) is not tuple:
+            parameters = (parameters,)
+        sql = str(query)
+        ticket = None
+        if not self.__results is None and fetch != Fetch.NONE and self.__configuration.isAutocommit() and self.__bound.get() is None:
+            ticket = self.__results.prepare(sql, parameters, fetch in (Fetch.ALL, Fetch.OBJECTS, Fetch.VIEWS))
+        if not ticket is None:
+            result = self.__results.get(ticket)
+            if not result is ResultCache.MISS:
+                QueryLog.LOGGER.info('Résultat de la requête asynchrone "%s" lu depuis le cache.', query)
+                return Handle.convert(fetch, *result, class_)
+        async with self.borrow() as handle:
+            return await self.__run(self.__execute, handle, sql, parameters, fetch, class_, ticket)
+    
+    
+    async def runWith(self, function : Callable, *arguments) -> Any:
+        """Exécute une fonction bloquante sur un socket emprunté, depuis un thread du pool.
+
+        Args:
+            function (Callable): Fonction recevant le socket puis les arguments.
+            arguments: Arguments de la fonction.
+
+        Returns:
+            Any: Retour de la fonction.
+        """
+        async with self.borrow() as handle:
+            return await self.__run(function, handle, *arguments)
+    
+    
+    async def closeSocket(self) -> None:
+        """Ferme les sockets du pool de connexion asynchrone.
+        """
+        logging.info(f'Fermeture des sockets asynchrones de la base de données "{self.__configuration.getDatabase()}"...')
+        await self.__run(self.__pool.close)
+        self.__executor.shutdown(wait = False)
+        with self.__lock:
+            self.__instances.pop(self.__configuration.getDatabase(), None)
+        logging.info('Sockets asynchrones fermés.')
+    
+    
+    async def __run(self, function : Callable, *arguments, abandon : Callable = None) -> Any:
+        """Exécute une fonction bloquante dans un thread du pool.
+        
+        La fonction ne pouvant être interrompue dans son thread, l'annulation de la tâche
+        n'est propagée qu'une fois la fonction terminée : le socket qu'elle utilise n'est
+        ainsi jamais rendu au pool, ni emprunté par une autre tâche, pendant son exécution.
+
+        Args:
+            function (Callable): Fonction à exécuter.
+            arguments: Arguments de la fonction.
+            abandon (Callable, optional): Fonction recevant le retour de la fonction si la tâche a été annulée entre-temps, exécutée dans un thread du pool. Par défaut None.
+
+        Raises:
+            asyncio.CancelledError: La tâche a été annulée, la fonction étant terminée.
+
+        Returns:
+            Any: Retour de la fonction.
+        """
+        future = asyncio.get_running_loop().run_in_executor(self.__executor, function, *arguments)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            while not future.done():
+                try:
+                    await asyncio.wait((future,))
+                except asyncio.CancelledError:
+                    pass
+            if not abandon is None and not future.cancelled() and future.exception() is None:
+                self.__executor.submit(abandon, future.result())
+            raise
+    
+    
+    def __execute(self, handle : Handle, sql : str, parameters : tuple, fetch : str, class_ : type, ticket : tuple = None) -> Any:
+        """Exécute la requête et récupère son résultat, appelé depuis un thread du pool.
+
+        Args:
+            handle (Handle): Socket emprunté.
+            sql (str): Requête SQL.
+            parameters (tuple): Liste des paramètres de la requête.
+            fetch (str): Mode de récupération du résultat.
+            class_ (type): Type des objets.
+            ticket (tuple, optional): Ticket de recherche du résultat dans le cache, None s'il ne doit pas y être enregistré. Par défaut None.
+
+        Returns:
+            Any: Résultat de la requête selon le mode de récupération.
+        """
+        log = self.__log
+        detailed = log.isDetailed()
+        if detailed:
+            log.start(sql, parameters)
+        timed = log.isTimed()
+        start = time() if timed else 0
+        try:
+            handle.execute(sql, parameters)
+            if ticket is None:
+                result = handle.fetch(fetch, class_)
+            else:
+                rows = handle.fetchRows(fetch)
+                self.__results.put(ticket, rows)
+                result = Handle.convert(fetch, *rows, class_)
+        except Driver.ERRORS:
+            if timed: log.finish(time() - start, detailed, True)
+            raise
+        if timed or detailed:
+            log.finish(time() - start if timed else 0.0, detailed)
+        return result
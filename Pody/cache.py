@@ -0,0 +1,139 @@
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Hashable
+
+
+
+class Cache:
+    """Cache LRU à durée de vie limitée, partagé par les threads.
+    
+    Les entrées les moins récemment lues sont évincées au-delà de la taille
+    maximale, celles plus anciennes que la durée de vie sont ignorées à la lecture.
+    """
+    
+    
+    def __init__(self, size : int = 1024, ttl : float = None, budget : int = None) -> None:
+        """Constructeur de la classe.
+
+        Args:
+            size (int, optional): Nombre maximum d'entrées. Par défaut 1024.
+            ttl (float, optional): Durée de vie des entrées en secondes, None pour ne jamais expirer. Par défaut None.
+            budget (int, optional): Poids total maximum des entrées, None pour ne limiter que leur nombre. Par défaut None.
+        """
+        self.__size = size
+        self.__ttl = ttl
+        self.__budget = budget
+        self.__weight = 0 # type: int # Poids total des entrées.
+        self.__entries = OrderedDict() # type: OrderedDict[Hashable, tuple] # Valeurs et dates d'insertion par clé.
+        self.__lock = threading.Lock()
+        self.__stats = {
+            'hits': 0,
+            'misses': 0,
+            'evicted': 0,
+            'expired': 0,
+            'invalidated': 0
+        } # type: dict[str, int] # Compteurs du cache.
+    
+    
+    def getSize(self) -> int:
+        """Retourne le nombre maximum d'entrées.
+
+        Returns:
+            int: Nombre maximum d'entrées.
+        """
+        return self.__size
+    
+    
+    def getTtl(self) -> float:
+        """Retourne la durée de vie des entrées.
+
+        Returns:
+            float: Durée de vie en secondes, None si les entrées n'expirent pas.
+        """
+        return self.__ttl
+    
+    
+    def getStats(self) -> dict:
+        """Retourne les statistiques du cache.
+
+        Returns:
+            dict: Lectures réussies et manquées, entrées évincées, expirées et invalidées, taille courante et maximale, poids total.
+        """
+        with self.__lock:
+            stats = dict(self.__stats)
+            stats['length'] = len(self.__entries)
+            stats['size'] = self.__size
+            stats['weight'] = self.__weight
+        return stats
+    
+    
+    def get(self, key : Hashable) -> Any:
+        """Retourne la valeur d'une clé et la marque comme récemment lue.
+
+        Args:
+            key (Hashable): La clé.
+
+        Returns:
+            Any: La valeur, None si la clé est absente ou expirée.
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.__stats['misses'] += 1
+                return None
+            value, created, weight = entry
+            if not self.__ttl is None and monotonic() - created > self.__ttl:
+                del self.__entries[key]
+                self.__weight -= weight
+                self.__stats['expired'] += 1
+                self.__stats['misses'] += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.__stats['hits'] += 1
+            return value
+    
+    
+    def put(self, key : Hashable, value : Any, weight : int = 0) -> None:
+        """Enregistre la valeur d'une clé, en évinçant les entrées les moins récemment lues si besoin.
+
+        Args:
+            key (Hashable): La clé.
+            value (Any): La valeur.
+            weight (int, optional): Le poids de l'entrée, compté dans le poids total maximum. Par défaut 0.
+        """
+        budget = self.__budget
+        with self.__lock:
+            previous = self.__entries.pop(key, None)
+            if not previous is None:
+                self.__weight -= previous[2]
+            if not budget is None and weight > budget:
+                return
+            self.__entries[key] = (value, monotonic(), weight)
+            self.__weight += weight
+            while len(self.__entries) > self.__size or (not budget is None and self.__weight > budget):
+                _, (_, _, evicted) = self.__entries.popitem(last = False)
+                self.__weight -= evicted
+                self.__stats['evicted'] += 1
+    
+    
+    def invalidate(self, key : Hashable) -> None:
+        """Retire une clé du cache.
+
+        Args:
+            key (Hashable): La clé.
+        """
+        with self.__lock:
+            entry = self.__entries.pop(key, None)
+            if not entry is None:
+                self.__weight -= entry[2]
+                self.__stats['invalidated'] += 1
+    
+    
+    def clear(self) -> None:
+        """Retire toutes les entrées du cache.
+        """
+        with self.__lock:
+            self.__stats['invalidated'] += len(self.__entries)
+            self.__entries.clear()
+            self.__weight = 0
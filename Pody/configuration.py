@@ -1,3 +1,7 @@
+from typing import Optional
+
+
+
 
 
 
@@ -17,7 +21,24 @@ class Configuration:
         buffered : bool = False,
         maxpacket : int = 65535,
         timer : bool = True,
-        beautify : bool = False) -> None:
+        beautify : bool = False,
+        poolmin : int = 1,
+        poolmax : int = 10,
+        pooltimeout : float = 30.0,
+        idletime : float = 300.0,
+        lifetime : float = 3600.0,
+        ping : float = 1.0,
+        bulkpacket : int = 4194304,
+        localinfile : bool = False,
+        resultcache : int = 0,
+        resultttl : float = 60.0,
+        resultbudget : int = 16777216,
+        logsample : float = 1.0,
+        logsummary : float = 0.0,
+        statistics : bool = False,
+        slowquery : float = 0.0,
+        slowexplain : bool = False,
+        driver : str = 'auto') -> None:
         """Constructeur de la classe.
 
         Args:
@@ -32,6 +53,23 @@ class Configuration:
             maxpacket (int, optional): Taille maximale des paquets. Par défaut 65535.
             timer (bool, optional): Activation du chronomètre. Par défaut True.
             beautify (bool, optional): Activation de la mise en forme des objets. Par défaut False.
+            poolmin (int, optional): Nombre minimum de sockets ouverts dans le pool. Par défaut 1.
+            poolmax (int, optional): Nombre maximum de sockets ouverts dans le pool. Par défaut 10.
+            pooltimeout (float, optional): Temps d'attente maximum d'un socket libre en secondes. Par défaut 30.
+            idletime (float, optional): Durée d'inactivité en secondes avant la fermeture d'un socket. Par défaut 300.
+            lifetime (float, optional): Durée de vie maximale d'un socket en secondes. Par défaut 3600.
+            ping (float, optional): Durée d'inactivité en secondes au-delà de laquelle un socket est vérifié à l'emprunt, None pour ne jamais vérifier. Par défaut 1.
+            bulkpacket (int, optional): Taille maximale en octets des requêtes multi-lignes, bornée par celle acceptée par le serveur. Par défaut 4194304.
+            localinfile (bool, optional): Autorisation des chargements LOAD DATA LOCAL INFILE côté client. Par défaut False.
+            resultcache (int, optional): Nombre maximum de résultats de lecture en cache, 0 pour désactiver le cache. Par défaut 0.
+            resultttl (float, optional): Durée de vie des résultats en cache en secondes, None pour ne jamais expirer. Par défaut 60.
+            resultbudget (int, optional): Taille mémoire maximale estimée des résultats en cache en octets. Par défaut 16777216.
+            logsample (float, optional): Fraction des requêtes dont le détail est journalisé, entre 0 et 1. Par défaut 1.
+            logsummary (float, optional): Intervalle en secondes entre deux lignes de résumé des requêtes, 0 pour désactiver le résumé. Par défaut 0.
+            statistics (bool, optional): Activation des statistiques par requête (appels, lignes, histogramme des durées). Par défaut False.
+            slowquery (float, optional): Durée en secondes au-delà de laquelle une requête est enregistrée comme lente, 0 pour désactiver. Par défaut 0.
+            slowexplain (bool, optional): Enregistrement du plan d'exécution (EXPLAIN) des requêtes lentes. Par défaut False.
+            driver (str, optional): Pilote de la base de données : 'auto', 'pure', 'c', 'sqlite' ou un pilote enregistré (voir Driver). Par défaut 'auto'.
         """
         self.__database = database
         self.__user = user
@@ -44,6 +82,23 @@ class Configuration:
         self.__maxpacket = maxpacket
         self.__timer = timer
         self.__beautify = beautify
+        self.__poolmin = poolmin
+        self.__poolmax = poolmax
+        self.__pooltimeout = pooltimeout
+        self.__idletime = idletime
+        self.__lifetime = lifetime
+        self.__ping = ping
+        self.__bulkpacket = bulkpacket
+        self.__localinfile = localinfile
+        self.__resultcache = resultcache
+        self.__resultttl = resultttl
+        self.__resultbudget = resultbudget
+        self.__logsample = logsample
+        self.__logsummary = logsummary
+        self.__statistics = statistics
+        self.__slowquery = slowquery
+        self.__slowexplain = slowexplain
+        self.__driver = driver
         
     
     def getDatabase(self) -> str:
@@ -142,4 +197,157 @@ class Configuration:
         Returns:
             bool: État de la mise en forme des objets.
         """
-        return self.__beautify
\ No newline at end of file
+        return self.__beautify
+    
+    
+    def getPoolmin(self) -> int:
+        """Retourne le nombre minimum de sockets ouverts dans le pool.
+
+        Returns:
+            int: Nombre minimum de sockets.
+        """
+        return self.__poolmin
+    
+    
+    def getPoolmax(self) -> int:
+        """Retourne le nombre maximum de sockets ouverts dans le pool.
+
+        Returns:
+            int: Nombre maximum de sockets.
+        """
+        return self.__poolmax
+    
+    
+    def getPooltimeout(self) -> float:
+        """Retourne le temps d'attente maximum d'un socket libre.
+
+        Returns:
+            float: Temps d'attente en secondes.
+        """
+        return self.__pooltimeout
+    
+    
+    def getIdletime(self) -> float:
+        """Retourne la durée d'inactivité avant la fermeture d'un socket.
+
+        Returns:
+            float: Durée d'inactivité en secondes.
+        """
+        return self.__idletime
+    
+    
+    def getLifetime(self) -> float:
+        """Retourne la durée de vie maximale d'un socket.
+
+        Returns:
+            float: Durée de vie en secondes.
+        """
+        return self.__lifetime
+    
+    
+    def getPing(self) -> Optional[float]:
+        """Retourne la durée d'inactivité au-delà de laquelle un socket est vérifié à l'emprunt.
+
+        Returns:
+            Optional[float]: Durée d'inactivité en secondes, None si la vérification est désactivée.
+        """
+        return self.__ping
+    
+    
+    def getBulkpacket(self) -> int:
+        """Retourne la taille maximale des requêtes multi-lignes.
+
+        Returns:
+            int: Taille maximale en octets.
+        """
+        return self.__bulkpacket
+    
+    
+    def isLocalinfile(self) -> bool:
+        """Retourne l'autorisation des chargements LOAD DATA LOCAL INFILE.
+
+        Returns:
+            bool: Autorisation des chargements de fichiers locaux.
+        """
+        return self.__localinfile
+    
+    
+    def getResultcache(self) -> int:
+        """Retourne le nombre maximum de résultats de lecture en cache.
+
+        Returns:
+            int: Nombre maximum de résultats, 0 si le cache est désactivé.
+        """
+        return self.__resultcache
+    
+    
+    def getResultttl(self) -> float:
+        """Retourne la durée de vie des résultats en cache.
+
+        Returns:
+            float: Durée de vie en secondes, None si les résultats n'expirent pas.
+        """
+        return self.__resultttl
+    
+    
+    def getResultbudget(self) -> int:
+        """Retourne la taille mémoire maximale des résultats en cache.
+
+        Returns:
+            int: Taille maximale estimée en octets.
+        """
+        return self.__resultbudget
+    
+    
+    def getLogsample(self) -> float:
+        """Retourne la fraction des requêtes dont le détail est journalisé.
+
+        Returns:
+            float: Fraction des requêtes, entre 0 et 1.
+        """
+        return self.__logsample
+    
+    
+    def getLogsummary(self) -> float:
+        """Retourne l'intervalle entre deux lignes de résumé des requêtes.
+
+        Returns:
+            float: Intervalle en secondes, 0 si le résumé est désactivé.
+        """
+        return self.__logsummary
+    
+    
+    def isStatistics(self) -> bool:
+        """Retourne l'état d'activation des statistiques par requête.
+
+        Returns:
+            bool: Activation des statistiques.
+        """
+        return self.__statistics
+    
+    
+    def getSlowquery(self) -> float:
+        """Retourne la durée au-delà de laquelle une requête est lente.
+
+        Returns:
+            float: Durée en secondes, 0 si les requêtes lentes ne sont pas enregistrées.
+        """
+        return self.__slowquery
+    
+    
+    def isSlowexplain(self) -> bool:
+        """Retourne l'état d'enregistrement du plan d'exécution des requêtes lentes.
+
+        Returns:
+            bool: Enregistrement du plan d'exécution.
+        """
+        return self.__slowexplain
+    
+    
+    def getDriver(self) -> str:
+        """Retourne le nom du pilote de la base de données.
+
+        Returns:
+            str: Nom du pilote.
+        """
+        return self.__driver
\ No newline at end of file
@@ -1,12 +1,20 @@
 import logging
+import threading
+from contextlib import contextmanager
 from time import time
-import mysql
-import mysql.connector
-from typing import List, Dict, Any, Tuple, Union, Optional
+from typing import Callable, Iterator, List, Dict, Any, Tuple, Union, Optional
 
 from Pody.configuration import Configuration
+from Pody.driver.driver import Driver
+from Pody.factory.fetch import Fetch
+from Pody.factory.repository.rowset import RowSet
+from Pody.handle import Handle
+from Pody.pin import Pin
+from Pody.pool import Pool
+from Pody.querylog import QueryLog
+from Pody.resultcache import ResultCache
+from Pody.statistics import Statistics
 from Pody.factory.query import Query
-from Pody.factory.repository.converter import Converter
 
 
 
@@ -16,6 +24,7 @@ class Connection:
     
     
     __instances = {} # type: dict[str, Connection] # Liste des instances de connexion à la base de données.
+    __lock = threading.Lock() # type: threading.Lock # Verrou de la liste des instances.
     
     
     @classmethod
@@ -25,7 +34,8 @@ class Connection:
         Returns:
             dict[str, Connection]: Liste des instances de connexion à la base de données.
         """
-        return cls.__instances
+        with cls.__lock:
+            return dict(cls.__instances)
     
     
     @classmethod
@@ -41,8 +51,9 @@ class Connection:
         Returns:
             Connection: Instance de connexion à la base de données.
         """
-        if database in cls.__instances:
-            return cls.__instances[database]
+        instance = cls.__instances.get(database)
+        if not instance is None:
+            return instance
         else:
             raise Exception(f'Aucune connexion à la base de données "{database}" n\'a été établie !')
 
@@ -52,7 +63,7 @@ class Connection:
         """Ferme toutes les instances de connexion à la base de données.
         """
         logging.info('Fermeture de toutes les instances de connexion à la base de données...')
-        for instance in cls.__instances.values():
+        for instance in cls.getAllInstances().values():
             instance.closeSocket()
         logging.info('Toutes les instances ont été fermées.')
         
@@ -64,8 +75,9 @@ class Connection:
         Args:
             database (str): Nom de la base de données.
         """
-        if database in cls.__instances:
-            return cls.__instances[database].closeSocket()
+        instance = cls.__instances.get(database)
+        if not instance is None:
+            return instance.closeSocket()
         else:
             raise Exception(f'Aucune connexion à la base de données "{database}" n\'a été établie !')
         
@@ -80,24 +92,16 @@ class Connection:
             error: Erreur de connexion à la base de données.
         """
         self.__configuration = configuration
+        self.__local = threading.local()
+        self.__results = ResultCache.of(configuration)
+        self.__log = QueryLog(configuration)
         try:
             logging.info(f'Connexion à la base de données "{configuration.getDatabase()}"...')
-            self.__connection = mysql.connector.connect(
-                host = configuration.getHost(),
-                database = configuration.getDatabase(),
-                user = configuration.getUser(),
-                password = configuration.getPassword(),
-                port = configuration.getPort()
-            )
-            self.__cursor = self.__connection.cursor(
-                dictionary = False,
-                prepared = configuration.isPrepared(),
-                buffered = configuration.isBuffered()
-            )
-            self.__connection.autocommit = configuration.isAutocommit()
-            self.__instances[configuration.getDatabase()] = self
+            self.__pool = Pool(configuration)
+            with self.__lock:
+                self.__instances[configuration.getDatabase()] = self
             logging.info(f'La connexion a été établie.')
-        except mysql.connector.Error as error:
+        except Driver.ERRORS as error:
             logging.error(f'Impossible de se connecter !')
             logging.error(error)
             raise error
@@ -112,31 +116,98 @@ class Connection:
         return self.__configuration
     
     
-    def getConnection(self) -> mysql.connector.connection.MySQLConnection:
-        """Retourne l'objet de connexion à la base de données.
+    def getPool(self) -> Pool:
+        """Retourne le pool de sockets de la connexion à la base de données.
 
         Returns:
-            mysql.connector.connection.MySQLConnection: Objet de connexion à la base de données.
+            Pool: Pool de sockets.
         """
-        return self.__connection
+        return self.__pool
     
     
-    def getCursor(self) -> mysql.connector.cursor.MySQLCursor:
-        """Retourne l'objet de curseur de la connexion à la base de données.
+    def getStats(self) -> dict:
+        """Retourne les statistiques du pool de sockets.
 
         Returns:
-            mysql.connector.cursor.MySQLCursor: Objet de curseur de la connexion à la base de données.
+            dict: Statistiques du pool de sockets.
         """
-        return self.__cursor
+        return self.__pool.getStats()
+    
+    
+    def getResultCache(self) -> Optional[ResultCache]:
+        """Retourne le cache des résultats de lecture de la base de données.
+
+        Returns:
+            Optional[ResultCache]: Cache des résultats, None s'il est désactivé.
+        """
+        return self.__results
+    
+    
+    def getStatistics(self) -> Optional[Statistics]:
+        """Retourne les statistiques des requêtes exécutées sur la base de données.
+
+        Returns:
+            Optional[Statistics]: Statistiques par requête normalisée et requêtes lentes, None si elles sont désactivées.
+        """
+        return Statistics.of(self.__configuration)
+    
+    
+    def getConnection(self) -> Any:
+        """Retourne l'objet de connexion du socket attaché au thread courant.
+
+        Returns:
+            Any: Objet de connexion du pilote à la base de données (voir Driver).
+        """
+        return self.__acquire().getConnection()
+    
+    
+    def getCursor(self) -> Any:
+        """Retourne l'objet de curseur du socket attaché au thread courant.
+
+        Returns:
+            Any: Objet de curseur du pilote de la connexion à la base de données (voir Driver).
+        """
+        return self.__acquire().getCursor()
     
     
     def getLastInsertId(self) -> int:
-        """Retourne l'identifiant de la dernière insertion.
+        """Retourne l'identifiant de la dernière insertion du thread courant.
 
         Returns:
             int: Identifiant de la dernière insertion.
         """
-        return self.__cursor.lastrowid
+        return getattr(self.__local, 'lastrowid', None)
+    
+    
+    @contextmanager
+    def borrow(self) -> Iterator[Handle]:
+        """Attache un socket du pool au thread courant le temps du bloc.
+
+        Yields:
+            Handle: Socket emprunté.
+        """
+        local = self.__local
+        handle = self.__acquire()
+        local.depth = getattr(local, 'depth', 0) + 1
+        try:
+            yield handle
+        finally:
+            local.depth -= 1
+            self.__release()
+    
+    
+    def runWith(self, function : Callable, *arguments) -> Any:
+        """Exécute une fonction sur le socket attaché au thread courant.
+
+        Args:
+            function (Callable): Fonction recevant le socket puis les arguments.
+            arguments: Arguments de la fonction.
+
+        Returns:
+            Any: Retour de la fonction.
+        """
+        with self.borrow() as handle:
+            return function(handle, *arguments)
     
     
     def runQuery(self, query : Query, parameters : Union[tuple, Any] = ()) -> 'Connection':
@@ -149,34 +220,58 @@ class Connection:
         Returns:
             Connection: Instance de connexion à la base de données.
         """
-        logging.info(f'Exécution de la requête "{query}"...')
+        log = self.__log
+        detailed = log.isDetailed()
         if type(parameters) is not tuple:
             parameters = (parameters,)
-        config = self.getConfiguration()
-        count = len(parameters)
-        hastimer = config.hasTimer()
-        sql = str(query)
-        start, stop = 0, 0
-        if count == 0 or type(parameters[0]) is not tuple:
-            logging.info(f'Paramètres de la requête "{parameters}"...')
-            if hastimer: start = time()
-            self.__cursor.execute(sql, parameters)
-            if hastimer: stop = time()
-        else:
-            logging.info(f'Exécution multiple, paramètres non affichables...')
-            size = config.getMaxpacket()
-            lenght = round(size / len(parameters[0]))
-            composites = [ parameters[x:x+lenght] for x in range(0, count, lenght) ]
-            if hastimer: start = time()
-            for composite in composites:
-                self.__cursor.executemany(sql, composite)
-            if hastimer: stop = time()
-        logging.info(f'Exécution de la requête terminée.')
-        if hastimer:
-            seconds = round(stop - start, 3)
-            logging.info(f'Temps d\'exécution de la requête : {seconds} secondes.')
+        if detailed:
+            log.start(query, parameters)
+        timed = log.isTimed()
+        start = 0
+        handle = self.__acquire()
+        try:
+            if timed: start = time()
+            handle.execute(str(query), parameters)
+        except Driver.ERRORS as error:
+            if timed: log.finish(time() - start, detailed, True)
+            self.__fail(handle, error)
+            raise
+        if timed or detailed:
+            log.finish(time() - start if timed else 0.0, detailed)
+        cursor = handle.getCursor()
+        self.__local.lastrowid = cursor.lastrowid
+        if not cursor.with_rows:
+            self.__release()
         return self
     
+    
+    def runFetch(self, query : Query, parameters : Union[tuple, Any] = (), fetch : str = Fetch.NONE, class_ : type = None) -> Any:
+        """Exécute une requête SQL et récupère son résultat sur un même socket, de manière atomique pour le thread courant.
+
+        Args:
+            query (Query): Objet de requête.
+            parameters (Union[tuple, Any], optional): Liste des paramètres de la requête. Par défaut, la liste est vide.
+            fetch (str, optional): Mode de récupération du résultat (voir Fetch). Par défaut Fetch.NONE.
+            class_ (type, optional): Type des objets pour les modes Fetch.OBJECT, Fetch.OBJECTS et Fetch.VIEWS. Par défaut None.
+
+        Returns:
+            Any: Résultat de la requête selon le mode de récupération.
+        """
+        ticket = self.__prepareResult(query, parameters, fetch)
+        if not ticket is None:
+            result = self.__results.get(ticket)
+            if not result is ResultCache.MISS:
+                QueryLog.LOGGER.info('Résultat de la requête "%s" lu depuis le cache.', query)
+                return Handle.convert(fetch, *result, class_)
+        with self.borrow() as handle:
+            self.runQuery(query, parameters)
+            if ticket is None:
+                return handle.fetch(fetch, class_)
+            result = handle.fetchRows(fetch)
+            if not handle.getConnection().in_transaction:
+                self.__results.put(ticket, result)
+        return Handle.convert(fetch, *result, class_)
+    
 
     def fetchAll(self) -> List[Union[Tuple, Dict]]:
         """Récupère tous les résultats d'une requête SQL.
@@ -184,7 +279,9 @@ class Connection:
         Returns:
             List[Union[Tuple, Dict]]: Liste des résultats de la requête.
         """
-        return [ dict(zip(self.__cursor.column_names, r)) for r in self.__cursor.fetchall() ]
+        rows = self.__pending().fetch(Fetch.ALL)
+        self.__release()
+        return rows
         
         
     def fetchOne(self) -> Optional[Union[Tuple, Dict]]:
@@ -193,8 +290,9 @@ class Connection:
         Returns:
             Optional[Union[Tuple, Dict]]: Premier résultat de la requête.
         """
-        row = self.__cursor.fetchone()
-        return dict(zip(self.__cursor.column_names, row)) if not row is None else None
+        row = self.__pending().fetch(Fetch.ONE)
+        self.__release()
+        return row
     
     
     def fetchCell(self) -> Optional[Union[Tuple, Dict]]:
@@ -203,8 +301,30 @@ class Connection:
         Returns:
             Optional[Union[Tuple, Dict]]: Première cellule du premier résultat de la requête.
         """
-        row = self.__cursor.fetchone()
-        return row[0] if not row is None else None
+        cell = self.__pending().fetch(Fetch.CELL)
+        self.__release()
+        return cell
+        
+    
+    def fetchColumns(self, types : dict = None, batch : int = 10000, numpy : bool = None) -> dict:
+        """Récupère tous les résultats d'une requête SQL par colonnes typées, tableaux NumPy ou array.array (voir Columnar).
+
+        Args:
+            types (dict, optional): Type Python (int, float, bool, datetime) par nom de colonne, les autres étant déduits des valeurs. Par défaut None.
+            batch (int, optional): Nombre de lignes lues à chaque échange avec le serveur. Par défaut 10000.
+            numpy (bool, optional): Retourne des tableaux NumPy, None pour les utiliser s'ils sont installés. Par défaut None.
+
+        Returns:
+            dict: Colonne typée par nom de colonne.
+        """
+        handle = self.__pending()
+        try:
+            columns = handle.fetchColumns(types, batch, numpy)
+        except Exception as error:
+            self.__fail(handle, error)
+            raise
+        self.__release()
+        return columns
         
     
     def fetchAllObjects(self, class_ : type) -> List[object]:
@@ -216,7 +336,23 @@ class Connection:
         Returns:
             List[object]: Liste des résultats de la requête sous forme d'objet.
         """
-        return [ Converter(class_).convertWith(row) for row in self.fetchAll() ]
+        objects = self.__pending().fetch(Fetch.OBJECTS, class_)
+        self.__release()
+        return objects
+        
+        
+    def fetchAllViews(self, class_ : type) -> RowSet:
+        """Récupère tous les résultats d'une requête SQL sous forme de vues légères des objets (voir RowSet).
+
+        Args:
+            class_ (type): Type de l'objet.
+
+        Returns:
+            RowSet: Vues des résultats de la requête.
+        """
+        views = self.__pending().fetch(Fetch.VIEWS, class_)
+        self.__release()
+        return views
         
         
     def fetchOneObject(self, class_ : type) -> Optional[object]:
@@ -228,15 +364,72 @@ class Connection:
         Returns:
             Optional[object]: Premier résultat de la requête sous forme d'objet.
         """
-        row = self.fetchOne()
-        return Converter(class_).convertWith(row) if not row is None else None
+        object = self.__pending().fetch(Fetch.OBJECT, class_)
+        self.__release()
+        return object
+    
+    
+    def runStream(self, query : Query, parameters : Union[tuple, Any] = (), batch : int = 1000, class_ : type = None) -> Iterator[Union[Dict, object]]:
+        """Exécute une requête SQL et parcourt son résultat par lots sans le charger entièrement en mémoire.
+        
+        Le socket est emprunté le temps du parcours, s'il est interrompu avant la fin le socket est fermé
+        plutôt que de lire les lignes restantes.
+
+        Args:
+            query (Query): Objet de requête.
+            parameters (Union[tuple, Any], optional): Liste des paramètres de la requête. Par défaut, la liste est vide.
+            batch (int, optional): Nombre de lignes lues à chaque échange avec le serveur. Par défaut 1000.
+            class_ (type, optional): Type des objets à produire, None pour des dictionnaires. Par défaut None.
+
+        Yields:
+            Union[Dict, object]: Ligne ou objet du résultat.
+        """
+        QueryLog.LOGGER.info('Exécution en flux de la requête "%s"...', query)
+        if type(parameters) is not tuple:
+            parameters = (parameters,)
+        handle = self.__pool.borrow()
+        finished = False
+        try:
+            handle.execute(str(query), parameters, True)
+            yield from handle.iterate(batch, class_)
+            finished = True
+        finally:
+            self.__pool.release(handle, not finished)
+    
+    
+    def iterRows(self, batch : int = 1000) -> Iterator[Dict]:
+        """Parcourt par lots les résultats de la dernière requête SQL du thread courant.
+
+        Args:
+            batch (int, optional): Nombre de lignes lues à chaque échange avec le serveur. Par défaut 1000.
+
+        Yields:
+            Dict: Ligne du résultat.
+        """
+        return self.__iterate(batch, None)
+    
+    
+    def iterObjects(self, class_ : type, batch : int = 1000) -> Iterator[object]:
+        """Parcourt par lots les résultats de la dernière requête SQL du thread courant sous forme d'objet.
+
+        Args:
+            class_ (type): Type de l'objet.
+            batch (int, optional): Nombre de lignes lues à chaque échange avec le serveur. Par défaut 1000.
+
+        Yields:
+            object: Résultat de la requête sous forme d'objet.
+        """
+        return self.__iterate(batch, class_)
     
     
     def commitChanges(self) -> None:
         """Valide manuellement les modifications de la base de données.
         """
         logging.info('Validation manuelle des modifications...')
-        self.__connection.commit()
+        handle = self.__pin().getHandle()
+        if not handle is None:
+            handle.commit()
+            self.__release(commit = True)
         logging.info('Modifications validées.')
         
         
@@ -244,17 +437,21 @@ class Connection:
         """Annule manuellement les modifications de la base de données.
         """
         logging.info('Annulation manuelle des modifications...')
-        self.__connection.rollback()
+        handle = self.__pin().getHandle()
+        if not handle is None:
+            handle.rollback()
+            self.__release(commit = True)
         logging.info('Modifications annulées.')
         
         
     def closeSocket(self) -> None:
-        """Ferme le socket de connexion à la base de données.
+        """Ferme les sockets du pool de connexion à la base de données.
         """
         logging.info(f'Fermeture du socket de connexion de la base de données "{self.__configuration.getDatabase()}"...')
-        self.__cursor.close()
-        self.__connection.close()
-        self.__instances.pop(self.__configuration.getDatabase())
+        self.__release(True)
+        self.__pool.close()
+        with self.__lock:
+            self.__instances.pop(self.__configuration.getDatabase(), None)
         logging.info('Socket de connexion fermé.')
         
         
@@ -262,8 +459,8 @@ class Connection:
         """Désactive les contrôles de clés étrangères.
         """
         logging.info('Désactivation des contrôles de clés étrangères...')
-        query = Query('SET FOREIGN_KEY_CHECKS = 0')
-        self.runQuery(query)
+        self.__pool.setSession('FOREIGN_KEY_CHECKS', '0')
+        self.__applySession()
         logging.info('Contrôles de clés étrangères désactivés.')
         
         
@@ -271,6 +468,159 @@ class Connection:
         """Active les contrôles de clés étrangères.
         """
         logging.info('Activation des contrôles de clés étrangères...')
-        query = Query('SET FOREIGN_KEY_CHECKS = 1')
-        self.runQuery(query)
-        logging.info('Contrôles de clés étrangères activés.')
\ No newline at end of file
+        self.__pool.setSession('FOREIGN_KEY_CHECKS', '1')
+        self.__applySession()
+        logging.info('Contrôles de clés étrangères activés.')
+        
+        
+    def __acquire(self) -> Handle:
+        """Retourne le socket attaché au thread courant, en emprunte un au pool si besoin.
+
+        Returns:
+            Handle: Socket attaché au thread courant.
+        """
+        pin = self.__pin()
+        handle = pin.getHandle()
+        if handle is None:
+            handle = self.__pool.borrow()
+            pin.setHandle(handle)
+        return handle
+    
+    
+    def __pin(self) -> Pin:
+        """Retourne l'attache du socket du thread courant, rendue au pool à la fin du thread (voir Pin).
+
+        Returns:
+            Pin: Attache du thread courant.
+        """
+        local = self.__local
+        pin = getattr(local, 'pin', None)
+        if pin is None:
+            pin = Pin(self.__pool)
+            local.pin = pin
+        return pin
+    
+    
+    def __pending(self) -> Handle:
+        """Retourne le socket contenant le résultat en attente du thread courant.
+
+        Raises:
+            Exception: Aucune requête n'a été exécutée par le thread courant.
+
+        Returns:
+            Handle: Socket attaché au thread courant.
+        """
+        handle = self.__pin().getHandle()
+        if handle is None:
+            raise Exception('Aucune requête en attente de résultat sur ce thread !')
+        return handle
+    
+    
+    def __iterate(self, batch : int, class_ : type) -> Iterator[Union[Dict, object]]:
+        """Détache le socket du résultat en attente du thread courant et le parcourt par lots.
+
+        Args:
+            batch (int): Nombre de lignes lues à chaque échange avec le serveur.
+            class_ (type): Type des objets à produire, None pour des dictionnaires.
+
+        Returns:
+            Iterator[Union[Dict, object]]: Générateur des lignes ou objets du résultat.
+        """
+        local = self.__local
+        handle = self.__pending()
+        if getattr(local, 'depth', 0) > 0 or not self.__configuration.isAutocommit():
+            return handle.iterate(batch, class_)
+        self.__pin().setHandle(None)
+        return self.__drain(handle, batch, class_)
+    
+    
+    def __drain(self, handle : Handle, batch : int, class_ : type) -> Iterator[Union[Dict, object]]:
+        """Parcourt le résultat d'un socket détaché puis le rend au pool.
+
+        Args:
+            handle (Handle): Socket détaché.
+            batch (int): Nombre de lignes lues à chaque échange avec le serveur.
+            class_ (type): Type des objets à produire, None pour des dictionnaires.
+
+        Yields:
+            Union[Dict, object]: Ligne ou objet du résultat.
+        """
+        finished = False
+        try:
+            yield from handle.iterate(batch, class_)
+            finished = True
+        finally:
+            self.__pool.release(handle, not finished)
+    
+    
+    def __release(self, broken : bool = False, commit : bool = False) -> None:
+        """Rend au pool le socket attaché au thread courant s'il n'est plus nécessaire.
+        
+        Le socket reste attaché tant qu'un bloc borrow() est ouvert ou, hors autocommit,
+        tant que la transaction n'a pas été validée ou annulée.
+
+        Args:
+            broken (bool, optional): Indique que le socket est inutilisable. Par défaut False.
+            commit (bool, optional): Indique que la transaction vient d'être terminée. Par défaut False.
+        """
+        local = self.__local
+        pin = self.__pin()
+        handle = pin.getHandle()
+        if handle is None:
+            return
+        if not broken:
+            if getattr(local, 'depth', 0) > 0:
+                return
+            if not commit and not self.__configuration.isAutocommit():
+                return
+        pin.setHandle(None)
+        self.__pool.release(handle, broken)
+    
+    
+    def __fail(self, handle : Handle, error : Exception) -> None:
+        """Rend au pool le socket attaché au thread courant après l'échec d'une requête.
+        
+        Le socket n'est fermé que si la connexion au serveur est perdue (voir Handle.isBroken),
+        sinon son résultat non lu est abandonné et il reste attaché comme après une requête
+        réussie, la transaction en cours pouvant encore être validée ou annulée.
+
+        Args:
+            handle (Handle): Socket attaché au thread courant.
+            error (Exception): Erreur levée par la requête.
+        """
+        broken = handle.isBroken(error)
+        if not broken:
+            try:
+                handle.reset()
+            except Driver.ERRORS:
+                broken = True
+        self.__release(broken)
+    
+    
+    def __prepareResult(self, query : Query, parameters : Union[tuple, Any], fetch : str) -> Optional[tuple]:
+        """Prépare la recherche du résultat d'une requête dans le cache, hors transaction.
+
+        Args:
+            query (Query): Objet de requête.
+            parameters (Union[tuple, Any]): Liste des paramètres de la requête.
+            fetch (str): Mode de récupération du résultat.
+
+        Returns:
+            Optional[tuple]: Ticket de recherche, None si le résultat ne peut être mis en cache.
+        """
+        if self.__results is None or fetch == Fetch.NONE or not self.__configuration.isAutocommit():
+            return None
+        handle = self.__pin().getHandle()
+        if not handle is None and handle.getConnection().in_transaction:
+            return None
+        if type(parameters) is not tuple:
+            parameters = (parameters,)
+        return self.__results.prepare(str(query), parameters, fetch in (Fetch.ALL, Fetch.OBJECTS, Fetch.VIEWS))
+    
+    
+    def __applySession(self) -> None:
+        """Applique les variables de session du pool au socket attaché au thread courant.
+        """
+        handle = self.__pin().getHandle()
+        if not handle is None:
+            handle.applySession(self.__pool.getSession())
\ No newline at end of file
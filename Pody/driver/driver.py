@@ -0,0 +1,119 @@
+import sqlite3
+import threading
+from typing import Any, Callable
+
+from Pody.configuration import Configuration
+from Pody.driver.sqliteconnection import SqliteConnection
+try:
+    import mysql.connector
+except ImportError:
+    mysql = None
+
+
+
+class Driver:
+    """Choix du pilote ouvrant les connexions des sockets, selon la configuration.
+    
+    Les pilotes fournis sont mysql-connector-python, en Python pur ou avec son extension C
+    (mysql-connector-python doit alors être installé), et une base SQLite en mémoire pour
+    les tests et les mesures sans serveur. D'autres pilotes peuvent être enregistrés : la
+    connexion qu'ils retournent doit imiter celle de mysql.connector (curseurs non
+    dictionnaires, autocommit, in_transaction, unread_result, ping...).
+    """
+    
+    
+    AUTO = 'auto' # type: str # mysql-connector-python, avec l'extension C si elle est installée.
+    PURE = 'pure' # type: str # mysql-connector-python en Python pur.
+    C = 'c' # type: str # mysql-connector-python avec l'extension C, obligatoire.
+    SQLITE = 'sqlite' # type: str # Base SQLite en mémoire, partagée par les sockets d'une même base.
+    ERRORS = (sqlite3.Error,) if mysql is None else (mysql.connector.Error, sqlite3.Error) # type: tuple # Exceptions levées par les pilotes.
+    DISCONNECTS = (sqlite3.InterfaceError, sqlite3.OperationalError, sqlite3.ProgrammingError) + (() if mysql is None else (
+        mysql.connector.InterfaceError, mysql.connector.OperationalError)) # type: tuple # Exceptions pouvant signaler une connexion perdue, confirmée par un ping (voir Handle.isBroken).
+    
+    __factories = {} # type: dict[str, Callable] # Pilotes enregistrés par nom.
+    __lock = threading.Lock() # type: threading.Lock # Verrou du registre.
+    
+    
+    @classmethod
+    def register(cls, name : str, factory : Callable, errors : tuple = ()) -> None:
+        """Enregistre un pilote.
+
+        Args:
+            name (str): Le nom du pilote, à donner à la configuration.
+            factory (Callable): La fonction recevant la configuration et retournant une connexion.
+            errors (tuple, optional): Les exceptions levées par le pilote. Vide par défaut.
+        """
+        with cls.__lock:
+            cls.__factories[name] = factory
+            cls.ERRORS = cls.ERRORS + tuple(error for error in errors if not error in cls.ERRORS)
+    
+    
+    @classmethod
+    def getDrivers(cls) -> tuple:
+        """Retourne la liste des pilotes disponibles.
+
+        Returns:
+            tuple: Noms des pilotes.
+        """
+        drivers = (cls.SQLITE,) if mysql is None else (cls.AUTO, cls.PURE, cls.C, cls.SQLITE)
+        if not mysql is None and not getattr(mysql.connector, 'HAVE_CEXT', False):
+            drivers = tuple(driver for driver in drivers if driver != cls.C)
+        return drivers + tuple(cls.__factories)
+    
+    
+    @classmethod
+    def connect(cls, configuration : Configuration) -> Any:
+        """Ouvre une connexion avec le pilote de la configuration.
+
+        Args:
+            configuration (Configuration): Objet de configuration de la connexion à la base de données.
+
+        Raises:
+            Exception: Le pilote n'existe pas ou n'est pas installé.
+
+        Returns:
+            Any: Objet de connexion du pilote.
+        """
+        name = configuration.getDriver()
+        if name == cls.SQLITE:
+            return SqliteConnection(configuration)
+        if name in (cls.AUTO, cls.PURE, cls.C):
+            return cls.__connectMysql(configuration, name)
+        factory = cls.__factories.get(name)
+        if factory is None:
+            raise Exception(f'Le pilote "{name}" n\'existe pas !')
+        return factory(configuration)
+    
+    
+    @classmethod
+    def __connectMysql(cls, configuration : Configuration, name : str) -> Any:
+        """Ouvre une connexion avec mysql-connector-python.
+
+        Args:
+            configuration (Configuration): Objet de configuration de la connexion à la base de données.
+            name (str): Le pilote (AUTO, PURE ou C).
+
+        Raises:
+            Exception: mysql-connector-python ou son extension C n'est pas installé.
+
+        Returns:
+            Any: Objet de connexion.
+        """
+        if mysql is None:
+            raise Exception('Le pilote "mysql-connector-python" n\'est pas installé !')
+        arguments = {}
+        if name == cls.PURE:
+            arguments['use_pure'] = True
+        elif name == cls.C:
+            if not getattr(mysql.connector, 'HAVE_CEXT', False):
+                raise Exception('L\'extension C de "mysql-connector-python" n\'est pas installée !')
+            arguments['use_pure'] = False
+        return mysql.connector.connect(
+            host = configuration.getHost(),
+            database = configuration.getDatabase(),
+            user = configuration.getUser(),
+            password = configuration.getPassword(),
+            port = configuration.getPort(),
+            allow_local_infile = configuration.isLocalinfile(),
+            **arguments
+        )
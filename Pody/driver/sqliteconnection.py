@@ -0,0 +1,109 @@
+import sqlite3
+import threading
+
+from Pody.configuration import Configuration
+from Pody.driver.sqlitecursor import SqliteCursor
+
+
+
+class SqliteConnection:
+    """Connexion SQLite imitant celle de mysql.connector, pour les tests et les mesures sans serveur.
+    
+    Chaque base de données est une base SQLite en mémoire, partagée par toutes les
+    connexions du processus ouvertes sur le même nom, et conservée jusqu'à sa fin.
+    """
+    
+    
+    __anchors = {} # type: dict[str, sqlite3.Connection] # Connexion gardant ouverte chaque base en mémoire.
+    __lock = threading.Lock() # type: threading.Lock # Verrou des bases.
+    
+    
+    def __init__(self, configuration : Configuration) -> None:
+        """Constructeur de la classe.
+
+        Args:
+            configuration (Configuration): Objet de configuration de la connexion à la base de données.
+        """
+        database = configuration.getDatabase()
+        uri = f'file:pody-{database}?mode=memory&cache=shared'
+        with SqliteConnection.__lock:
+            if not database in SqliteConnection.__anchors:
+                SqliteConnection.__anchors[database] = sqlite3.connect(uri, uri = True, check_same_thread = False)
+        self.__database = sqlite3.connect(uri, uri = True, check_same_thread = False, isolation_level = None)
+        self.autocommit = True
+        self.unread_result = False
+    
+    
+    @property
+    def in_transaction(self) -> bool:
+        """Indique si une transaction est en cours.
+
+        Returns:
+            bool: Une transaction est en cours.
+        """
+        return self.__database.in_transaction
+    
+    
+    def getDatabase(self) -> sqlite3.Connection:
+        """Retourne la connexion SQLite.
+
+        Returns:
+            sqlite3.Connection: La connexion.
+        """
+        return self.__database
+    
+    
+    def cursor(self, dictionary : bool = False, prepared : bool = False, buffered : bool = False) -> SqliteCursor:
+        """Retourne un nouveau curseur, les lignes étant toujours des tuples.
+
+        Returns:
+            SqliteCursor: Le curseur.
+        """
+        return SqliteCursor(self)
+    
+    
+    def start_transaction(self) -> None:
+        """Démarre une transaction.
+        """
+        if not self.__database.in_transaction:
+            self.__database.execute('BEGIN')
+    
+    
+    def commit(self) -> None:
+        """Valide la transaction.
+        """
+        if self.__database.in_transaction:
+            self.__database.execute('COMMIT')
+    
+    
+    def rollback(self) -> None:
+        """Annule la transaction.
+        """
+        if self.__database.in_transaction:
+            self.__database.execute('ROLLBACK')
+        self.unread_result = False
+    
+    
+    def ping(self, reconnect : bool = False, attempts : int = 1, delay : int = 0) -> None:
+        """Vérifie la connexion.
+        """
+        self.__database.execute('SELECT 1')
+    
+    
+    def is_connected(self) -> bool:
+        """Indique si la connexion est ouverte.
+
+        Returns:
+            bool: La connexion est ouverte.
+        """
+        try:
+            self.__database.execute('SELECT 1')
+            return True
+        except sqlite3.Error:
+            return False
+    
+    
+    def close(self) -> None:
+        """Ferme la connexion.
+        """
+        self.__database.close()
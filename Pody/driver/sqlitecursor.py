@@ -0,0 +1,212 @@
+import re
+import sqlite3
+from functools import lru_cache
+from typing import Any
+
+
+
+class SqliteCursor:
+    """Curseur SQLite imitant celui de mysql.connector, les lignes étant des tuples.
+    
+    Les requêtes sont traduites à la volée pour les tournures de MySQL utilisées par Pody :
+    paramètres %s, TRUNCATE, ON DUPLICATE KEY UPDATE et variables système (@@...). Les
+    commandes SET sont ignorées et LOAD DATA est refusé comme sur un serveur qui l'interdit.
+    """
+    
+    
+    VARIABLES = { 'max_allowed_packet': 4194304, 'local_infile': 0 } # type: dict[str, int] # Valeurs des variables système lues par Pody.
+    
+    __parameter = re.compile(r'%s') # type: re.Pattern # Paramètre de MySQL.
+    __truncate = re.compile(r'^\s*TRUNCATE\s+(?:TABLE\s+)?', re.IGNORECASE) # type: re.Pattern # Vidage d'une table.
+    __duplicate = re.compile(r'\bON\s+DUPLICATE\s+KEY\s+UPDATE\b', re.IGNORECASE) # type: re.Pattern # Mise à jour des doublons.
+    __values = re.compile(r'\bVALUES\s*\(\s*`?(\w+)`?\s*\)', re.IGNORECASE) # type: re.Pattern # Valeur proposée d'une colonne en doublon.
+    __variable = re.compile(r'@@(?:(?:GLOBAL|SESSION)\.)?(\w+)', re.IGNORECASE) # type: re.Pattern # Variable système.
+    __controls = ('BEGIN', 'START', 'COMMIT', 'ROLLBACK', 'SAVEPOINT', 'RELEASE') # type: tuple # Débuts des commandes de transaction.
+    
+    
+    @staticmethod
+    @lru_cache(maxsize = 1024)
+    def translate(sql : str) -> str:
+        """Traduit une requête MySQL en requête SQLite.
+
+        Args:
+            sql (str): Requête MySQL.
+
+        Returns:
+            str: Requête SQLite.
+        """
+        sql = SqliteCursor.__parameter.sub('?', sql)
+        sql = SqliteCursor.__truncate.sub('DELETE FROM ', sql)
+        sql = SqliteCursor.__variable.sub(lambda match: str(SqliteCursor.VARIABLES.get(match.group(1).lower(), 0)), sql)
+        match = SqliteCursor.__duplicate.search(sql)
+        if not match is None:
+            update = SqliteCursor.__values.sub(r'excluded.\1', sql[match.end():])
+            sql = f'{sql[:match.start()]}ON CONFLICT DO UPDATE SET{update}'
+        return sql
+    
+    
+    def __init__(self, connection : Any) -> None:
+        """Constructeur de la classe.
+
+        Args:
+            connection (SqliteConnection): La connexion du curseur.
+        """
+        self.__connection = connection
+        self.__cursor = connection.getDatabase().cursor()
+        self.__skipped = False # type: bool # La dernière commande a été ignorée.
+    
+    
+    @property
+    def description(self) -> Any:
+        """Retourne la description des colonnes du dernier résultat.
+
+        Returns:
+            Any: La description, None si la requête n'a pas de résultat.
+        """
+        return None if self.__skipped else self.__cursor.description
+    
+    
+    @property
+    def with_rows(self) -> bool:
+        """Indique si la dernière requête a un résultat.
+
+        Returns:
+            bool: La requête a un résultat.
+        """
+        return not self.description is None
+    
+    
+    @property
+    def column_names(self) -> tuple:
+        """Retourne les noms des colonnes du dernier résultat.
+
+        Returns:
+            tuple: Noms des colonnes.
+        """
+        description = self.description
+        return () if description is None else tuple(column[0] for column in description)
+    
+    
+    @property
+    def lastrowid(self) -> Any:
+        """Retourne l'identifiant de la dernière ligne insérée.
+
+        Returns:
+            Any: L'identifiant.
+        """
+        return self.__cursor.lastrowid
+    
+    
+    @property
+    def rowcount(self) -> int:
+        """Retourne le nombre de lignes modifiées par la dernière requête.
+
+        Returns:
+            int: Nombre de lignes, -1 s'il est inconnu.
+        """
+        return self.__cursor.rowcount
+    
+    
+    def execute(self, sql : Any, parameters : tuple = ()) -> None:
+        """Exécute une requête.
+
+        Args:
+            sql (Any): La requête.
+            parameters (tuple, optional): Les paramètres. Par défaut, la liste est vide.
+
+        Raises:
+            sqlite3.Error: Erreur de la requête.
+        """
+        sql = self.__prepare(str(sql))
+        if sql is None:
+            return
+        self.__cursor.execute(sql, tuple(parameters or ()))
+        self.__connection.unread_result = not self.__cursor.description is None
+    
+    
+    def executemany(self, sql : Any, parameters : list) -> None:
+        """Exécute une requête pour chaque liste de paramètres.
+
+        Args:
+            sql (Any): La requête.
+            parameters (list): Les listes de paramètres.
+
+        Raises:
+            sqlite3.Error: Erreur de la requête.
+        """
+        sql = self.__prepare(str(sql))
+        if sql is None:
+            return
+        self.__cursor.executemany(sql, parameters)
+        self.__connection.unread_result = False
+    
+    
+    def fetchall(self) -> list:
+        """Lit les lignes restantes du résultat.
+
+        Returns:
+            list: Les lignes.
+        """
+        rows = self.__cursor.fetchall() if not self.__skipped else []
+        self.__connection.unread_result = False
+        return rows
+    
+    
+    def fetchone(self) -> Any:
+        """Lit la ligne suivante du résultat.
+
+        Returns:
+            Any: La ligne, None s'il n'y en a plus.
+        """
+        row = self.__cursor.fetchone() if not self.__skipped else None
+        if row is None:
+            self.__connection.unread_result = False
+        return row
+    
+    
+    def fetchmany(self, size : int = 1) -> list:
+        """Lit les lignes suivantes du résultat.
+
+        Args:
+            size (int, optional): Nombre de lignes. Par défaut 1.
+
+        Returns:
+            list: Les lignes.
+        """
+        rows = self.__cursor.fetchmany(size) if not self.__skipped else []
+        if len(rows) < size:
+            self.__connection.unread_result = False
+        return rows
+    
+    
+    def close(self) -> None:
+        """Ferme le curseur.
+        """
+        self.__cursor.close()
+    
+    
+    def __prepare(self, sql : str) -> Any:
+        """Traduit une requête et démarre la transaction implicite d'une connexion sans autocommit.
+
+        Args:
+            sql (str): Requête MySQL.
+
+        Raises:
+            sqlite3.OperationalError: La requête est un LOAD DATA.
+
+        Returns:
+            Any: Requête SQLite, None si la commande est ignorée.
+        """
+        upper = sql.lstrip().upper()
+        self.__skipped = upper.startswith('SET ')
+        if self.__skipped:
+            self.__connection.unread_result = False
+            return None
+        if upper.startswith('LOAD DATA'):
+            error = sqlite3.OperationalError('LOAD DATA n\'est pas disponible avec SQLite')
+            error.errno = 3948
+            raise error
+        database = self.__connection.getDatabase()
+        if not self.__connection.autocommit and not database.in_transaction and not upper.startswith(SqliteCursor.__controls):
+            database.execute('BEGIN')
+        return SqliteCursor.translate(sql)
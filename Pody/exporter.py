@@ -0,0 +1,186 @@
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from Pody.asyncconnection import AsyncConnection
+from Pody.connection import Connection
+from Pody.factory.repository.metadata import Metadata
+from Pody.statistics import Statistics
+
+
+
+class Exporter:
+    """Export des statistiques internes de Pody au format texte de Prometheus.
+    
+    Sont exportés les compteurs des pools de sockets de chaque connexion ouverte, ceux
+    des caches de résultats et des caches de modèles, ainsi que les statistiques par
+    requête normalisée et le nombre de requêtes lentes lorsqu'elles sont activées.
+    """
+    
+    
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8' # type: str # Type de contenu du format texte de Prometheus.
+    POOL_GAUGES = ('size', 'idle', 'inuse', 'min', 'max') # type: tuple # Statistiques instantanées des pools.
+    POOL_COUNTERS = ('created', 'closed', 'borrowed', 'released', 'waits', 'timeouts', 'evicted', 'expired', 'broken') # type: tuple # Compteurs des pools.
+    CACHE_GAUGES = ('length', 'size', 'weight') # type: tuple # Statistiques instantanées des caches.
+    CACHE_COUNTERS = ('hits', 'misses', 'evicted', 'expired', 'invalidated', 'stale') # type: tuple # Compteurs des caches.
+    
+    
+    @staticmethod
+    def render() -> str:
+        """Retourne les statistiques de toutes les connexions ouvertes au format texte de Prometheus.
+
+        Returns:
+            str: Les métriques.
+        """
+        families = {} # type: dict[str, tuple] # Type, description et échantillons par nom de métrique.
+        results, statistics = {}, {}
+        instances = [ ('sync', database, connection) for database, connection in Connection.getAllInstances().items() ]
+        instances += [ ('async', database, connection) for database, connection in AsyncConnection.getAllInstances().items() ]
+        for mode, database, connection in instances:
+            labels = { 'database': database, 'mode': mode }
+            stats = connection.getStats()
+            for name in Exporter.POOL_GAUGES:
+                Exporter.__add(families, f'pody_pool_{name}', 'gauge', f'Sockets du pool ({name}).', labels, stats.get(name, 0))
+            for name in Exporter.POOL_COUNTERS:
+                Exporter.__add(families, f'pody_pool_{name}_total', 'counter', f'Compteur du pool ({name}).', labels, stats.get(name, 0))
+            cache = connection.getResultCache()
+            if not cache is None:
+                results[id(cache)] = (database, cache)
+            statement = connection.getStatistics()
+            if not statement is None:
+                statistics[id(statement)] = (database, statement)
+
+        for database, cache in results.values():
+            Exporter.__addCache(families, 'pody_result_cache', { 'database': database }, cache.getStats())
+        for class_, metadata in Metadata.getAllInstances().items():
+            cache = metadata.getCache()
+            if not cache is None:
+                labels = { 'database': metadata.getDatabase(), 'model': class_.__name__ }
+                Exporter.__addCache(families, 'pody_model_cache', labels, cache.getStats())
+
+        for database, statement in statistics.values():
+            Exporter.__add(families, 'pody_slow_queries_total', 'counter', 'Requêtes lentes.', { 'database': database }, statement.getSlowCount())
+            for normalized, stats in statement.getStatements().items():
+                labels = { 'database': database, 'statement': normalized }
+                Exporter.__add(families, 'pody_queries_total', 'counter', 'Requêtes exécutées.', labels, stats['calls'])
+                Exporter.__add(families, 'pody_query_errors_total', 'counter', 'Requêtes en erreur.', labels, stats['errors'])
+                Exporter.__add(families, 'pody_query_rows_total', 'counter', 'Lignes lues.', labels, stats['rows'])
+                cumulated = 0
+                for bound, count in zip(Statistics.BOUNDS + ('+Inf',), stats['buckets']):
+                    cumulated += count
+                    Exporter.__add(families, 'pody_query_duration_seconds', 'histogram', 'Durée des requêtes en secondes.',
+                        { **labels, 'le': str(bound) }, cumulated, '_bucket')
+                Exporter.__add(families, 'pody_query_duration_seconds', 'histogram', None, labels, stats['seconds'], '_sum')
+                Exporter.__add(families, 'pody_query_duration_seconds', 'histogram', None, labels, stats['calls'], '_count')
+
+        lines = []
+        for name, (kind, description, samples) in families.items():
+            lines.append(f'# HELP {name} {description}')
+            lines.append(f'# TYPE {name} {kind}')
+            for suffix, labels, value in samples:
+                text = ','.join(f'{key}="{Exporter.escape(label)}"' for key, label in labels.items())
+                lines.append(f'{name}{suffix}{{{text}}} {Exporter.format(value)}')
+        return '\n'.join(lines) + '\n'
+    
+    
+    @staticmethod
+    def serve(port : int = 9464, host : str = '127.0.0.1') -> ThreadingHTTPServer:
+        """Démarre un serveur HTTP local exposant les métriques sur le chemin /metrics, dans un thread en arrière-plan.
+
+        Args:
+            port (int, optional): Port d'écoute, 0 pour un port libre. Par défaut 9464.
+            host (str, optional): Adresse d'écoute. Par défaut '127.0.0.1'.
+
+        Returns:
+            ThreadingHTTPServer: Le serveur, à arrêter avec shutdown().
+        """
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self) -> None:
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = Exporter.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', Exporter.CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format : str, *args) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target = server.serve_forever, name = 'Pody-exporter', daemon = True).start()
+        logging.info(f'Métriques exposées sur http://{host}:{server.server_address[1]}/metrics.')
+        return server
+    
+    
+    @staticmethod
+    def escape(label : Any) -> str:
+        """Échappe la valeur d'un label.
+
+        Args:
+            label (Any): La valeur.
+
+        Returns:
+            str: La valeur échappée.
+        """
+        return str(label).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    
+    
+    @staticmethod
+    def format(value : Any) -> str:
+        """Formate la valeur d'un échantillon.
+
+        Args:
+            value (Any): La valeur.
+
+        Returns:
+            str: La valeur formatée.
+        """
+        if value is None:
+            return 'NaN'
+        if type(value) is float:
+            return repr(value)
+        return str(int(value))
+    
+    
+    @staticmethod
+    def __addCache(families : dict, prefix : str, labels : dict, stats : dict) -> None:
+        """Ajoute les statistiques d'un cache.
+
+        Args:
+            families (dict): Les métriques.
+            prefix (str): Préfixe des noms des métriques.
+            labels (dict): Les labels du cache.
+            stats (dict): Les statistiques du cache.
+        """
+        for name in Exporter.CACHE_GAUGES:
+            Exporter.__add(families, f'{prefix}_{name}', 'gauge', f'Entrées du cache ({name}).', labels, stats.get(name, 0))
+        for name in Exporter.CACHE_COUNTERS:
+            if name in stats:
+                Exporter.__add(families, f'{prefix}_{name}_total', 'counter', f'Compteur du cache ({name}).', labels, stats[name])
+    
+    
+    @staticmethod
+    def __add(families : dict, name : str, kind : str, description : str, labels : dict, value : Any, suffix : str = '') -> None:
+        """Ajoute un échantillon à une métrique, en la déclarant si besoin.
+
+        Args:
+            families (dict): Les métriques.
+            name (str): Nom de la métrique.
+            kind (str): Type de la métrique (counter, gauge, histogram).
+            description (str): Description de la métrique.
+            labels (dict): Les labels de l'échantillon.
+            value (Any): La valeur de l'échantillon.
+            suffix (str, optional): Suffixe du nom de l'échantillon (_bucket, _sum, _count). Par défaut ''.
+        """
+        family = families.get(name)
+        if family is None:
+            family = (kind, description, [])
+            families[name] = family
+        family[2].append((suffix, labels, value))
+
@@ -0,0 +1,151 @@
+from array import array
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+
+class Columnar:
+    """Construction par lots de colonnes typées à partir des lignes brutes d'un résultat.
+    
+    Les colonnes int, float, bool et datetime (les types déduits par le Generator) sont
+    stockées dans des array.array compacts, convertis sans copie en tableaux NumPy lorsque
+    NumPy est installé. Les dates sont comptées en microsecondes depuis le 1er janvier 1970,
+    une date nulle valant NAT. Une colonne entière ou booléenne contenant une valeur nulle
+    devient flottante, la valeur nulle valant NaN. Les autres colonnes restent des listes.
+    """
+    
+    
+    INT = 'q' # type: str # Code des colonnes entières.
+    FLOAT = 'd' # type: str # Code des colonnes flottantes.
+    BOOL = 'b' # type: str # Code des colonnes booléennes.
+    DATETIME = 'M' # type: str # Code des colonnes de dates, stockées en microsecondes (q).
+    NAT = -2 ** 63 # type: int # Date nulle, lue comme NaT par NumPy.
+    
+    __epoch = datetime(1970, 1, 1) # type: datetime # Origine des dates.
+    __microsecond = timedelta(microseconds = 1) # type: timedelta # Unité des dates.
+    __types = { int: INT, float: FLOAT, Decimal: FLOAT, bool: BOOL, datetime: DATETIME, date: DATETIME } # type: dict[type, str] # Code de chaque type Python.
+    
+    
+    @staticmethod
+    def hasNumpy() -> bool:
+        """Indique si NumPy est installé.
+
+        Returns:
+            bool: NumPy est installé.
+        """
+        return not numpy is None
+    
+    
+    def __init__(self, columns : tuple, types : dict = None, numpy : bool = None) -> None:
+        """Constructeur de la classe.
+
+        Args:
+            columns (tuple): Noms des colonnes du résultat.
+            types (dict, optional): Type Python par nom de colonne, les autres étant déduits de la première valeur non nulle du premier lot. Par défaut None.
+            numpy (bool, optional): Retourne des tableaux NumPy, None pour les utiliser s'ils sont installés. Par défaut None.
+
+        Raises:
+            Exception: NumPy est demandé mais n'est pas installé.
+        """
+        if numpy and not Columnar.hasNumpy():
+            raise Exception('NumPy n\'est pas installé !')
+        types = types or {}
+        self.__columns = columns
+        self.__numpy = Columnar.hasNumpy() if numpy is None else numpy
+        self.__codes = [ Columnar.__types.get(types.get(column)) if column in types else False for column in columns ] # type: list # Code de chaque colonne, None pour une liste, False si encore inconnu.
+        self.__buffers = [ None ] * len(columns) # type: list # Tableau ou liste de chaque colonne.
+        self.__length = 0 # type: int # Nombre de lignes lues.
+    
+    
+    def getLength(self) -> int:
+        """Retourne le nombre de lignes lues.
+
+        Returns:
+            int: Nombre de lignes.
+        """
+        return self.__length
+    
+    
+    def append(self, rows : list) -> None:
+        """Ajoute un lot de lignes aux colonnes.
+
+        Args:
+            rows (list): Lignes brutes du résultat.
+        """
+        if len(rows) == 0:
+            return
+        for index, values in enumerate(zip(*rows)):
+            code = self.__codes[index]
+            if code is False:
+                code = next((Columnar.__types.get(type(value)) for value in values if not value is None), None)
+                self.__codes[index] = code
+            buffer = self.__buffers[index]
+            if code is None:
+                if buffer is None:
+                    buffer = [ None ] * self.__length
+                    self.__buffers[index] = buffer
+                buffer.extend(values)
+                continue
+            if buffer is None:
+                buffer = array(Columnar.INT if code == Columnar.DATETIME else code)
+                self.__buffers[index] = buffer
+            nulls = None in values
+            if code == Columnar.DATETIME:
+                buffer.extend(Columnar.NAT if value is None else Columnar.__microseconds(value) for value in values)
+            elif code == Columnar.FLOAT and not nulls:
+                buffer.extend(map(float, values))
+            elif code == Columnar.FLOAT:
+                buffer.extend(float('nan') if value is None else float(value) for value in values)
+            elif nulls:
+                buffer = array(Columnar.FLOAT, buffer)
+                buffer.extend(float('nan') if value is None else float(value) for value in values)
+                self.__codes[index] = Columnar.FLOAT
+                self.__buffers[index] = buffer
+            elif code == Columnar.BOOL:
+                buffer.extend(map(bool, values))
+            else:
+                buffer.extend(values)
+        self.__length += len(rows)
+    
+    
+    def getColumns(self) -> dict:
+        """Retourne les colonnes lues.
+
+        Returns:
+            dict: Tableau NumPy, array.array ou liste par nom de colonne.
+        """
+        columns = {}
+        for column, code, buffer in zip(self.__columns, self.__codes, self.__buffers):
+            if buffer is None:
+                buffer = [ None ] * self.__length if code in (None, False) else array(Columnar.INT if code == Columnar.DATETIME else code)
+            if self.__numpy and not code in (None, False):
+                if code == Columnar.DATETIME:
+                    buffer = numpy.frombuffer(buffer, numpy.int64).view('datetime64[us]')
+                else:
+                    buffer = numpy.frombuffer(buffer, { Columnar.INT: numpy.int64, Columnar.FLOAT: numpy.float64, Columnar.BOOL: numpy.bool_ }[code])
+            columns[column] = buffer
+        return columns
+    
+    
+    @staticmethod
+    def __microseconds(value : Any) -> int:
+        """Convertit une date en microsecondes depuis le 1er janvier 1970.
+
+        Args:
+            value (Any): La date, ou sa représentation ISO 8601.
+
+        Returns:
+            int: Nombre de microsecondes.
+        """
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if not isinstance(value, datetime):
+            value = datetime(value.year, value.month, value.day)
+        elif not value.tzinfo is None:
+            value = value.replace(tzinfo = None) - value.utcoffset()
+        return (value - Columnar.__epoch) // Columnar.__microsecond
@@ -0,0 +1,13 @@
+
+
+class Fetch:
+    """Enumération des modes de récupération des résultats.
+    """
+    
+    NONE = 'NONE'        # type: str # Aucun résultat
+    ALL = 'ALL'          # type: str # Toutes les lignes
+    ONE = 'ONE'          # type: str # Première ligne
+    CELL = 'CELL'        # type: str # Première cellule
+    OBJECTS = 'OBJECTS'  # type: str # Toutes les lignes sous forme d'objets
+    OBJECT = 'OBJECT'    # type: str # Première ligne sous forme d'objet
+    VIEWS = 'VIEWS'      # type: str # Toutes les lignes sous forme de vues légères des objets (voir RowSet)
@@ -0,0 +1,26 @@
+
+
+class Node:
+    """Enumération des types de noeuds d'une requête.
+    """
+    
+    RAW = 'RAW'            # type: str # Texte SQL brut
+    SELECT = 'SELECT'      # type: str # SELECT
+    FROM = 'FROM'          # type: str # FROM
+    WHERE = 'WHERE'        # type: str # WHERE
+    AND = 'AND'            # type: str # AND
+    OR = 'OR'              # type: str # OR
+    ON = 'ON'              # type: str # ON
+    JOIN = 'JOIN'          # type: str # JOIN
+    HAVING = 'HAVING'      # type: str # HAVING
+    GROUP = 'GROUP'        # type: str # GROUP BY
+    ORDER = 'ORDER'        # type: str # ORDER BY
+    LIMIT = 'LIMIT'        # type: str # LIMIT
+    INSERT = 'INSERT'      # type: str # INSERT INTO
+    VALUES = 'VALUES'      # type: str # VALUES
+    UPDATE = 'UPDATE'      # type: str # UPDATE
+    DELETE = 'DELETE'      # type: str # DELETE FROM
+    TRUNCATE = 'TRUNCATE'  # type: str # TRUNCATE TABLE
+    DROP = 'DROP'          # type: str # DROP TABLE
+    BOPEN = 'BOPEN'        # type: str # Parenthèse ouvrante
+    BCLOSE = 'BCLOSE'      # type: str # Parenthèse fermante
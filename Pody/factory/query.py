@@ -1,30 +1,137 @@
+import hashlib
+import re
+from typing import Union
+
 from Pody.factory.clause import Clause
 from Pody.factory.direction import Direction
 from Pody.factory.join import Join
+from Pody.factory.node import Node
 
 
 
 class Query:
     """Gestion des la fabrication des requêtes
+    
+    Une requête est une suite de noeuds (voir Node) que les méthodes de construction
+    complètent sur place. Le SQL n'est compilé qu'une fois, jusqu'à la modification
+    suivante. Une requête figée (voir freeze) ne peut plus être complétée, elle peut
+    donc servir de modèle partagé entre plusieurs threads avec des paramètres
+    différents : copy() en retourne une copie modifiable.
     """
     
     
-    def  __init__(self, query : str = '') -> None:
+    __literals = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|\b\d+(?:\.\d+)?\b|%s|\?") # type: re.Pattern # Littéraux et marqueurs.
+    __lists = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)') # type: re.Pattern # Listes de marqueurs.
+    __spaces = re.compile(r'\s+') # type: re.Pattern # Espaces.
+    
+    
+    def  __init__(self, query : str = '', nodes : tuple = None) -> None:
         """Constructeur de la classe.
         
         Args:
             query (str, optional): Requête. Par défaut ''.
+            nodes (tuple, optional): Noeuds de la requête, prioritaires sur le texte. Par défaut None.
         """
-        self.__query = query
+        if nodes is None:
+            nodes = ((Node.RAW, query),) if query.strip() else ()
+        self.__nodes = nodes
+        self.__frozen = False
+        self.__sql = None
+        self.__normalized = None
+        self.__fingerprint = None
     
     
     def __str__(self) -> str:
-        """Retourne la requête.
+        """Retourne la requête compilée, la compilation n'étant faite qu'une fois.
         
         Returns:
             str: La requête.
         """
-        return self.__query.strip()
+        sql = self.__sql
+        if sql is None:
+            sql = ' '.join(Query.__compile(kind, value) for kind, value in self.__nodes).strip()
+            self.__sql = sql
+        return sql
+    
+    
+    def __add__(self, other : Union['Query', str]) -> 'Query':
+        """Concatène deux requêtes.
+        
+        Args:
+            other (Union[Query, str]): Requête ou texte SQL à ajouter.
+        
+        Returns:
+            Query: Nouvelle requête.
+        """
+        if not type(other) is Query:
+            other = Query(str(other))
+        return Query(nodes = self.__nodes + other.getNodes())
+    
+    
+    def copy(self) -> 'Query':
+        """Retourne une copie modifiable de la requête, l'originale restant inchangée.
+        
+        Returns:
+            Query: Nouvelle requête.
+        """
+        return Query(nodes = self.__nodes)
+    
+    
+    def freeze(self) -> 'Query':
+        """Fige la requête, les méthodes de construction levant alors une exception au lieu de la modifier.
+        
+        Returns:
+            Query: Instance de la classe.
+        """
+        self.__frozen = True
+        return self
+    
+    
+    def isFrozen(self) -> bool:
+        """Indique si la requête est figée.
+        
+        Returns:
+            bool: True si la requête est figée.
+        """
+        return self.__frozen
+    
+    
+    def getNodes(self) -> tuple:
+        """Retourne les noeuds de la requête.
+        
+        Returns:
+            tuple: Noeuds de la requête, couples (type, valeur).
+        """
+        return self.__nodes
+    
+    
+    def getNormalized(self) -> str:
+        """Retourne la forme normalisée de la requête : littéraux et marqueurs remplacés par "?", listes de
+        marqueurs réduites et espaces uniformisés.
+        
+        Returns:
+            str: Requête normalisée.
+        """
+        normalized = self.__normalized
+        if normalized is None:
+            normalized = Query.__literals.sub('?', str(self))
+            normalized = Query.__lists.sub('(?+)', normalized)
+            normalized = Query.__spaces.sub(' ', normalized).strip().upper()
+            self.__normalized = normalized
+        return normalized
+    
+    
+    def getFingerprint(self) -> str:
+        """Retourne l'empreinte de la requête normalisée, identique pour toutes les requêtes de même forme.
+        
+        Returns:
+            str: Empreinte hexadécimale de 16 caractères.
+        """
+        fingerprint = self.__fingerprint
+        if fingerprint is None:
+            fingerprint = hashlib.sha1(self.getNormalized().encode('utf-8')).hexdigest()[:16]
+            self.__fingerprint = fingerprint
+        return fingerprint
     
     
     def select(self, columns : tuple = None) -> 'Query':
@@ -36,16 +143,7 @@ class Query:
         Returns:
             Query: Instance de la classe.
         """
-        self.__query += 'SELECT '
-        if columns is None:
-            self.__query += '* '
-        elif not type(columns) is tuple:
-            self.__query += f'{columns} '
-        else:
-            for column in columns:
-                self.__query += f'{column}, '
-            self.__query = f'{self.__query[:-2]} '
-        return self
+        return self.__append(Node.SELECT, columns)
     
     
     def from_(self, tables : tuple) -> 'Query':
@@ -57,14 +155,7 @@ class Query:
         Returns:
             Query: Instance de la classe.
         """
-        self.__query += 'FROM '
-        if not type(tables) is tuple:
-            self.__query += f'{tables} '
-        else:
-            for table in tables:
-                self.__query += f'{table}, '
-            self.__query = f'{self.__query[:-2]} '
-        return self
+        return self.__append(Node.FROM, tables)
     
     
     def where(self, column : str, value : str, type : Clause = Clause.EQUAL) -> 'Query':
@@ -78,8 +169,7 @@ class Query:
         Returns:
             Query: Instance de la classe.
         """
-        self.__query += f'WHERE {column} {type} {value} '
-        return self
+        return self.__append(Node.WHERE, (column, type, value))
     
     
     def and_(self, column : str, value : str, type : Clause = Clause.EQUAL) -> 'Query':
@@ -93,8 +183,7 @@ class Query:
         Returns:
             Query: Instance de la classe.
         """
-        self.__query += f'AND {column} {type} {value} '
-        return self
+        return self.__append(Node.AND, (column, type, value))
     
     
     def or_(self, column : str, value : str, type : Clause = Clause.EQUAL) -> 'Query':
@@ -108,8 +197,7 @@ class Query:
         Returns:
             Query: Instance de la classe.
         """
-        self.__query += f'OR {column} {type} {value} '
-        return self
+        return self.__append(Node.OR, (column, type, value))
     
     
     def on(self, column1 : str, column2 : str) -> 'Query':
@@ -122,8 +210,7 @@ class Query:
         Returns:
             Query: Instance de la classe.
         """
-        self.__query += f'ON {column1} = {column2} '
-        return self
+        return self.__append(Node.ON, (column1, column2))
     
     
     def join(self, table : str, type : Join = Join.INNER) -> 'Query':
@@ -136,8 +223,7 @@ class Query:
         Returns:
             Query: Instance de la classe.
         """
-        self.__query += f'{type} JOIN {table} '
-        return self
+        return self.__append(Node.JOIN, (table, type))
     
     
     def having(self, column : str, value : str, type : Clause = Clause.EQUAL) -> 'Query':
@@ -151,8 +237,7 @@ class Query:
         Returns:
             Query: Instance de la classe.
         """
-        self.__query += f'HAVING {column} {type} {value} '
-        return self
+        return self.__append(Node.HAVING, (column, type, value))
     
     
     def group(self, columns : tuple) -> 'Query':
@@ -164,14 +249,7 @@ class Query:
         Returns:
             Query: Instance de la classe.
         """
-        self.__query += 'GROUP BY '
-        if not type(columns) is tuple:
-            self.__query += f'{columns} '
-        else:
-            for column in columns:
-                self.__query += f'{column}, '
-            self.__query = f'{self.__query[:-2]} '
-        return self
+        return self.__append(Node.GROUP, columns)
     
     
     def order(self, columns : tuple, direction : Direction = Direction.ASC) -> 'Query':
@@ -184,16 +262,8 @@ class Query:
         Returns:
             Query: Instance de la classe.
         """
-        self.__query += 'ORDER BY '
-        if not type(columns) is tuple:
-            self.__query += f'{columns}'
-        else:
-            for column in columns:
-                self.__query += f'{column}, '
-            self.__query = self.__query[:-2]
-        self.__query += f' {direction} '
-        return self
-            
+        return self.__append(Node.ORDER, (columns, direction))
+    
     
     def limit(self, count : int, offset : int = 0) -> 'Query':
         """Ajoute la clause LIMIT à la requête.
@@ -205,8 +275,7 @@ class Query:
         Returns:
             Query: Instance de la classe.
         """
-        self.__query += f'LIMIT {offset}, {count} '
-        return self
+        return self.__append(Node.LIMIT, (count, offset))
     
     
     def insert(self, table : str, columns : tuple) -> 'Query':
@@ -219,11 +288,7 @@ class Query:
         Returns:
             Query: Instance de la classe.
         """
-        self.__query += f'INSERT INTO {table} ('
-        for column in columns:
-            self.__query += f'{column}, '
-        self.__query = f'{self.__query[:-2] }) '
-        return self
+        return self.__append(Node.INSERT, (table, tuple(columns)))
     
     
     def values(self, values : tuple) -> 'Query':
@@ -235,11 +300,7 @@ class Query:
         Returns:
             Query: Instance de la classe.
         """
-        self.__query += 'VALUES ('
-        for value in values:
-            self.__query += f'{value}, '
-        self.__query = f'{self.__query[:-2]}) '
-        return self
+        return self.__append(Node.VALUES, tuple(values))
     
     
     def update(self, table : str, columns : tuple, values : tuple) -> 'Query':
@@ -253,11 +314,7 @@ class Query:
         Returns:
             Query: Instance de la classe.
         """
-        self.__query += f'UPDATE {table} SET '
-        for i in range(len(columns)):
-            self.__query += f'{columns[i]} = {values[i]}, '
-        self.__query = f'{self.__query[:-2]} '
-        return self
+        return self.__append(Node.UPDATE, (table, tuple(columns), tuple(values)))
     
     
     def delete(self, table : str) -> 'Query':
@@ -269,8 +326,7 @@ class Query:
         Returns:
             Query: Instance de la classe.
         """
-        self.__query += f'DELETE FROM {table} '
-        return self
+        return self.__append(Node.DELETE, table)
     
     
     def truncate(self, table : str) -> 'Query':
@@ -282,8 +338,7 @@ class Query:
         Returns:
             Query: Instance de la classe.
         """
-        self.__query += f'TRUNCATE TABLE {table} '
-        return self
+        return self.__append(Node.TRUNCATE, table)
     
     
     def drop(self, table : str) -> 'Query':
@@ -295,8 +350,7 @@ class Query:
         Returns:
             Query: Instance de la classe.
         """
-        self.__query += f'DROP TABLE {table} '
-        return self
+        return self.__append(Node.DROP, table)
     
     
     def bopen(self) -> 'Query':
@@ -305,8 +359,7 @@ class Query:
         Returns:
             Query: Instance de la classe.
         """
-        self.__query += '( '
-        return self
+        return self.__append(Node.BOPEN, None)
     
     
     def bclose(self) -> 'Query':
@@ -315,5 +368,90 @@ class Query:
         Returns:
             Query: Instance de la classe.
         """
-        self.__query += ') '
-        return self
\ No newline at end of file
+        return self.__append(Node.BCLOSE, None)
+    
+    
+    def __append(self, kind : str, value : object) -> 'Query':
+        """Complète la requête d'un noeud.
+        
+        Args:
+            kind (str): Type du noeud (voir Node).
+            value (object): Valeur du noeud.
+        
+        Raises:
+            Exception: La requête est figée.
+        
+        Returns:
+            Query: Instance de la classe.
+        """
+        if self.__frozen:
+            raise Exception(f'La requête "{self}" est figée, utilisez copy() pour la compléter !')
+        self.__nodes += ((kind, value),)
+        self.__sql = None
+        self.__normalized = None
+        self.__fingerprint = None
+        return self
+    
+    
+    @staticmethod
+    def __list(values : Union[tuple, str]) -> str:
+        """Compile une liste de colonnes ou de tables.
+        
+        Args:
+            values (Union[tuple, str]): Valeur unique ou liste de valeurs.
+        
+        Returns:
+            str: Valeurs séparées par des virgules.
+        """
+        return ', '.join(str(v) for v in values) if type(values) is tuple else f'{values}'
+    
+    
+    @staticmethod
+    def __compile(kind : str, value : object) -> str:
+        """Compile un noeud en SQL.
+        
+        Args:
+            kind (str): Type du noeud (voir Node).
+            value (object): Valeur du noeud.
+        
+        Returns:
+            str: Fragment SQL du noeud.
+        """
+        if kind == Node.RAW:
+            return value.strip()
+        elif kind == Node.SELECT:
+            return 'SELECT *' if value is None else f'SELECT {Query.__list(value)}'
+        elif kind == Node.FROM:
+            return f'FROM {Query.__list(value)}'
+        elif kind in (Node.WHERE, Node.AND, Node.OR, Node.HAVING):
+            column, type, operand = value
+            return f'{kind} {column} {type} {operand}'
+        elif kind == Node.ON:
+            return f'ON {value[0]} = {value[1]}'
+        elif kind == Node.JOIN:
+            return f'{value[1]} JOIN {value[0]}'
+        elif kind == Node.GROUP:
+            return f'GROUP BY {Query.__list(value)}'
+        elif kind == Node.ORDER:
+            return f'ORDER BY {Query.__list(value[0])} {value[1]}'
+        elif kind == Node.LIMIT:
+            return f'LIMIT {value[1]}, {value[0]}'
+        elif kind == Node.INSERT:
+            return f'INSERT INTO {value[0]} ({", ".join(value[1])})'
+        elif kind == Node.VALUES:
+            return f'VALUES ({", ".join(str(v) for v in value)})'
+        elif kind == Node.UPDATE:
+            table, columns, values = value
+            return f'UPDATE {table} SET ' + ', '.join(f'{columns[i]} = {values[i]}' for i in range(len(columns)))
+        elif kind == Node.DELETE:
+            return f'DELETE FROM {value}'
+        elif kind == Node.TRUNCATE:
+            return f'TRUNCATE TABLE {value}'
+        elif kind == Node.DROP:
+            return f'DROP TABLE {value}'
+        elif kind == Node.BOPEN:
+            return '('
+        elif kind == Node.BCLOSE:
+            return ')'
+        else:
+            raise Exception(f'Type de noeud "{kind}" inconnu !')
\ No newline at end of file
@@ -0,0 +1,535 @@
+import csv
+import logging
+import os
+import tempfile
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from time import perf_counter
+from typing import Any, Callable, Iterable, Iterator, Union
+
+from Pody.driver.driver import Driver
+from Pody.factory.fetch import Fetch
+from Pody.handle import Handle
+from Pody.querylog import QueryLog
+from Pody.factory.repository.metadata import Metadata
+from Pody.factory.repository.reflection import Reflection
+from Pody.factory.repository.rowview import RowView
+
+
+
+class Bulk:
+    """Librairie des opérations de masse sur les modèles.
+    
+    Les lignes sont regroupées en requêtes multi-lignes dont la taille estimée en
+    octets reste sous la taille maximale des paquets acceptée par le serveur.
+    """
+    
+    
+    PLACEHOLDERS = 65535 # type: int # Nombre maximum de marqueurs dans une requête.
+    MARGIN = 1024 # type: int # Marge en octets réservée à l'entête des paquets.
+    DISABLED = (1148, 2068, 3948) # type: tuple # Codes d'erreur d'un chargement de fichier local refusé.
+    ESCAPED = ('\\', "'", '"', '\n', '\r', '\0', '\x1a') # type: tuple # Caractères précédés d'une barre oblique inverse par le pilote.
+    
+    
+    def __init__(self, class_ : type, handle : Handle) -> None:
+        """Constructeur de la classe.
+
+        Args:
+            class_ (type): La classe des modèles.
+            handle (Handle): Le socket sur lequel exécuter les requêtes.
+        """
+        self.__metadata = Metadata.of(class_)
+        self.__handle = handle
+        configuration = handle.getConfiguration()
+        self.__packet = min(handle.getMaxAllowedPacket(), configuration.getBulkpacket()) - Bulk.MARGIN
+    
+    
+    def inject(self, objects : Iterable[object], transaction : int = None, batch : int = None) -> dict:
+        """Insère des modèles par requêtes INSERT multi-lignes.
+
+        Args:
+            objects (Iterable[object]): Les modèles à insérer.
+            transaction (int, optional): Nombre de lignes par transaction, None pour ne pas ouvrir de transaction. Par défaut None.
+            batch (int, optional): Nombre maximum de lignes par requête, None pour ne limiter que par la taille. Par défaut None.
+
+        Returns:
+            dict: Le rapport de l'insertion (lignes, requêtes, octets, secondes, lignes par seconde).
+        """
+        metadata = self.__metadata
+        rows = (metadata.getValues(object) for object in objects)
+        return self.__insert('', rows, transaction, batch)
+    
+    
+    def upsert(self, objects : Iterable[object], columns : Union[str, tuple] = None, transaction : int = None, batch : int = None) -> dict:
+        """Insère des modèles ou met à jour ceux dont la clé existe déjà, par requêtes
+        INSERT ... ON DUPLICATE KEY UPDATE multi-lignes.
+
+        Args:
+            objects (Iterable[object]): Les modèles à insérer ou mettre à jour.
+            columns (Union[str, tuple], optional): La ou les colonnes à mettre à jour, None pour tous les champs qui ne sont pas des clés primaires. Par défaut None.
+            transaction (int, optional): Nombre de lignes par transaction, None pour ne pas ouvrir de transaction. Par défaut None.
+            batch (int, optional): Nombre maximum de lignes par requête, None pour ne limiter que par la taille. Par défaut None.
+
+        Raises:
+            Exception: Le modèle n'a ni colonne à mettre à jour ni clé primaire.
+
+        Returns:
+            dict: Le rapport de l'opération (lignes, requêtes, octets, secondes, lignes par seconde).
+        """
+        metadata = self.__metadata
+        if columns is None:
+            columns = metadata.getFields()
+        elif not type(columns) is tuple:
+            columns = (columns,)
+        columns = tuple(Reflection.parseKey(column) for column in columns)
+        if len(columns) == 0:
+            # Aucun champ à mettre à jour : les lignes existantes sont laissées intactes (k = VALUES(k)).
+            columns = metadata.getKeys()[:1]
+        if len(columns) == 0:
+            raise Exception(f'Aucune colonne à mettre à jour ni clé primaire pour le modèle "{metadata.getClass().__name__}" !')
+        suffix = ' ON DUPLICATE KEY UPDATE ' + ', '.join(f'{column} = VALUES({column})' for column in columns)
+        rows = (metadata.getValues(object) for object in objects)
+        return self.__insert(suffix, rows, transaction, batch)
+    
+    
+    def updateMany(self, objects : Iterable[object], columns : Union[str, tuple] = None, transaction : int = None, batch : int = None) -> dict:
+        """Met à jour des modèles selon leurs clés primaires par requêtes
+        UPDATE ... SET colonne = CASE ... END WHERE clé IN (...).
+
+        Args:
+            objects (Iterable[object]): Les modèles à mettre à jour, ou leurs vues (voir RowView, lues sans promotion).
+            columns (Union[str, tuple], optional): La ou les colonnes à mettre à jour, None pour tous les champs qui ne sont pas des clés primaires. Par défaut None.
+            transaction (int, optional): Nombre de lignes par transaction, None pour ne pas ouvrir de transaction. Par défaut None.
+            batch (int, optional): Nombre maximum de lignes par requête, None pour ne limiter que par la taille. Par défaut None.
+
+        Returns:
+            dict: Le rapport de l'opération (lignes, requêtes, octets, secondes, lignes par seconde).
+        """
+        metadata = self.__metadata
+        estimate = Bulk.estimate
+        if columns is None:
+            columns = metadata.getFields()
+        elif not type(columns) is tuple:
+            columns = (columns,)
+        columns = tuple(Reflection.parseKey(column) for column in columns)
+        if len(columns) == 0:
+            raise Exception(f'Aucune colonne à mettre à jour pour le modèle "{metadata.getClass().__name__}" !')
+        key, mark = self.__keyExpression()
+        attributes = metadata.getKeyAttributes() + tuple(
+            column if column in metadata.getDefaults() else f'_{column}' for column in columns)
+        count = len(metadata.getKeys())
+        when = f' WHEN {key} = {mark} THEN %s'
+        prefix = f'UPDATE {metadata.getTable()} SET '
+        fixed = len(prefix) + sum(len(f'{column} = CASE ELSE {column} END, ') for column in columns) + len(f' WHERE {key} IN ()')
+
+        def measure(row : tuple) -> int:
+            keys = sum(estimate(value) for value in row[:count])
+            values = sum(estimate(value) for value in row[count:])
+            return keys * (len(columns) + 1) + values + len(when) * len(columns) + len(mark) + 2
+
+        def build(chunk : list) -> tuple:
+            sets = []
+            parameters = []
+            for index, column in enumerate(columns, count):
+                sets.append(f'{column} = CASE{when * len(chunk)} ELSE {column} END')
+                for row in chunk:
+                    parameters.extend(row[:count])
+                    parameters.append(row[index])
+            for row in chunk:
+                parameters.extend(row[:count])
+            sql = f'{prefix}{", ".join(sets)} WHERE {key} IN ({", ".join(mark for _ in chunk)})'
+            return (sql, tuple(parameters))
+
+        rows = (tuple(getattr(object, attribute) for attribute in attributes) for object in objects)
+        marks = len(columns) * (count + 1) + count
+        statements = (
+            build(chunk) + (len(chunk), size)
+            for chunk, size in self.__chunks(rows, fixed, measure, marks, batch))
+        return self.__run(statements, transaction)
+    
+    
+    def deleteMany(self, objects : Iterable[Union[object, tuple, Any]], transaction : int = None, batch : int = None) -> dict:
+        """Supprime des modèles selon leurs clés primaires par requêtes DELETE ... WHERE clé IN (...).
+
+        Args:
+            objects (Iterable[Union[object, tuple, Any]]): Les modèles, leurs vues (voir RowView, lues sans promotion) ou les valeurs de leurs clés primaires (tuple pour les clés composées).
+            transaction (int, optional): Nombre de lignes par transaction, None pour ne pas ouvrir de transaction. Par défaut None.
+            batch (int, optional): Nombre maximum de lignes par requête, None pour ne limiter que par la taille. Par défaut None.
+
+        Returns:
+            dict: Le rapport de l'opération (lignes, requêtes, octets, secondes, lignes par seconde).
+        """
+        metadata = self.__metadata
+        estimate = Bulk.estimate
+        class_ = metadata.getClass()
+        key, mark = self.__keyExpression()
+        prefix = f'DELETE FROM {metadata.getTable()} WHERE {key} IN ('
+
+        def measure(row : tuple) -> int:
+            return sum(estimate(value) for value in row) + len(mark) + 2
+
+        rows = (
+            metadata.getKeysValues(object) if isinstance(object, (class_, RowView))
+            else object if type(object) is tuple
+            else (object,)
+            for object in objects)
+        statements = (
+            (f'{prefix}{", ".join(mark for _ in chunk)})', tuple(value for row in chunk for value in row), len(chunk), size)
+            for chunk, size in self.__chunks(rows, len(prefix) + 1, measure, len(metadata.getKeys()), batch))
+        return self.__run(statements, transaction)
+    
+    
+    def load(self, source : Union[Iterable[object], str], header : bool = False) -> dict:
+        """Charge des modèles ou un fichier CSV via LOAD DATA LOCAL INFILE.
+
+        Les modèles sont écrits dans un fichier temporaire dans l'ordre des colonnes du
+        modèle. Si le chargement de fichiers locaux est refusé par le client ou le
+        serveur, les modèles, ou les lignes du fichier CSV, sont envoyés par requêtes
+        INSERT multi-lignes.
+
+        Args:
+            source (Union[Iterable[object], str]): Les modèles à charger ou le chemin d'un fichier CSV (séparateur ",", champs entourés de '"', NULL non entouré pour les valeurs nulles).
+            header (bool, optional): Indique que la première ligne du fichier CSV est un entête à ignorer. Par défaut False.
+
+        Returns:
+            dict: Le rapport du chargement (lignes, requêtes, octets, secondes, lignes par seconde).
+        """
+        path = os.fspath(source) if isinstance(source, (str, os.PathLike)) else None
+        enabled = self.__isLocalinfile()
+        if not enabled:
+            logging.warning('Chargement de fichiers locaux désactivé, envoi par requêtes multi-lignes.')
+        if path is None:
+            # Les modèles sont conservés pour être insérés tels quels si le serveur refuse le fichier.
+            objects = source if type(source) in (list, tuple) else list(source)
+            if enabled:
+                path = self.__write(objects)
+                try:
+                    return self.__loadFile(path, False)
+                except Driver.ERRORS as error:
+                    self.__refuse(error)
+                finally:
+                    os.remove(path)
+            return self.inject(objects)
+
+        if enabled:
+            try:
+                return self.__loadFile(path, header)
+            except Driver.ERRORS as error:
+                self.__refuse(error)
+        with open(path, 'r', encoding='utf-8', newline='') as file:
+            return self.__insert('', Bulk.__read(file, header))
+    
+    
+    @staticmethod
+    def format(value : object) -> bytes:
+        """Formate une valeur pour un fichier chargé par LOAD DATA.
+
+        Args:
+            value (object): La valeur.
+
+        Returns:
+            bytes: La valeur formatée.
+        """
+        if value is None:
+            return b'NULL'
+        elif type(value) is bool:
+            return b'1' if value else b'0'
+        elif type(value) in (int, float, Decimal):
+            return str(value).encode('utf-8')
+        elif type(value) in (bytes, bytearray):
+            return b'"' + bytes(value).replace(b'"', b'""') + b'"'
+        else:
+            return b'"' + str(value).replace('"', '""').encode('utf-8') + b'"'
+    
+    
+    @staticmethod
+    def estimate(value : object) -> int:
+        """Estime la taille en octets d'une valeur une fois insérée dans le texte d'une requête.
+
+        Args:
+            value (object): La valeur.
+
+        Returns:
+            int: La taille estimée en octets.
+        """
+        if value is None or type(value) is bool:
+            return 4
+        elif type(value) is int:
+            return len(str(value))
+        elif type(value) is str:
+            # Guillemets et échappements éventuels compris.
+            return len(value.encode('utf-8')) + sum(map(value.count, Bulk.ESCAPED)) + 2
+        elif type(value) in (bytes, bytearray):
+            return 2 * len(value) + 3
+        elif type(value) in (float, Decimal):
+            return len(repr(value)) + 2
+        elif isinstance(value, (datetime, date, time, timedelta)):
+            return 28
+        else:
+            return len(str(value).encode('utf-8')) + 2
+    
+    
+    def __insert(self, suffix : str, rows : Iterator[tuple], transaction : int = None, batch : int = None) -> dict:
+        """Envoie des lignes par requêtes INSERT multi-lignes.
+
+        Args:
+            suffix (str): La fin de la requête, après les lignes.
+            rows (Iterator[tuple]): Les lignes à envoyer, dans l'ordre des colonnes du modèle.
+            transaction (int, optional): Nombre de lignes par transaction, None pour ne pas ouvrir de transaction. Par défaut None.
+            batch (int, optional): Nombre maximum de lignes par requête, None pour ne limiter que par la taille. Par défaut None.
+
+        Returns:
+            dict: Le rapport de l'opération.
+        """
+        metadata = self.__metadata
+        estimate = Bulk.estimate
+        columns = metadata.getColumns()
+        prefix = f'INSERT INTO {metadata.getTable()} ({", ".join(columns)}) VALUES '
+        mark = f'({", ".join("%s" for _ in columns)})'
+
+        def measure(row : tuple) -> int:
+            # Parenthèses, virgules et séparateur entre les lignes compris.
+            return sum(estimate(value) for value in row) + 2 * len(row) + 2
+
+        statements = (
+            (f'{prefix}{", ".join(mark for _ in chunk)}{suffix}', tuple(value for row in chunk for value in row), len(chunk), size)
+            for chunk, size in self.__chunks(rows, len(prefix) + len(suffix), measure, len(columns), batch))
+        return self.__run(statements, transaction)
+    
+    
+    def __keyExpression(self) -> tuple:
+        """Retourne l'expression des clés primaires et son marqueur, sous forme de ligne pour les clés composées.
+
+        Raises:
+            Exception: Le modèle n'a pas de clé primaire.
+
+        Returns:
+            tuple: L'expression des clés primaires et son marqueur.
+        """
+        metadata = self.__metadata
+        keys = metadata.getKeys()
+        if len(keys) == 0:
+            raise Exception(f'Le modèle "{metadata.getClass().__name__}" n\'a pas de clé primaire !')
+        elif len(keys) == 1:
+            return (keys[0], '%s')
+        else:
+            return (f'({", ".join(keys)})', f'({", ".join("%s" for _ in keys)})')
+    
+    
+    def __chunks(self, rows : Iterator[tuple], fixed : int, measure : Callable[[tuple], int], marks : int, batch : int = None) -> Iterator[tuple]:
+        """Découpe les lignes en paquets dont la requête estimée tient dans la taille maximale.
+
+        Args:
+            rows (Iterator[tuple]): Les lignes à découper.
+            fixed (int): La taille en octets de la partie de la requête indépendante des lignes.
+            measure (Callable[[tuple], int]): Fonction estimant la taille en octets occupée par une ligne dans la requête.
+            marks (int): Le nombre de marqueurs utilisés par une ligne.
+            batch (int, optional): Nombre maximum de lignes par paquet, None pour ne limiter que par la taille. Par défaut None.
+
+        Yields:
+            tuple: Paquet de lignes et taille estimée de sa requête en octets.
+        """
+        limit = max(1, Bulk.PLACEHOLDERS // max(1, marks))
+        if not batch is None:
+            limit = max(1, min(limit, batch))
+        chunk = []
+        size = fixed
+        for row in rows:
+            length = measure(row)
+            if chunk and (size + length > self.__packet or len(chunk) >= limit):
+                yield (chunk, size)
+                chunk = []
+                size = fixed
+            chunk.append(row)
+            size += length
+        if chunk:
+            yield (chunk, size)
+    
+    
+    def __run(self, statements : Iterator[tuple], transaction : int = None) -> dict:
+        """Exécute les requêtes multi-lignes d'une opération de masse.
+
+        Args:
+            statements (Iterator[tuple]): Les requêtes, avec leurs paramètres, leur nombre de lignes et leur taille estimée.
+            transaction (int, optional): Nombre de lignes par transaction, None pour ne pas ouvrir de transaction. Par défaut None.
+
+        Returns:
+            dict: Le rapport de l'opération.
+        """
+        handle = self.__handle
+        connection = handle.getConnection()
+        report = { 'rows': 0, 'statements': 0, 'bytes': 0, 'seconds': 0.0, 'rate': 0.0 }
+        pending = 0
+        start = perf_counter()
+        try:
+            for sql, parameters, count, size in statements:
+                if not transaction is None and pending == 0 and not connection.in_transaction:
+                    connection.start_transaction()
+                handle.execute(sql, parameters, False, True)
+                report['rows'] += count
+                report['statements'] += 1
+                report['bytes'] += size
+                pending += count
+                if not transaction is None and pending >= transaction:
+                    handle.commit()
+                    pending = 0
+            if not transaction is None and pending > 0:
+                handle.commit()
+        except Exception:
+            if not transaction is None and pending > 0:
+                handle.rollback()
+            raise
+        report['seconds'] = perf_counter() - start
+        report['rate'] = report['rows'] / report['seconds'] if report['seconds'] > 0 else 0.0
+        QueryLog.LOGGER.info('%d lignes envoyées en %d requêtes (%d lignes par seconde).', report['rows'], report['statements'], report['rate'])
+        return report
+    
+    
+    def __isLocalinfile(self) -> bool:
+        """Indique si le chargement de fichiers locaux est autorisé par le client et le serveur.
+
+        Returns:
+            bool: Autorisation des chargements de fichiers locaux.
+        """
+        handle = self.__handle
+        if not handle.getConfiguration().isLocalinfile():
+            return False
+        try:
+            handle.execute('SELECT @@local_infile', (), False, True)
+            return bool(int(handle.fetch(Fetch.CELL)))
+        except Driver.ERRORS + (TypeError, ValueError):
+            return False # Autorisation inconnue : envoi par requêtes multi-lignes.
+    
+    
+    @staticmethod
+    def __refuse(error : Exception) -> None:
+        """Journalise le refus d'un chargement de fichier local par le serveur.
+
+        Args:
+            error (Exception): L'erreur du chargement.
+
+        Raises:
+            error: L'erreur n'est pas un refus du chargement de fichiers locaux.
+        """
+        if not getattr(error, 'errno', None) in Bulk.DISABLED:
+            raise error
+        logging.warning(f'Chargement de fichiers locaux refusé par le serveur : {error}')
+    
+    
+    def __write(self, objects : Iterable[object]) -> str:
+        """Écrit les modèles dans un fichier temporaire au format de LOAD DATA.
+
+        Args:
+            objects (Iterable[object]): Les modèles à écrire.
+
+        Returns:
+            str: Le chemin du fichier temporaire.
+        """
+        metadata = self.__metadata
+        format = Bulk.format
+        descriptor, path = tempfile.mkstemp('.csv', 'pody-')
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                for object in objects:
+                    file.write(b','.join(format(value) for value in metadata.getValues(object)) + b'\n')
+        except BaseException:
+            os.remove(path)
+            raise
+        return path
+    
+    
+    def __loadFile(self, path : str, header : bool) -> dict:
+        """Charge un fichier via LOAD DATA LOCAL INFILE.
+
+        Args:
+            path (str): Le chemin du fichier.
+            header (bool): Indique que la première ligne du fichier est un entête à ignorer.
+
+        Returns:
+            dict: Le rapport du chargement.
+        """
+        metadata = self.__metadata
+        handle = self.__handle
+        name = os.path.abspath(path).replace('\\', '\\\\').replace("'", "\\'")
+        columns = ', '.join(metadata.getColumns())
+        ignore = ' IGNORE 1 LINES' if header else ''
+        sql = (f"LOAD DATA LOCAL INFILE '{name}' INTO TABLE {metadata.getTable()} CHARACTER SET utf8mb4 "
+            f"FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+            f"LINES TERMINATED BY '\\n'{ignore} ({columns})")
+        start = perf_counter()
+        handle.execute(sql, (), False, True)
+        rows = handle.getCursor().rowcount
+        seconds = perf_counter() - start
+        report = {
+            'rows': rows,
+            'statements': 1,
+            'bytes': os.path.getsize(path),
+            'seconds': seconds,
+            'rate': rows / seconds if seconds > 0 else 0.0
+        }
+        QueryLog.LOGGER.info('%d lignes chargées depuis un fichier local (%d lignes par seconde).', rows, report['rate'])
+        return report
+    
+    
+    @staticmethod
+    def __read(file : object, header : bool) -> Iterator[tuple]:
+        """Lit les lignes d'un fichier au format de LOAD DATA.
+
+        Seul un NULL non entouré de guillemets est une valeur nulle, comme pour LOAD DATA :
+        le texte brut des lignes contenant "NULL" est relu pour distinguer la chaîne "NULL".
+
+        Args:
+            file (object): Le fichier ouvert en lecture.
+            header (bool): Indique que la première ligne du fichier est un entête à ignorer.
+
+        Yields:
+            tuple: Ligne du fichier, NULL non entouré étant converti en None.
+        """
+        lines = []
+        def source() -> Iterator[str]:
+            for line in file:
+                lines.append(line)
+                yield line
+        reader = csv.reader(source())
+        if header:
+            next(reader, None)
+        for row in reader:
+            if 'NULL' in row:
+                quoted = Bulk.__quoted(''.join(lines))
+                row = [ None if value == 'NULL' and not quoted[index] else value for index, value in enumerate(row) ]
+            lines.clear()
+            yield tuple(row)
+    
+    
+    @staticmethod
+    def __quoted(text : str) -> list:
+        """Indique pour chaque champ d'une ligne au format de LOAD DATA s'il est entouré de guillemets.
+
+        Args:
+            text (str): Le texte brut de la ligne.
+
+        Returns:
+            list: True pour chaque champ entouré, False sinon.
+        """
+        quoted = []
+        current = False # Le champ courant est entouré.
+        start = True # Début du champ courant.
+        inside = False # Entre les guillemets du champ courant.
+        closed = False # Juste après un guillemet fermant, un second guillemet étant échappé.
+        for char in text:
+            if inside:
+                if char == '"':
+                    inside = False
+                    closed = True
+                continue
+            if char == '"' and (start or closed):
+                current = inside = True
+            elif char == ',':
+                quoted.append(current)
+                current = False
+                start = True
+                closed = False
+                continue
+            start = closed = False
+        quoted.append(current)
+        return quoted
@@ -1,4 +1,10 @@
+import keyword
 import logging
+import threading
+from typing import Callable, Iterable, List
+
+from Pody.factory.repository.metadata import Metadata
+from Pody.factory.repository.tracker import Tracker
 
 
 
@@ -7,15 +13,21 @@ class Converter:
     """
     
     
-    def __init__(self, class_ : type) -> None:
+    __compiled = {} # type: dict[tuple, Callable] # Fonctions de construction compilées par classe de modèle et noms de colonnes.
+    __lock = threading.Lock() # type: threading.Lock # Verrou des correspondances compilées.
+    
+    
+    def __init__(self, class_ : type, columns : tuple = None) -> None:
         """Constructeur de la classe.
 
         Args:
             class_ (type): Le modèle à convertir.
+            columns (tuple, optional): Les noms des colonnes des lignes à convertir, dans l'ordre du curseur. Par défaut None.
         """
         self.__model = class_
-        
-        
+        self.__mapping = None if columns is None else self.__compile(tuple(columns))
+    
+    
     def convertWith(self, data : dict) -> object:
         """Convertit les données vers le modèle.
 
@@ -25,12 +37,152 @@ class Converter:
         Returns:
             object: Le modèle converti.
         """
-        newmodel = self.__model()
-        for key, value in data.items():
-            if hasattr(newmodel, key):
-                setattr(newmodel, key, value)
-            elif hasattr(newmodel, f'_{key}'):
-                setattr(newmodel, f'_{key}', value)
-            else:
-                logging.warning(f'La propriété "{key}" n\'existe pas dans le modèle "{self.__model.__class__.__name__}".')
-        return newmodel
\ No newline at end of file
+        return self.__compile(tuple(data))(tuple(data.values()))
+    
+    
+    def convertRow(self, row : tuple) -> object:
+        """Convertit une ligne brute du curseur vers le modèle.
+
+        Args:
+            row (tuple): La ligne à convertir, dans l'ordre des colonnes données au constructeur.
+
+        Returns:
+            object: Le modèle converti.
+        """
+        return self.__mapping(row)
+    
+    
+    def convertRows(self, rows : Iterable[tuple]) -> List[object]:
+        """Convertit des lignes brutes du curseur vers le modèle.
+
+        Args:
+            rows (Iterable[tuple]): Les lignes à convertir, dans l'ordre des colonnes données au constructeur.
+
+        Returns:
+            List[object]: Les modèles convertis.
+        """
+        build = self.__mapping
+        return [ build(row) for row in rows ]
+    
+    
+    def __compile(self, columns : tuple) -> Callable[[tuple], object]:
+        """Compile la correspondance entre les colonnes et les attributs du modèle.
+
+        Args:
+            columns (tuple): Les noms des colonnes.
+
+        Returns:
+            Callable[[tuple], object]: Fonction construisant un modèle depuis une ligne brute.
+        """
+        key = (self.__model, columns)
+        build = self.__compiled.get(key)
+        if build is None:
+            metadata = Metadata.of(self.__model)
+            known = metadata.getDefaults()
+            attributes = []
+            indexes = []
+            for index, column in enumerate(columns):
+                if column in known:
+                    attributes.append(column)
+                    indexes.append(index)
+                elif f'_{column}' in known:
+                    attributes.append(f'_{column}')
+                    indexes.append(index)
+                else:
+                    logging.warning(f'La propriété "{column}" n\'existe pas dans le modèle "{self.__model.__name__}".')
+            build = self.__generate(
+                tuple(attributes),
+                None if len(indexes) == len(columns) else tuple(indexes),
+                set(attributes) == set(known))
+            with self.__lock:
+                self.__compiled[key] = build
+        return build
+    
+    
+    def __generate(self, attributes : tuple, indexes : tuple, complete : bool) -> Callable[[tuple], object]:
+        """Génère la fonction construisant un modèle sans passer par son constructeur.
+
+        Args:
+            attributes (tuple): Les attributs à renseigner, dans l'ordre des valeurs.
+            indexes (tuple): Les positions des valeurs dans la ligne, None si toutes les colonnes sont utilisées.
+            complete (bool): Indique que les attributs couvrent tous les attributs du modèle.
+
+        Returns:
+            Callable[[tuple], object]: Fonction construisant un modèle depuis une ligne brute.
+        """
+        class_ = self.__model
+        new = class_.__new__
+        metadata = Metadata.of(class_)
+        defaults = metadata.getDefaults()
+        tracked = Tracker.isTrackable(class_)
+
+        if metadata.isSlotted():
+            missing = () if complete else tuple(attribute for attribute in defaults if not attribute in attributes)
+            if all(not keyword.iskeyword(attribute) for attribute in attributes + missing):
+                return self.__unroll(attributes, indexes, missing, tracked)
+            setters = tuple(getattr(class_, attribute).__set__ for attribute in attributes)
+            fills = tuple((getattr(class_, attribute).__set__, defaults[attribute]) for attribute in missing)
+            def build(row : tuple) -> object:
+                if not indexes is None:
+                    row = tuple(row[i] for i in indexes)
+                newmodel = new(class_)
+                for setter, value in fills:
+                    setter(newmodel, value)
+                for setter, value in zip(setters, row):
+                    setter(newmodel, value)
+                if tracked: newmodel.__pody__ = (attributes, row)
+                return newmodel
+        elif complete and indexes is None:
+            def build(row : tuple) -> object:
+                newmodel = new(class_)
+                newmodel.__dict__ = dict(zip(attributes, row))
+                if tracked: newmodel.__pody__ = (attributes, row)
+                return newmodel
+        else:
+            def build(row : tuple) -> object:
+                if not indexes is None:
+                    row = tuple(row[i] for i in indexes)
+                values = dict(defaults)
+                values.update(zip(attributes, row))
+                newmodel = new(class_)
+                newmodel.__dict__ = values
+                if tracked: newmodel.__pody__ = (attributes, row)
+                return newmodel
+
+        return build
+    
+    
+    def __unroll(self, attributes : tuple, indexes : tuple, missing : tuple, tracked : bool) -> Callable[[tuple], object]:
+        """Génère le code de la fonction construisant un modèle à __slots__, une affectation par attribut.
+
+        Les descripteurs des __slots__ étant bien plus rapides en affectation directe
+        (newmodel.a, newmodel.b = row) qu'appelés un à un, la fonction est écrite puis compilée.
+
+        Args:
+            attributes (tuple): Les attributs à renseigner, dans l'ordre des valeurs.
+            indexes (tuple): Les positions des valeurs dans la ligne, None si toutes les colonnes sont utilisées.
+            missing (tuple): Les attributs absents des valeurs, renseignés avec leur valeur par défaut.
+            tracked (bool): Mémorise les valeurs chargées (voir Tracker).
+
+        Returns:
+            Callable[[tuple], object]: Fonction construisant un modèle depuis une ligne brute.
+        """
+        lines = [ 'def build(row):' ]
+        if not indexes is None:
+            lines.append(f'    row = ({"".join(f"row[{index}], " for index in indexes)})')
+        lines.append('    newmodel = new(class_)')
+        if len(attributes) > 0:
+            lines.append(f'    {"".join(f"newmodel.{attribute}, " for attribute in attributes)}= row')
+        for attribute in missing:
+            lines.append(f'    newmodel.{attribute} = defaults[{attribute!r}]')
+        if tracked:
+            lines.append('    newmodel.__pody__ = (attributes, row)')
+        lines.append('    return newmodel')
+        namespace = {
+            'new': self.__model.__new__,
+            'class_': self.__model,
+            'defaults': Metadata.of(self.__model).getDefaults(),
+            'attributes': attributes
+        }
+        exec('\n'.join(lines), namespace)
+        return namespace['build']
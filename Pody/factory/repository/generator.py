@@ -20,11 +20,15 @@ class Generator:
         self.__connection = connection
         
         
-    def generateModels(self, tables : Union[str, tuple] = None) -> None:
+    def generateModels(self, tables : Union[str, tuple] = None, slots : bool = False) -> None:
         """Génère un modèle à partir d'une table.
         
+        Les modèles à __slots__ n'ont pas de dictionnaire par instance : ils déclarent leurs
+        attributs dans __slots__ et dans le manifeste lu par Reflection (voir Reflection.MANIFEST).
+        
         Args:
             tables (Union[str, tuple]): Le nom de la table ou les tables. Si None, toutes les tables seront générées.
+            slots (bool, optional): Génère des modèles à __slots__. Par défaut False.
         """
         configuration = self.__connection.getConfiguration()
         database = configuration.getDatabase().lower()
@@ -67,6 +71,7 @@ class Generator:
                     parameters = []
                     attributes = []
                     docstring = []
+                    fields = []
                     for column in columns:          
                         field = column['Field'].lower()
                         type_ = column['Type'].split('(')[0].lower()
@@ -106,6 +111,7 @@ class Generator:
                         elif type_ == 'time':
                             default = f'datetime.time({default.hour}, {default.minute}, {default.second})'
                         
+                        fields.append(f"'{field}'")
                         parameters.append(f',\n        {field} : {type_} = {default}')
                         attributes.append(f'\n        self.{field} = {field}')
                         docstring.append(f'\n            {field} ({type_}, optional): Le champs "{field}". Par défaut {default}.')
@@ -116,6 +122,13 @@ class Generator:
                     attributes = ''.join(attributes)
                     docstring = ''.join(docstring)
                     
+                    if slots:
+                        fields = ', '.join(fields) + (',' if len(fields) == 1 else '')
+                        file.write(f'    __slots__ = ({fields}) # type: tuple # Attributs du modèle, sans dictionnaire par instance.\n')
+                        file.write(f'    __attributes__ = __slots__ # type: tuple # Manifeste des attributs lu par Pody.\n')
+                        file.write('\n')
+                        file.write('\n')
+                    
                     file.write(f'    def __init__(self{parameters}):\n')
                     file.write(f'        """Constructeur de la classe.\n')
                     file.write('\n')
@@ -0,0 +1,430 @@
+import threading
+from typing import Union
+
+from Pody.cache import Cache
+from Pody.factory.clause import Clause
+from Pody.factory.direction import Direction
+from Pody.factory.query import Query
+from Pody.factory.statement import Statement
+from Pody.factory.repository.reflection import Reflection
+
+
+
+class Metadata:
+    """Métadonnées d'une classe de modèle, calculées une seule fois et partagées par toutes ses instances.
+    """
+    
+    
+    __registry = {} # type: dict[type, Metadata] # Métadonnées par classe de modèle.
+    __lock = threading.Lock() # type: threading.Lock # Verrou du registre.
+    
+    
+    @classmethod
+    def of(cls, class_ : type) -> 'Metadata':
+        """Retourne les métadonnées d'une classe de modèle, en les construisant à la première demande.
+
+        Args:
+            class_ (type): Classe du modèle.
+
+        Returns:
+            Metadata: Métadonnées de la classe.
+        """
+        metadata = cls.__registry.get(class_)
+        if metadata is None:
+            with cls.__lock:
+                metadata = cls.__registry.get(class_)
+                if metadata is None:
+                    metadata = Metadata(class_)
+                    cls.__registry[class_] = metadata
+        return metadata
+    
+    
+    @classmethod
+    def getAllInstances(cls) -> 'dict[type, Metadata]':
+        """Retourne les métadonnées déjà construites.
+
+        Returns:
+            dict[type, Metadata]: Métadonnées par classe de modèle.
+        """
+        with cls.__lock:
+            return dict(cls.__registry)
+    
+    
+    def __init__(self, class_ : type) -> None:
+        """Constructeur de la classe.
+
+        Args:
+            class_ (type): Classe du modèle.
+        """
+        model = class_()
+        reflection = Reflection(model)
+        self.__class = class_
+        self.__database = reflection.getDatabase()
+        self.__table = reflection.getTable()
+        self.__attributes = reflection.getAttributes()
+        self.__defaults = { attribute: getattr(model, attribute) for attribute in self.__attributes }
+        self.__slotted = not hasattr(model, '__dict__') # type: bool # Les instances n'ont pas de dictionnaire (voir Reflection.MANIFEST).
+        self.__columns = reflection.getColumns()
+        self.__keys = reflection.getKeys()
+        self.__keyAttributes = tuple(attribute for attribute in self.__attributes if attribute[0] == '_')
+        self.__fields = reflection.getFields()
+        hints = getattr(class_.__init__, '__annotations__', {})
+        self.__types = { Reflection.parseKey(attribute): hints[attribute] for attribute in self.__attributes if isinstance(hints.get(attribute), type) } # type: dict[str, type] # Types annotés par nom de colonne.
+        self.__clauses = {} # type: dict[tuple, tuple] # Clauses WHERE compilées.
+        self.__statements = {} # type: dict[tuple, Query] # Requêtes compilées.
+        self.__cache = None # type: Cache # Cache des modèles lus par clés primaires.
+        marks = Reflection.generateMark(self.__columns)
+        self.__bases = {
+            Statement.ALL: Query().select(self.__columns).from_(self.__table),
+            Statement.SIZE: Query().select('COUNT(1)').from_(self.__table),
+            Statement.TRUNCATE: Query().truncate(self.__table),
+            Statement.INSERT: Query().insert(self.__table, self.__columns).values(marks),
+            Statement.SELECT: Query().select(self.__columns).from_(self.__table),
+            Statement.EXISTS: Query().select('1').from_(self.__table),
+            Statement.COUNT: Query().select('COUNT(1)').from_(self.__table),
+            Statement.UPDATE: Query().update(self.__table, self.__columns, marks),
+            Statement.DELETE: Query().delete(self.__table)
+        } # type: dict[str, Query] # Requêtes de base par type.
+        for base in self.__bases.values():
+            base.freeze() # Partagées par tous les appels, donc jamais modifiées sur place.
+    
+    
+    def getClass(self) -> type:
+        """Retourne la classe du modèle.
+
+        Returns:
+            type: Classe du modèle.
+        """
+        return self.__class
+    
+    
+    def getDatabase(self) -> str:
+        """Retourne le nom de la base de données liée au modèle.
+
+        Returns:
+            str: Nom de la base de données.
+        """
+        return self.__database
+    
+    
+    def getTable(self) -> str:
+        """Retourne le nom de la table liée au modèle.
+
+        Returns:
+            str: Nom de la table.
+        """
+        return self.__table
+    
+    
+    def getAttributes(self) -> tuple:
+        """Retourne les noms des attributs du modèle, clés primaires préfixées par "_".
+
+        Returns:
+            tuple: Noms des attributs.
+        """
+        return self.__attributes
+    
+    
+    def isSlotted(self) -> bool:
+        """Indique si les instances du modèle n'ont pas de dictionnaire, leurs attributs étant déclarés par __slots__.
+
+        Returns:
+            bool: Le modèle est à __slots__.
+        """
+        return self.__slotted
+    
+    
+    def getDefaults(self) -> dict:
+        """Retourne les valeurs par défaut des attributs du modèle.
+
+        Returns:
+            dict: Valeurs par défaut par nom d'attribut.
+        """
+        return self.__defaults
+    
+    
+    def getColumns(self) -> tuple:
+        """Retourne les noms des colonnes liées au modèle.
+
+        Returns:
+            tuple: Noms des colonnes.
+        """
+        return self.__columns
+    
+    
+    def getKeys(self) -> tuple:
+        """Retourne les noms des colonnes des clés primaires.
+
+        Returns:
+            tuple: Noms des colonnes des clés primaires.
+        """
+        return self.__keys
+    
+    
+    def getKeyAttributes(self) -> tuple:
+        """Retourne les noms des attributs des clés primaires.
+
+        Returns:
+            tuple: Noms des attributs des clés primaires.
+        """
+        return self.__keyAttributes
+    
+    
+    def getFields(self) -> tuple:
+        """Retourne les noms des champs qui ne sont pas des clés primaires.
+
+        Returns:
+            tuple: Noms des champs.
+        """
+        return self.__fields
+    
+    
+    def getTypes(self) -> dict:
+        """Retourne les types annotés du constructeur du modèle (ceux écrits par le Generator).
+
+        Returns:
+            dict: Type Python par nom de colonne.
+        """
+        return self.__types
+    
+    
+    def getCache(self) -> Cache:
+        """Retourne le cache des modèles lus par clés primaires.
+
+        Returns:
+            Cache: Cache des modèles, None s'il est désactivé.
+        """
+        return self.__cache
+    
+    
+    def setCache(self, cache : Cache) -> None:
+        """Définit le cache des modèles lus par clés primaires.
+
+        Args:
+            cache (Cache): Cache des modèles, None pour le désactiver.
+        """
+        self.__cache = cache
+    
+    
+    def getValues(self, model : object) -> tuple:
+        """Retourne les valeurs des attributs d'un modèle dans l'ordre des colonnes.
+
+        Args:
+            model (object): Modèle à lire.
+
+        Returns:
+            tuple: Valeurs des attributs.
+        """
+        return tuple(getattr(model, attribute) for attribute in self.__attributes)
+    
+    
+    def toDict(self, model : object) -> dict:
+        """Retourne les valeurs des attributs d'un modèle.
+
+        Args:
+            model (object): Le modèle.
+
+        Returns:
+            dict: Valeur par nom d'attribut.
+        """
+        return dict(zip(self.__attributes, self.getValues(model)))
+    
+    
+    def getKeysValues(self, model : object) -> tuple:
+        """Retourne les valeurs des clés primaires d'un modèle.
+
+        Args:
+            model (object): Modèle à lire.
+
+        Returns:
+            tuple: Valeurs des clés primaires.
+        """
+        return tuple(getattr(model, attribute) for attribute in self.__keyAttributes)
+    
+    
+    def getStatement(self, kind : str, column : Union[str, tuple] = None, clause : Union[Clause, tuple] = Clause.EQUAL) -> Query:
+        """Retourne une requête précompilée du modèle.
+
+        Args:
+            kind (str): Type de la requête (voir Statement).
+            column (Union[str, tuple], optional): La ou les colonnes de la clause WHERE, None pour les clés primaires. Par défaut None.
+            clause (Union[Clause, tuple], optional): Le ou les types de clause. Par défaut Clause.EQUAL.
+
+        Returns:
+            Query: Requête compilée.
+        """
+        key = (kind, column, clause)
+        statement = self.__statements.get(key)
+        if statement is None:
+            statement = self.__bases[kind]
+            if not kind in (Statement.ALL, Statement.SIZE, Statement.TRUNCATE, Statement.INSERT):
+                where, _ = self.getClause(column, clause)
+                statement = statement + where
+            str(statement.freeze()) # Compilation anticipée du SQL partagé par tous les appels.
+            self.__statements[key] = statement
+        return statement
+    
+    
+    def getUpdate(self, attributes : tuple, column : Union[str, tuple] = None, clause : Union[Clause, tuple] = Clause.EQUAL) -> Query:
+        """Retourne une requête de mise à jour précompilée limitée à certains attributs.
+
+        Args:
+            attributes (tuple): Les noms des attributs à mettre à jour.
+            column (Union[str, tuple], optional): La ou les colonnes de la clause WHERE, None pour les clés primaires. Par défaut None.
+            clause (Union[Clause, tuple], optional): Le ou les types de clause. Par défaut Clause.EQUAL.
+
+        Returns:
+            Query: Requête compilée.
+        """
+        key = (Statement.UPDATE, attributes, column, clause)
+        statement = self.__statements.get(key)
+        if statement is None:
+            columns = tuple(Reflection.parseKey(attribute) for attribute in attributes)
+            where, _ = self.getClause(column, clause)
+            statement = Query().update(self.__table, columns, Reflection.generateMark(columns)) + where
+            str(statement.freeze())
+            self.__statements[key] = statement
+        return statement
+    
+    
+    def getPage(self, order : tuple, direction : Direction, size : int, nulls : tuple = None) -> tuple:
+        """Retourne une requête précompilée de lecture d'une page, paginée par clé (keyset) plutôt que par décalage.
+
+        La page suivante est lue après les valeurs des colonnes de tri de la dernière ligne
+        lue, son coût restant constant quelle que soit sa profondeur. Pour plusieurs colonnes,
+        la condition "c1 >= ? AND (c1 > ? OR (c1 = ? AND c2 > ?) ...)" permet au serveur de
+        parcourir l'index des colonnes de tri.
+        
+        Les valeurs nulles étant triées en premier par ASC et en dernier par DESC (MySQL et
+        SQLite), la condition d'une colonne dépend de la nullité de sa valeur dans la dernière
+        ligne lue ("c1 IS NULL AND c2 > ? OR c1 IS NOT NULL" par exemple) : une requête est
+        précompilée pour chaque combinaison rencontrée. Les clés primaires ne sont jamais nulles.
+
+        Args:
+            order (tuple): Les colonnes de tri, formant une clé unique.
+            direction (Direction): La direction du tri.
+            size (int): Le nombre de lignes de la page.
+            nulls (tuple, optional): Pour chaque colonne de tri, indique si sa valeur est nulle dans la dernière ligne lue, None pour la première page. Par défaut None.
+
+        Returns:
+            tuple: La requête compilée, et les positions des colonnes de tri fournissant chaque paramètre.
+        """
+        key = (Statement.PAGE, order, direction, size, nulls)
+        compiled = self.__statements.get(key)
+        if compiled is None:
+            statement = self.__bases[Statement.ALL]
+            positions = ()
+            if not nulls is None:
+                ascending = direction == Direction.ASC
+                keys = self.__keys
+                terms = []
+                for index, column in enumerate(order):
+                    if nulls[index] and not ascending:
+                        continue # Aucune valeur après NULL, trié en dernier.
+                    equals = []
+                    for previous in range(index):
+                        if nulls[previous]:
+                            equals.append(f'{order[previous]} IS NULL')
+                        else:
+                            equals.append(f'{order[previous]} = %s')
+                            positions += (previous,)
+                    if nulls[index]:
+                        equals.append(f'{column} IS NOT NULL')
+                    else:
+                        equals.append(Metadata.__after(column, ascending, '', column in keys))
+                        positions += (index,)
+                    terms.append(' AND '.join(equals))
+                if len(terms) == 1:
+                    statement = statement + f'WHERE {terms[0]}'
+                elif nulls[0]:
+                    statement = statement + f'WHERE {" OR ".join(f"({term})" for term in terms)}'
+                else:
+                    first = Metadata.__after(order[0], ascending, '=', order[0] in keys)
+                    statement = statement + f'WHERE {first} AND ({" OR ".join(f"({term})" for term in terms)})'
+                    positions = (0,) + positions
+            columns = tuple(f'{column} {direction}' for column in order[:-1]) + order[-1:] # La direction de ORDER BY ne porte que sur la dernière colonne.
+            statement = statement.copy().order(columns, direction).limit(size)
+            str(statement.freeze()) # Compilation anticipée du SQL partagé par toutes les pages.
+            compiled = (statement, positions)
+            self.__statements[key] = compiled
+        return compiled
+    
+    
+    @staticmethod
+    def __after(column : str, ascending : bool, equal : str, key : bool) -> str:
+        """Retourne la condition d'une colonne de tri suivant une valeur non nulle.
+
+        Args:
+            column (str): La colonne.
+            ascending (bool): Le tri est croissant, les valeurs nulles étant alors avant.
+            equal (str): "=" pour inclure la valeur elle-même, vide sinon.
+            key (bool): La colonne est une clé primaire, jamais nulle.
+
+        Returns:
+            str: La condition, avec un paramètre.
+        """
+        if ascending:
+            return f'{column} >{equal} %s'
+        elif key:
+            return f'{column} <{equal} %s'
+        return f'({column} <{equal} %s OR {column} IS NULL)'
+    
+    
+    def getClause(self, column : Union[str, tuple] = None, clause : Union[Clause, tuple] = Clause.EQUAL) -> tuple:
+        """Retourne la clause WHERE compilée et les attributs fournissant ses valeurs.
+
+        Args:
+            column (Union[str, tuple], optional): La ou les colonnes, None pour les clés primaires. Par défaut None.
+            clause (Union[Clause, tuple], optional): Le ou les types de clause. Par défaut Clause.EQUAL.
+
+        Returns:
+            tuple: La clause WHERE (Query) et les noms des attributs.
+        """
+        key = (column, clause)
+        compiled = self.__clauses.get(key)
+        if compiled is None:
+            compiled = self.__compileClause(column, clause)
+            self.__clauses[key] = compiled
+        return compiled
+    
+    
+    def __compileClause(self, column : Union[str, tuple], clause : Union[Clause, tuple]) -> tuple:
+        """Construit la clause WHERE.
+
+        Args:
+            column (Union[str, tuple]): La ou les colonnes, None pour les clés primaires.
+            clause (Union[Clause, tuple]): Le ou les types de clause.
+
+        Returns:
+            tuple: La clause WHERE et les noms des attributs.
+        """
+        query = Query()
+        if column is None:
+            column = self.__keys
+            attributes = self.__keyAttributes
+        elif not type(column) is tuple:
+            attributes = (column,)
+            column = Reflection.parseKey(column)
+        else:
+            attributes = column
+            column = tuple(Reflection.parseKey(c) for c in column)
+
+        if type(column) is tuple and type(clause) is tuple:
+            for i in range(len(column)):
+                if i == 0: query = query.where(column[i], '%s', clause[i])
+                else: query = query.and_(column[i], '%s', clause[i])
+
+        elif type(column) is tuple:
+            for i in range(len(column)):
+                if i == 0: query = query.where(column[i], '%s', clause)
+                else: query = query.and_(column[i], '%s', clause)
+
+        elif type(clause) is tuple:
+            for i in range(len(clause)):
+                if i == 0: query = query.where(column, '%s', clause[i])
+                else: query = query.and_(column, '%s', clause[i])
+
+        else:
+            query = query.where(column, '%s', clause)
+
+        return (query.freeze(), attributes)
@@ -1,11 +1,24 @@
+import copy
 import json
 import logging
-from typing import Union
+from typing import Any, AsyncIterator, Iterator, Optional, Union
 
+from Pody.asyncconnection import AsyncConnection
+from Pody.cache import Cache
 from Pody.connection import Connection
 from Pody.factory.clause import Clause
+from Pody.factory.direction import Direction
+from Pody.factory.fetch import Fetch
 from Pody.factory.query import Query
+from Pody.factory.statement import Statement
+from Pody.handle import Handle
+from Pody.querylog import QueryLog
+from Pody.factory.repository.bulk import Bulk
+from Pody.factory.repository.converter import Converter
+from Pody.factory.repository.metadata import Metadata
 from Pody.factory.repository.reflection import Reflection
+from Pody.factory.repository.rowset import RowSet
+from Pody.factory.repository.tracker import Tracker
 
 
 
@@ -14,6 +27,44 @@ class Model:
     """
     
     
+    __slots__ = ('__pody__',) # type: tuple # Emplacement réservé hors de __dict__ aux valeurs chargées (voir Tracker).
+    
+    
+    @classmethod
+    def enableCache(cls, size : int = 1024, ttl : float = None) -> None:
+        """Active le cache des modèles lus par clés primaires avec read().
+        
+        Le cache conserve les lignes lues : chaque lecture retourne un nouveau modèle.
+        Il est invalidé par les écritures faites via les méthodes du modèle, pas par
+        celles faites directement sur la connexion.
+
+        Args:
+            size (int, optional): Nombre maximum de modèles en cache. Par défaut 1024.
+            ttl (float, optional): Durée de vie des modèles en cache en secondes, None pour ne jamais expirer. Par défaut None.
+        """
+        Metadata.of(cls).setCache(Cache(size, ttl))
+        logging.info(f'Cache des modèles "{cls.__name__}" activé.')
+    
+    
+    @classmethod
+    def disableCache(cls) -> None:
+        """Désactive le cache des modèles lus par clés primaires.
+        """
+        Metadata.of(cls).setCache(None)
+        logging.info(f'Cache des modèles "{cls.__name__}" désactivé.')
+    
+    
+    @classmethod
+    def getCacheStats(cls) -> dict:
+        """Retourne les statistiques du cache des modèles.
+
+        Returns:
+            dict: Statistiques du cache, None s'il est désactivé.
+        """
+        cache = Metadata.of(cls).getCache()
+        return None if cache is None else cache.getStats()
+    
+    
     @classmethod
     def all(cls) -> list:
         """Récupération de tous les modèles de la base de données.
@@ -21,16 +72,150 @@ class Model:
         Returns:
             list: La liste des objets modèles.
         """
-        reflection = Reflection(cls)
-        query = Query() \
-            .select(reflection.getColumns()) \
-            .from_(reflection.getTable())
-        connection = cls().__runOn(query, (), reflection)
-        objects = connection.fetchAllObjects(cls)
-        logging.info('Récupération de tous les modèles de la base de données.')
+        objects = cls.__runOn(*cls.__prepareAll(), Fetch.OBJECTS)
+        QueryLog.LOGGER.debug('Récupération de tous les modèles de la base de données.')
         return objects
     
     
+    @classmethod
+    async def aall(cls) -> list:
+        """Récupération asynchrone de tous les modèles de la base de données.
+
+        Returns:
+            list: La liste des objets modèles.
+        """
+        objects = await cls.__arunOn(*cls.__prepareAll(), Fetch.OBJECTS)
+        QueryLog.LOGGER.debug('Récupération de tous les modèles de la base de données.')
+        return objects
+    
+    
+    @classmethod
+    def allViews(cls) -> RowSet:
+        """Récupération de tous les modèles de la base de données sous forme de vues légères, promues en modèles à l'écriture.
+
+        Returns:
+            RowSet: Les vues des modèles.
+        """
+        views = cls.__runOn(*cls.__prepareAll(), Fetch.VIEWS)
+        QueryLog.LOGGER.debug('Récupération de tous les modèles de la base de données sous forme de vues.')
+        return views
+    
+    
+    @classmethod
+    async def aallViews(cls) -> RowSet:
+        """Récupération asynchrone de tous les modèles de la base de données sous forme de vues légères.
+
+        Returns:
+            RowSet: Les vues des modèles.
+        """
+        views = await cls.__arunOn(*cls.__prepareAll(), Fetch.VIEWS)
+        QueryLog.LOGGER.debug('Récupération de tous les modèles de la base de données sous forme de vues.')
+        return views
+    
+    
+    @classmethod
+    def stream(cls, batch : int = 1000) -> Iterator[object]:
+        """Parcours de tous les modèles de la base de données par lots, sans les charger tous en mémoire.
+
+        Args:
+            batch (int, optional): Le nombre de lignes lues à chaque échange avec le serveur. Par défaut 1000.
+
+        Yields:
+            object: L'objet modèle lu.
+        """
+        query, parameters, metadata = cls.__prepareAll()
+        connection = cls.__getInstance(metadata)
+        QueryLog.LOGGER.debug('Parcours de tous les modèles de la base de données.')
+        yield from connection.runStream(query, parameters, batch, cls)
+    
+    
+    @classmethod
+    def columns(cls, attributes : Union[str, tuple] = None, batch : int = 10000, numpy : bool = None) -> dict:
+        """Lecture de colonnes de tous les modèles de la base de données dans des tableaux typés, sans créer d'objets.
+
+        Les colonnes int, float, bool et datetime sont lues dans des tableaux NumPy, ou des
+        array.array si NumPy n'est pas installé (voir Columnar), les autres dans des listes.
+
+        Args:
+            attributes (Union[str, tuple], optional): Le ou les attributs à lire, None pour tous. Par défaut None.
+            batch (int, optional): Le nombre de lignes lues à chaque échange avec le serveur. Par défaut 10000.
+            numpy (bool, optional): Retourne des tableaux NumPy, None pour les utiliser s'ils sont installés. Par défaut None.
+
+        Returns:
+            dict: La colonne typée par nom de colonne.
+        """
+        metadata = Metadata.of(cls)
+        if attributes is None:
+            columns = metadata.getColumns()
+        else:
+            columns = tuple(Reflection.parseKey(attribute) for attribute in ((attributes,) if type(attributes) is str else attributes))
+        connection = cls.__getInstance(metadata)
+        with connection.borrow():
+            connection.runQuery(Query().select(columns).from_(metadata.getTable()))
+            values = connection.fetchColumns(metadata.getTypes(), batch, numpy)
+        QueryLog.LOGGER.debug('Lecture de colonnes de tous les modèles de la base de données.')
+        return values
+    
+    
+    @classmethod
+    def paginate(cls, size : int = 1000, order : Union[str, tuple] = None, direction : Direction = Direction.ASC) -> Iterator[list]:
+        """Parcours de tous les modèles de la base de données par pages, paginées par clé (keyset) plutôt que par décalage.
+
+        Chaque page est lue après la dernière ligne de la précédente, son coût restant constant
+        quelle que soit sa profondeur. Les clés primaires complètent les colonnes de tri pour
+        qu'elles forment une clé unique.
+
+        Args:
+            size (int, optional): Le nombre de modèles par page. Par défaut 1000.
+            order (Union[str, tuple], optional): Le ou les attributs de tri, None pour les clés primaires. Par défaut None.
+            direction (Direction, optional): La direction du tri. Par défaut Direction.ASC.
+
+        Yields:
+            list: La liste des objets modèles d'une page.
+        """
+        metadata, columns, attributes = cls.__preparePage(order)
+        connection = cls.__getInstance(metadata)
+        last = None
+        while True:
+            nulls = None if last is None else tuple(getattr(last, attribute) is None for attribute in attributes)
+            query, positions = metadata.getPage(columns, direction, size, nulls)
+            parameters = () if last is None else tuple(getattr(last, attributes[position]) for position in positions)
+            objects = connection.runFetch(query, parameters, Fetch.OBJECTS, cls)
+            QueryLog.LOGGER.debug('Lecture d\'une page de modèles dans la base de données.')
+            if len(objects) > 0:
+                yield objects
+            if len(objects) < size:
+                break
+            last = objects[-1]
+    
+    
+    @classmethod
+    async def apaginate(cls, size : int = 1000, order : Union[str, tuple] = None, direction : Direction = Direction.ASC) -> AsyncIterator[list]:
+        """Parcours asynchrone de tous les modèles de la base de données par pages, paginées par clé (keyset).
+
+        Args:
+            size (int, optional): Le nombre de modèles par page. Par défaut 1000.
+            order (Union[str, tuple], optional): Le ou les attributs de tri, None pour les clés primaires. Par défaut None.
+            direction (Direction, optional): La direction du tri. Par défaut Direction.ASC.
+
+        Yields:
+            list: La liste des objets modèles d'une page.
+        """
+        metadata, columns, attributes = cls.__preparePage(order)
+        last = None
+        while True:
+            nulls = None if last is None else tuple(getattr(last, attribute) is None for attribute in attributes)
+            query, positions = metadata.getPage(columns, direction, size, nulls)
+            parameters = () if last is None else tuple(getattr(last, attributes[position]) for position in positions)
+            objects = await cls.__arunOn(query, parameters, metadata, Fetch.OBJECTS)
+            QueryLog.LOGGER.debug('Lecture d\'une page de modèles dans la base de données.')
+            if len(objects) > 0:
+                yield objects
+            if len(objects) < size:
+                break
+            last = objects[-1]
+    
+    
     @classmethod
     def size(cls) -> int:
         """Récupération du nombre de modèles dans la base de données.
@@ -38,24 +223,39 @@ class Model:
         Returns:
             int: Le nombre de modèles.
         """
-        reflection = Reflection(cls)
-        query = Query() \
-            .select('COUNT(1)') \
-            .from_(reflection.getTable())
-        connection = cls().__runOn(query, (), reflection)
-        size = connection.fetchCell()
-        logging.info('Récupération du nombre de modèles dans la base de données.')
+        size = cls.__runOn(*cls.__prepareSize(), Fetch.CELL)
+        QueryLog.LOGGER.debug('Récupération du nombre de modèles dans la base de données.')
         return size    
     
     
+    @classmethod
+    async def asize(cls) -> int:
+        """Récupération asynchrone du nombre de modèles dans la base de données.
+
+        Returns:
+            int: Le nombre de modèles.
+        """
+        size = await cls.__arunOn(*cls.__prepareSize(), Fetch.CELL)
+        QueryLog.LOGGER.debug('Récupération du nombre de modèles dans la base de données.')
+        return size
+    
+    
     @classmethod
     def clear(cls) -> None:
         """Vidage de la table des modèles.
         """
-        reflection = Reflection(cls)
-        query = Query().truncate(reflection.getTable())
-        cls().__runOn(query, (), reflection)
-        logging.info('Vidage de la table des modèles dans la base de données.')
+        cls.__runOn(*cls.__prepareClear())
+        cls.__invalidateAll()
+        QueryLog.LOGGER.debug('Vidage de la table des modèles dans la base de données.')
+    
+    
+    @classmethod
+    async def aclear(cls) -> None:
+        """Vidage asynchrone de la table des modèles.
+        """
+        await cls.__arunOn(*cls.__prepareClear())
+        cls.__invalidateAll()
+        QueryLog.LOGGER.debug('Vidage de la table des modèles dans la base de données.')
     
     
     @classmethod
@@ -66,48 +266,257 @@ class Model:
             query (Query): La requête.
             parameters (tuple, optional): Les paramètres. Par défaut, la liste est vide.
         """
-        cls().__runOn(query, parameters)
-        logging.info('Exécution d\'une requête sur la table des modèles dans la base de données.')
+        cls.__runOn(query, parameters)
+        cls.__invalidateAll()
+        QueryLog.LOGGER.debug('Exécution d\'une requête sur la table des modèles dans la base de données.')
+    
+    
+    @classmethod
+    async def aexecute(cls, query : Query, parameters : tuple = ()) -> None:
+        """Exécution asynchrone d'une requête.
+
+        Args:
+            query (Query): La requête.
+            parameters (tuple, optional): Les paramètres. Par défaut, la liste est vide.
+        """
+        await cls.__arunOn(query, parameters)
+        cls.__invalidateAll()
+        QueryLog.LOGGER.debug('Exécution d\'une requête sur la table des modèles dans la base de données.')
         
     
     @classmethod
-    def inject(cls, objects : list) -> None:
-        """Injection de modèles dans la base de données.
+    def inject(cls, objects : list, transaction : int = None, batch : int = None) -> dict:
+        """Injection de modèles dans la base de données par requêtes multi-lignes.
 
         Args:
             objects (list): La liste des modèles.
+            transaction (int, optional): Nombre de lignes par transaction, None pour ne pas ouvrir de transaction. Par défaut None.
+            batch (int, optional): Nombre maximum de lignes par requête, None pour ne limiter que par la taille. Par défaut None.
+
+        Returns:
+            dict: Le rapport de l'injection (lignes, requêtes, octets, secondes, lignes par seconde).
         """
-        reflection = Reflection(cls)
-        query = Query() \
-            .insert(reflection.getTable(), reflection.getColumns()) \
-            .values(Reflection.generateMark(reflection.getValues()))
-        cls().__runOn(query, tuple([ Reflection(object).getValues() for object in objects ]), reflection)
-        logging.info('Injection de modèles dans la base de données.')
+        report = cls.__getInstance().runWith(cls.__bulkOn, 'inject', objects, transaction, batch)
+        QueryLog.LOGGER.debug('Injection de modèles dans la base de données.')
+        return report
+    
+    
+    @classmethod
+    async def ainject(cls, objects : list, transaction : int = None, batch : int = None) -> dict:
+        """Injection asynchrone de modèles dans la base de données par requêtes multi-lignes.
+
+        Args:
+            objects (list): La liste des modèles.
+            transaction (int, optional): Nombre de lignes par transaction, None pour ne pas ouvrir de transaction. Par défaut None.
+            batch (int, optional): Nombre maximum de lignes par requête, None pour ne limiter que par la taille. Par défaut None.
+
+        Returns:
+            dict: Le rapport de l'injection (lignes, requêtes, octets, secondes, lignes par seconde).
+        """
+        connection = AsyncConnection.getInstance(Metadata.of(cls).getDatabase())
+        report = await connection.runWith(cls.__bulkOn, 'inject', objects, transaction, batch)
+        QueryLog.LOGGER.debug('Injection de modèles dans la base de données.')
+        return report
+    
+    
+    @classmethod
+    def upsert(cls, objects : list, columns : Union[str, tuple] = None, transaction : int = None, batch : int = None) -> dict:
+        """Insertion ou mise à jour de modèles selon leurs clés primaires (INSERT ... ON DUPLICATE KEY UPDATE).
+
+        Args:
+            objects (list): La liste des modèles.
+            columns (Union[str, tuple], optional): La ou les colonnes à mettre à jour, None pour tous les champs qui ne sont pas des clés primaires. Par défaut None.
+            transaction (int, optional): Nombre de lignes par transaction, None pour ne pas ouvrir de transaction. Par défaut None.
+            batch (int, optional): Nombre maximum de lignes par requête, None pour ne limiter que par la taille. Par défaut None.
+
+        Returns:
+            dict: Le rapport de l'opération (lignes, requêtes, octets, secondes, lignes par seconde).
+        """
+        report = cls.__getInstance().runWith(cls.__bulkOn, 'upsert', objects, columns, transaction, batch)
+        QueryLog.LOGGER.debug('Insertion ou mise à jour de modèles dans la base de données.')
+        return report
+    
+    
+    @classmethod
+    async def aupsert(cls, objects : list, columns : Union[str, tuple] = None, transaction : int = None, batch : int = None) -> dict:
+        """Insertion ou mise à jour asynchrone de modèles selon leurs clés primaires (INSERT ... ON DUPLICATE KEY UPDATE).
+
+        Args:
+            objects (list): La liste des modèles.
+            columns (Union[str, tuple], optional): La ou les colonnes à mettre à jour, None pour tous les champs qui ne sont pas des clés primaires. Par défaut None.
+            transaction (int, optional): Nombre de lignes par transaction, None pour ne pas ouvrir de transaction. Par défaut None.
+            batch (int, optional): Nombre maximum de lignes par requête, None pour ne limiter que par la taille. Par défaut None.
+
+        Returns:
+            dict: Le rapport de l'opération (lignes, requêtes, octets, secondes, lignes par seconde).
+        """
+        connection = AsyncConnection.getInstance(Metadata.of(cls).getDatabase())
+        report = await connection.runWith(cls.__bulkOn, 'upsert', objects, columns, transaction, batch)
+        QueryLog.LOGGER.debug('Insertion ou mise à jour de modèles dans la base de données.')
+        return report
+    
+    
+    @classmethod
+    def updateMany(cls, objects : list, columns : Union[str, tuple] = None, transaction : int = None, batch : int = None) -> dict:
+        """Mise à jour de plusieurs modèles selon leurs clés primaires en quelques requêtes.
+
+        Args:
+            objects (list): La liste des modèles, ou de leurs vues (voir allViews).
+            columns (Union[str, tuple], optional): La ou les colonnes à mettre à jour, None pour tous les champs qui ne sont pas des clés primaires. Par défaut None.
+            transaction (int, optional): Nombre de lignes par transaction, None pour ne pas ouvrir de transaction. Par défaut None.
+            batch (int, optional): Nombre maximum de lignes par requête, None pour ne limiter que par la taille. Par défaut None.
+
+        Returns:
+            dict: Le rapport de l'opération (lignes, requêtes, octets, secondes, lignes par seconde).
+        """
+        report = cls.__getInstance().runWith(cls.__bulkOn, 'updateMany', objects, columns, transaction, batch)
+        QueryLog.LOGGER.debug('Mise à jour de modèles dans la base de données.')
+        return report
+    
+    
+    @classmethod
+    async def aupdateMany(cls, objects : list, columns : Union[str, tuple] = None, transaction : int = None, batch : int = None) -> dict:
+        """Mise à jour asynchrone de plusieurs modèles selon leurs clés primaires en quelques requêtes.
+
+        Args:
+            objects (list): La liste des modèles, ou de leurs vues (voir allViews).
+            columns (Union[str, tuple], optional): La ou les colonnes à mettre à jour, None pour tous les champs qui ne sont pas des clés primaires. Par défaut None.
+            transaction (int, optional): Nombre de lignes par transaction, None pour ne pas ouvrir de transaction. Par défaut None.
+            batch (int, optional): Nombre maximum de lignes par requête, None pour ne limiter que par la taille. Par défaut None.
+
+        Returns:
+            dict: Le rapport de l'opération (lignes, requêtes, octets, secondes, lignes par seconde).
+        """
+        connection = AsyncConnection.getInstance(Metadata.of(cls).getDatabase())
+        report = await connection.runWith(cls.__bulkOn, 'updateMany', objects, columns, transaction, batch)
+        QueryLog.LOGGER.debug('Mise à jour de modèles dans la base de données.')
+        return report
+    
+    
+    @classmethod
+    def deleteMany(cls, objects : list, transaction : int = None, batch : int = None) -> dict:
+        """Suppression de plusieurs modèles selon leurs clés primaires en quelques requêtes.
+
+        Args:
+            objects (list): La liste des modèles, de leurs vues (voir allViews) ou des valeurs de leurs clés primaires (tuple pour les clés composées).
+            transaction (int, optional): Nombre de lignes par transaction, None pour ne pas ouvrir de transaction. Par défaut None.
+            batch (int, optional): Nombre maximum de lignes par requête, None pour ne limiter que par la taille. Par défaut None.
+
+        Returns:
+            dict: Le rapport de l'opération (lignes, requêtes, octets, secondes, lignes par seconde).
+        """
+        report = cls.__getInstance().runWith(cls.__bulkOn, 'deleteMany', objects, transaction, batch)
+        QueryLog.LOGGER.debug('Suppression de modèles dans la base de données.')
+        return report
+    
+    
+    @classmethod
+    async def adeleteMany(cls, objects : list, transaction : int = None, batch : int = None) -> dict:
+        """Suppression asynchrone de plusieurs modèles selon leurs clés primaires en quelques requêtes.
+
+        Args:
+            objects (list): La liste des modèles, de leurs vues (voir allViews) ou des valeurs de leurs clés primaires (tuple pour les clés composées).
+            transaction (int, optional): Nombre de lignes par transaction, None pour ne pas ouvrir de transaction. Par défaut None.
+            batch (int, optional): Nombre maximum de lignes par requête, None pour ne limiter que par la taille. Par défaut None.
+
+        Returns:
+            dict: Le rapport de l'opération (lignes, requêtes, octets, secondes, lignes par seconde).
+        """
+        connection = AsyncConnection.getInstance(Metadata.of(cls).getDatabase())
+        report = await connection.runWith(cls.__bulkOn, 'deleteMany', objects, transaction, batch)
+        QueryLog.LOGGER.debug('Suppression de modèles dans la base de données.')
+        return report
+    
+    
+    @classmethod
+    def load(cls, source : Union[list, str], header : bool = False) -> dict:
+        """Chargement massif de modèles ou d'un fichier CSV via LOAD DATA LOCAL INFILE.
+
+        Args:
+            source (Union[list, str]): Les modèles ou le chemin d'un fichier CSV dans l'ordre des colonnes du modèle.
+            header (bool, optional): Indique que la première ligne du fichier CSV est un entête à ignorer. Par défaut False.
+
+        Returns:
+            dict: Le rapport du chargement (lignes, requêtes, octets, secondes, lignes par seconde).
+        """
+        report = cls.__getInstance().runWith(cls.__bulkOn, 'load', source, header)
+        QueryLog.LOGGER.debug('Chargement de modèles dans la base de données.')
+        return report
+    
+    
+    @classmethod
+    async def aload(cls, source : Union[list, str], header : bool = False) -> dict:
+        """Chargement massif asynchrone de modèles ou d'un fichier CSV via LOAD DATA LOCAL INFILE.
+
+        Args:
+            source (Union[list, str]): Les modèles ou le chemin d'un fichier CSV dans l'ordre des colonnes du modèle.
+            header (bool, optional): Indique que la première ligne du fichier CSV est un entête à ignorer. Par défaut False.
+
+        Returns:
+            dict: Le rapport du chargement (lignes, requêtes, octets, secondes, lignes par seconde).
+        """
+        connection = AsyncConnection.getInstance(Metadata.of(cls).getDatabase())
+        report = await connection.runWith(cls.__bulkOn, 'load', source, header)
+        QueryLog.LOGGER.debug('Chargement de modèles dans la base de données.')
+        return report
 
     
     def create(self) -> None:
         """Création d'un modèle dans la base de données.
         """
-        reflection = Reflection(self)
-        query = Query() \
-            .insert(reflection.getTable(), reflection.getColumns()) \
-            .values(Reflection.generateMark(reflection.getValues()))
-        self.__runOn(query, reflection.getValues(), reflection)
-        logging.info('Création d\'un modèle dans la base de données.')
+        self.__runOn(*self.__prepareCreate())
+        Tracker.snapshot(self)
+        QueryLog.LOGGER.debug('Création d\'un modèle dans la base de données.')
+    
+    
+    async def acreate(self) -> None:
+        """Création asynchrone d'un modèle dans la base de données.
+        """
+        await self.__arunOn(*self.__prepareCreate())
+        Tracker.snapshot(self)
+        QueryLog.LOGGER.debug('Création d\'un modèle dans la base de données.')
         
         
-    def update(self, column : Union[str, tuple] = None, clause: Union[Clause, tuple] = Clause.EQUAL) -> None:
+    def update(self, column : Union[str, tuple] = None, clause: Union[Clause, tuple] = Clause.EQUAL, force : bool = False) -> None:
         """Mise à jour d'un modèle dans la base de données.
+        
+        Pour un modèle lu depuis la base, seuls les attributs modifiés depuis sa lecture sont
+        envoyés, et aucune requête n'est exécutée s'il n'a pas été modifié.
 
         Args:
             column (Union[str, tuple], optional): La ou les colonnes à prendre en compte. Par défaut None.
             clause (Union[Clause, tuple], optional): Le ou les types de clause. Par défaut Clause.EQUAL.
+            force (bool, optional): Envoie tous les attributs, modifiés ou non. Par défaut False.
         """
-        reflection = Reflection(self)
-        query = Query().update(reflection.getTable(), reflection.getColumns(), Reflection.generateMark(reflection.getValues()))
-        where, values = self.__findClause(column, clause)
-        self.__runOn(Query(f'{query} {where}'), reflection.getValues() + values, reflection)
-        logging.info('Mise à jour d\'un modèle dans la base de données.')
+        prepared = self.__prepareUpdate(column, clause, force)
+        if prepared is None:
+            QueryLog.LOGGER.debug('Aucune modification du modèle à mettre à jour.')
+            return
+        self.__runOn(*prepared)
+        Tracker.snapshot(self)
+        self.__invalidate(column, clause)
+        QueryLog.LOGGER.debug('Mise à jour d\'un modèle dans la base de données.')
+    
+    
+    async def aupdate(self, column : Union[str, tuple] = None, clause: Union[Clause, tuple] = Clause.EQUAL, force : bool = False) -> None:
+        """Mise à jour asynchrone d'un modèle dans la base de données.
+        
+        Pour un modèle lu depuis la base, seuls les attributs modifiés depuis sa lecture sont
+        envoyés, et aucune requête n'est exécutée s'il n'a pas été modifié.
+
+        Args:
+            column (Union[str, tuple], optional): La ou les colonnes à prendre en compte. Par défaut None.
+            clause (Union[Clause, tuple], optional): Le ou les types de clause. Par défaut Clause.EQUAL.
+            force (bool, optional): Envoie tous les attributs, modifiés ou non. Par défaut False.
+        """
+        prepared = self.__prepareUpdate(column, clause, force)
+        if prepared is None:
+            QueryLog.LOGGER.debug('Aucune modification du modèle à mettre à jour.')
+            return
+        await self.__arunOn(*prepared)
+        Tracker.snapshot(self)
+        self.__invalidate(column, clause)
+        QueryLog.LOGGER.debug('Mise à jour d\'un modèle dans la base de données.')
         
 
     def delete(self, column : Union[str, tuple] = None, clause: Union[Clause, tuple] = Clause.EQUAL) -> None:
@@ -117,11 +526,21 @@ class Model:
             column (Union[str, tuple], optional): La ou les colonnes à prendre en compte. Par défaut None.
             clause (Union[Clause, tuple], optional): Le ou les types de clause. Par défaut Clause.EQUAL.
         """
-        reflection = Reflection(self)
-        query = Query().delete(reflection.getTable())
-        where, values = self.__findClause(column, clause)
-        self.__runOn(Query(f'{query} {where}'), values, reflection)
-        logging.info('Suppression d\'un modèle dans la base de données.')
+        self.__runOn(*self.__prepareWhere(Statement.DELETE, column, clause))
+        self.__invalidate(column, clause)
+        QueryLog.LOGGER.debug('Suppression d\'un modèle dans la base de données.')
+    
+    
+    async def adelete(self, column : Union[str, tuple] = None, clause: Union[Clause, tuple] = Clause.EQUAL) -> None:
+        """Suppression asynchrone d'un modèle dans la base de données.
+
+        Args:
+            column (Union[str, tuple], optional): La ou les colonnes à prendre en compte. Par défaut None.
+            clause (Union[Clause, tuple], optional): Le ou les types de clause. Par défaut Clause.EQUAL.
+        """
+        await self.__arunOn(*self.__prepareWhere(Statement.DELETE, column, clause))
+        self.__invalidate(column, clause)
+        QueryLog.LOGGER.debug('Suppression d\'un modèle dans la base de données.')
         
         
     def read(self, column : Union[str, tuple] = None, clause: Union[Clause, tuple] = Clause.EQUAL) -> object:
@@ -134,14 +553,37 @@ class Model:
         Returns:
             object: L'objet modèle lu.
         """
-        reflection = Reflection(self)
-        query = Query() \
-            .select(reflection.getColumns()) \
-            .from_(reflection.getTable())
-        where, values = self.__findClause(column, clause)
-        connection = self.__runOn(Query(f'{query} {where}'), values, reflection)
-        object = connection.fetchOneObject(self.__class__)
-        logging.info('Lecture d\'un modèle dans la base de données.')
+        cache, key = self.__findCache(column, clause)
+        object = None if cache is None else self.__fromCache(cache, key)
+        if not object is None:
+            QueryLog.LOGGER.debug('Lecture d\'un modèle depuis le cache.')
+            return object
+        object = self.__runOn(*self.__prepareWhere(Statement.SELECT, column, clause), Fetch.OBJECT)
+        if not cache is None and not object is None:
+            cache.put(key, Model.__copyRow(Metadata.of(self.__class__).getValues(object)))
+        QueryLog.LOGGER.debug('Lecture d\'un modèle dans la base de données.')
+        return object
+    
+    
+    async def aread(self, column : Union[str, tuple] = None, clause: Union[Clause, tuple] = Clause.EQUAL) -> object:
+        """Lecture asynchrone d'un modèle dans la base de données.
+
+        Args:
+            column (Union[str, tuple], optional): La ou les colonnes à prendre en compte. Par défaut None.
+            clause (Union[Clause, tuple], optional): Le ou les types de clause. Par défaut Clause.EQUAL.
+            
+        Returns:
+            object: L'objet modèle lu.
+        """
+        cache, key = self.__findCache(column, clause)
+        object = None if cache is None else self.__fromCache(cache, key)
+        if not object is None:
+            QueryLog.LOGGER.debug('Lecture d\'un modèle depuis le cache.')
+            return object
+        object = await self.__arunOn(*self.__prepareWhere(Statement.SELECT, column, clause), Fetch.OBJECT)
+        if not cache is None and not object is None:
+            cache.put(key, Model.__copyRow(Metadata.of(self.__class__).getValues(object)))
+        QueryLog.LOGGER.debug('Lecture d\'un modèle dans la base de données.')
         return object
     
     
@@ -155,17 +597,73 @@ class Model:
         Returns:
             list: La liste des objets modèles lus.
         """
-        reflection = Reflection(self)
-        query = Query() \
-            .select(reflection.getColumns()) \
-            .from_(reflection.getTable())
-        where, values = self.__findClause(column, clause)
-        connection = self.__runOn(Query(f'{query} {where}'), values, reflection)
-        objects = connection.fetchAllObjects(self.__class__)
-        logging.info('Lecture de plusieurs modèles dans la base de données.')
+        objects = self.__runOn(*self.__prepareWhere(Statement.SELECT, column, clause), Fetch.OBJECTS)
+        QueryLog.LOGGER.debug('Lecture de plusieurs modèles dans la base de données.')
+        return objects
+    
+    
+    async def amany(self, column : Union[str, tuple] = None, clause: Union[Clause, tuple] = Clause.EQUAL) -> list:
+        """Lecture asynchrone de plusieurs modèles dans la base de données.
+
+        Args:
+            column (Union[str, tuple], optional): La ou les colonnes à prendre en compte. Par défaut None.
+            clause (Union[Clause, tuple], optional): Le ou les types de clause. Par défaut Clause.EQUAL.
+            
+        Returns:
+            list: La liste des objets modèles lus.
+        """
+        objects = await self.__arunOn(*self.__prepareWhere(Statement.SELECT, column, clause), Fetch.OBJECTS)
+        QueryLog.LOGGER.debug('Lecture de plusieurs modèles dans la base de données.')
         return objects
     
 
+    def manyViews(self, column : Union[str, tuple] = None, clause: Union[Clause, tuple] = Clause.EQUAL) -> RowSet:
+        """Lecture de plusieurs modèles dans la base de données sous forme de vues légères, promues en modèles à l'écriture.
+
+        Args:
+            column (Union[str, tuple], optional): La ou les colonnes à prendre en compte. Par défaut None.
+            clause (Union[Clause, tuple], optional): Le ou les types de clause. Par défaut Clause.EQUAL.
+            
+        Returns:
+            RowSet: Les vues des modèles lus.
+        """
+        views = self.__runOn(*self.__prepareWhere(Statement.SELECT, column, clause), Fetch.VIEWS)
+        QueryLog.LOGGER.debug('Lecture de plusieurs modèles dans la base de données sous forme de vues.')
+        return views
+    
+    
+    async def amanyViews(self, column : Union[str, tuple] = None, clause: Union[Clause, tuple] = Clause.EQUAL) -> RowSet:
+        """Lecture asynchrone de plusieurs modèles dans la base de données sous forme de vues légères.
+
+        Args:
+            column (Union[str, tuple], optional): La ou les colonnes à prendre en compte. Par défaut None.
+            clause (Union[Clause, tuple], optional): Le ou les types de clause. Par défaut Clause.EQUAL.
+            
+        Returns:
+            RowSet: Les vues des modèles lus.
+        """
+        views = await self.__arunOn(*self.__prepareWhere(Statement.SELECT, column, clause), Fetch.VIEWS)
+        QueryLog.LOGGER.debug('Lecture de plusieurs modèles dans la base de données sous forme de vues.')
+        return views
+    
+
+    def iterMany(self, column : Union[str, tuple] = None, clause: Union[Clause, tuple] = Clause.EQUAL, batch : int = 1000) -> Iterator[object]:
+        """Parcours de plusieurs modèles de la base de données par lots, sans les charger tous en mémoire.
+
+        Args:
+            column (Union[str, tuple], optional): La ou les colonnes à prendre en compte. Par défaut None.
+            clause (Union[Clause, tuple], optional): Le ou les types de clause. Par défaut Clause.EQUAL.
+            batch (int, optional): Le nombre de lignes lues à chaque échange avec le serveur. Par défaut 1000.
+            
+        Yields:
+            object: L'objet modèle lu.
+        """
+        query, parameters, metadata = self.__prepareWhere(Statement.SELECT, column, clause)
+        connection = self.__getInstance(metadata)
+        QueryLog.LOGGER.debug('Parcours de plusieurs modèles dans la base de données.')
+        yield from connection.runStream(query, parameters, batch, self.__class__)
+    
+
     def exists(self, column : Union[str, tuple] = None, clause: Union[Clause, tuple] = Clause.EQUAL) -> bool:
         """Vérification de l'existence d'un modèle dans la base de données.
 
@@ -176,14 +674,23 @@ class Model:
         Returns:
             bool: True si le modèle existe, False sinon.
         """
-        reflection = Reflection(self)
-        query = Query() \
-            .select('1') \
-            .from_(reflection.getTable())
-        where, values = self.__findClause(column, clause)
-        connection = self.__runOn(Query(f'{query} {where}'), values, reflection)
-        cell = connection.fetchCell()
-        logging.info('Vérification de l\'existence d\'un modèle dans la base de données.')
+        cell = self.__runOn(*self.__prepareWhere(Statement.EXISTS, column, clause), Fetch.CELL)
+        QueryLog.LOGGER.debug('Vérification de l\'existence d\'un modèle dans la base de données.')
+        return cell == 1
+    
+    
+    async def aexists(self, column : Union[str, tuple] = None, clause: Union[Clause, tuple] = Clause.EQUAL) -> bool:
+        """Vérification asynchrone de l'existence d'un modèle dans la base de données.
+
+        Args:
+            column (Union[str, tuple], optional): La ou les colonnes à prendre en compte. Par défaut None.
+            clause (Union[Clause, tuple], optional): Le ou les types de clause. Par défaut Clause.EQUAL.
+
+        Returns:
+            bool: True si le modèle existe, False sinon.
+        """
+        cell = await self.__arunOn(*self.__prepareWhere(Statement.EXISTS, column, clause), Fetch.CELL)
+        QueryLog.LOGGER.debug('Vérification de l\'existence d\'un modèle dans la base de données.')
         return cell == 1
     
     
@@ -197,50 +704,278 @@ class Model:
         Returns:
             int: Le nombre de modèles.
         """
-        reflection = Reflection(self)
-        query = Query() \
-            .select('COUNT(1)') \
-            .from_(reflection.getTable())
-        where, values = self.__findClause(column, clause)
-        connection = self.__runOn(Query(f'{query} {where}'), values, reflection)
-        count = connection.fetchCell()
-        logging.info('Compte le nombre de modèles dans la base de données.')
+        count = self.__runOn(*self.__prepareWhere(Statement.COUNT, column, clause), Fetch.CELL)
+        QueryLog.LOGGER.debug('Compte le nombre de modèles dans la base de données.')
+        return count
+    
+    
+    async def acount(self, column : Union[str, tuple] = None, clause: Union[Clause, tuple] = Clause.EQUAL) -> int:
+        """Compte de manière asynchrone le nombre de modèles dans la base de données.
+
+        Args:
+            column (Union[str, tuple], optional): La ou les colonnes à prendre en compte. Par défaut None.
+            clause (Union[Clause, tuple], optional): Le ou les types de clause. Par défaut Clause.EQUAL.
+
+        Returns:
+            int: Le nombre de modèles.
+        """
+        count = await self.__arunOn(*self.__prepareWhere(Statement.COUNT, column, clause), Fetch.CELL)
+        QueryLog.LOGGER.debug('Compte le nombre de modèles dans la base de données.')
         return count
     
     
-    def __getInstance(self, reflection : Reflection = None) -> Connection:
+    @classmethod
+    def __prepareAll(cls) -> tuple:
+        """Prépare la requête de récupération de tous les modèles.
+
+        Returns:
+            tuple: La requête, ses paramètres et les métadonnées du modèle.
+        """
+        metadata = Metadata.of(cls)
+        return (metadata.getStatement(Statement.ALL), (), metadata)
+    
+    
+    @classmethod
+    def __preparePage(cls, order : Union[str, tuple] = None) -> tuple:
+        """Prépare les colonnes de tri d'une pagination par clé, complétées par les clés primaires.
+
+        Args:
+            order (Union[str, tuple], optional): Le ou les attributs de tri, None pour les clés primaires. Par défaut None.
+
+        Raises:
+            Exception: Le modèle n'a pas de clé primaire.
+
+        Returns:
+            tuple: Les métadonnées du modèle, les colonnes de tri et les attributs correspondants.
+        """
+        metadata = Metadata.of(cls)
+        if order is None:
+            order = ()
+        elif type(order) is str:
+            order = (order,)
+        known = metadata.getDefaults()
+        attributes = tuple(attribute if attribute in known or not f'_{attribute}' in known else f'_{attribute}' for attribute in order)
+        attributes += tuple(attribute for attribute in metadata.getKeyAttributes() if not attribute in attributes)
+        if len(attributes) == 0:
+            raise Exception(f'Le modèle "{cls.__name__}" n\'a pas de clé primaire pour être paginé !')
+        return (metadata, tuple(Reflection.parseKey(attribute) for attribute in attributes), attributes)
+    
+    
+    @classmethod
+    def __prepareSize(cls) -> tuple:
+        """Prépare la requête de comptage de tous les modèles.
+
+        Returns:
+            tuple: La requête, ses paramètres et les métadonnées du modèle.
+        """
+        metadata = Metadata.of(cls)
+        return (metadata.getStatement(Statement.SIZE), (), metadata)
+    
+    
+    @classmethod
+    def __prepareClear(cls) -> tuple:
+        """Prépare la requête de vidage de la table.
+
+        Returns:
+            tuple: La requête, ses paramètres et les métadonnées du modèle.
+        """
+        metadata = Metadata.of(cls)
+        return (metadata.getStatement(Statement.TRUNCATE), (), metadata)
+    
+    
+    @classmethod
+    def __bulkOn(cls, handle : Handle, operation : str, *arguments) -> dict:
+        """Exécute une opération de masse sur un socket emprunté.
+
+        Args:
+            handle (Handle): Le socket emprunté.
+            operation (str): Le nom de la méthode de Bulk à appeler.
+            arguments: Les arguments de l'opération.
+
+        Returns:
+            dict: Le rapport de l'opération.
+        """
+        try:
+            return getattr(Bulk(cls, handle), operation)(*arguments)
+        finally:
+            cls.__invalidateAll()
+    
+    
+    def __prepareCreate(self) -> tuple:
+        """Prépare la requête de création du modèle.
+
+        Returns:
+            tuple: La requête, ses paramètres et les métadonnées du modèle.
+        """
+        metadata = Metadata.of(self.__class__)
+        return (metadata.getStatement(Statement.INSERT), metadata.getValues(self), metadata)
+    
+    
+    def __prepareUpdate(self, column : Union[str, tuple] = None, clause: Union[Clause, tuple] = Clause.EQUAL, force : bool = False) -> Optional[tuple]:
+        """Prépare la requête de mise à jour du modèle.
+
+        Args:
+            column (Union[str, tuple], optional): La ou les colonnes à prendre en compte. Par défaut None.
+            clause (Union[Clause, tuple], optional): Le ou les types de clause. Par défaut Clause.EQUAL.
+            force (bool, optional): Met à jour tous les attributs, modifiés ou non. Par défaut False.
+
+        Returns:
+            Optional[tuple]: La requête, ses paramètres et les métadonnées du modèle, None si aucun attribut n'a été modifié.
+        """
+        metadata = Metadata.of(self.__class__)
+        _, values = self.__findClause(column, clause)
+        changes = None if force else Tracker.getChanges(self)
+        if changes is None:
+            return (metadata.getStatement(Statement.UPDATE, column, clause), metadata.getValues(self) + values, metadata)
+        elif len(changes) == 0:
+            return None
+        else:
+            return (metadata.getUpdate(changes, column, clause), tuple(getattr(self, attribute) for attribute in changes) + values, metadata)
+    
+    
+    def __prepareWhere(self, kind : str, column : Union[str, tuple] = None, clause: Union[Clause, tuple] = Clause.EQUAL) -> tuple:
+        """Prépare une requête filtrée par une clause WHERE (lecture, existence, comptage, suppression).
+
+        Args:
+            kind (str): Le type de requête (voir Statement).
+            column (Union[str, tuple], optional): La ou les colonnes à prendre en compte. Par défaut None.
+            clause (Union[Clause, tuple], optional): Le ou les types de clause. Par défaut Clause.EQUAL.
+
+        Returns:
+            tuple: La requête, ses paramètres et les métadonnées du modèle.
+        """
+        metadata = Metadata.of(self.__class__)
+        _, values = self.__findClause(column, clause)
+        return (metadata.getStatement(kind, column, clause), values, metadata)
+    
+    
+    @classmethod
+    def __getInstance(cls, metadata : Metadata = None) -> Connection:
         """Récupère l'instance du modèle.
 
         Args:
-            reflection (Reflection, optional): La réflexion du modèle. Par défaut None.
+            metadata (Metadata, optional): Les métadonnées du modèle. Par défaut None.
             
         Returns:
             Connection: La connexion à la base de données.
         """
-        if reflection is None:
-            reflection = Reflection(self)
-        connection = Connection.getInstance(reflection.getDatabase())
+        if metadata is None:
+            metadata = Metadata.of(cls)
+        connection = Connection.getInstance(metadata.getDatabase())
         return connection
     
     
-    def __runOn(self, query : Query, parameters : tuple = (), reflection : Reflection = None) -> Connection:
-        """Exécute une requête sur la base de données liée au modèle.
+    @classmethod
+    def __runOn(cls, query : Query, parameters : tuple = (), metadata : Metadata = None, fetch : str = Fetch.NONE) -> Any:
+        """Exécute une requête sur la base de données liée au modèle et récupère son résultat sur le même socket.
 
         Args:
             query (Query): La requête à exécuter.
             parameters (tuple, optional): Les paramètres de la requête. Par défaut, la liste est vide.
-            reflection (Reflection, optional): La réflexion existante du modèle. Par défaut None.
+            metadata (Metadata, optional): Les métadonnées du modèle. Par défaut None.
+            fetch (str, optional): Le mode de récupération du résultat. Par défaut Fetch.NONE.
             
         Returns:
-            Connection: La connexion à la base de données.
+            Any: Le résultat de la requête selon le mode de récupération.
         """
-        connection = self.__getInstance()
-        connection.runQuery(query, parameters)
-        return connection
+        connection = cls.__getInstance(metadata)
+        return connection.runFetch(query, parameters, fetch, cls)
+    
+    
+    @classmethod
+    async def __arunOn(cls, query : Query, parameters : tuple = (), metadata : Metadata = None, fetch : str = Fetch.NONE) -> Any:
+        """Exécute de manière asynchrone une requête sur la base de données liée au modèle.
+
+        Args:
+            query (Query): La requête à exécuter.
+            parameters (tuple, optional): Les paramètres de la requête. Par défaut, la liste est vide.
+            metadata (Metadata, optional): Les métadonnées du modèle. Par défaut None.
+            fetch (str, optional): Le mode de récupération du résultat. Par défaut Fetch.NONE.
+            
+        Returns:
+            Any: Le résultat de la requête selon le mode de récupération.
+        """
+        if metadata is None:
+            metadata = Metadata.of(cls)
+        connection = AsyncConnection.getInstance(metadata.getDatabase())
+        return await connection.runFetch(query, parameters, fetch, cls)
+    
+    
+    def __findCache(self, column : Union[str, tuple] = None, clause: Union[Clause, tuple] = Clause.EQUAL) -> tuple:
+        """Retourne le cache et la clé du modèle pour une lecture par clés primaires.
+
+        Args:
+            column (Union[str, tuple], optional): La ou les colonnes à prendre en compte. Par défaut None.
+            clause (Union[Clause, tuple], optional): Le ou les types de clause. Par défaut Clause.EQUAL.
+
+        Returns:
+            tuple: Le cache, None s'il est désactivé ou que la lecture ne porte pas sur les clés primaires, et la clé.
+        """
+        metadata = Metadata.of(self.__class__)
+        cache = metadata.getCache()
+        if cache is None or not column is None or clause != Clause.EQUAL:
+            return (None, None)
+        return (cache, metadata.getKeysValues(self))
+    
+    
+    def __fromCache(self, cache : Cache, key : tuple) -> object:
+        """Retourne un nouveau modèle construit depuis la ligne en cache, chaque lecture ayant sa propre instance.
+
+        Args:
+            cache (Cache): Le cache des modèles.
+            key (tuple): Les valeurs des clés primaires.
+
+        Returns:
+            object: Le modèle, None si la ligne n'est pas en cache.
+        """
+        row = cache.get(key)
+        if row is None:
+            return None
+        return Converter(self.__class__, Metadata.of(self.__class__).getColumns()).convertRow(Model.__copyRow(row))
+    
+    
+    @staticmethod
+    def __copyRow(row : tuple) -> tuple:
+        """Copie les valeurs modifiables en place d'une ligne (voir Tracker.IMMUTABLES).
+
+        Args:
+            row (tuple): Les valeurs des attributs dans l'ordre des colonnes.
+
+        Returns:
+            tuple: Les valeurs, jamais partagées avec le cache.
+        """
+        immutables = Tracker.IMMUTABLES
+        return tuple(value if type(value) in immutables else copy.copy(value) for value in row)
+    
+    
+    def __invalidate(self, column : Union[str, tuple] = None, clause: Union[Clause, tuple] = Clause.EQUAL) -> None:
+        """Invalide le modèle dans le cache, ou tout le cache si l'écriture ne porte pas sur les clés primaires.
+
+        Args:
+            column (Union[str, tuple], optional): La ou les colonnes prises en compte. Par défaut None.
+            clause (Union[Clause, tuple], optional): Le ou les types de clause. Par défaut Clause.EQUAL.
+        """
+        metadata = Metadata.of(self.__class__)
+        cache = metadata.getCache()
+        if cache is None:
+            return
+        if column is None and clause == Clause.EQUAL:
+            cache.invalidate(metadata.getKeysValues(self))
+        else:
+            cache.clear()
+    
+    
+    @classmethod
+    def __invalidateAll(cls) -> None:
+        """Vide le cache des modèles.
+        """
+        cache = Metadata.of(cls).getCache()
+        if not cache is None:
+            cache.clear()
     
     
     def __findClause(self, column : Union[str, tuple] = None, clause: Union[Clause, tuple] = Clause.EQUAL) -> tuple:
-        """Construction de la clause WHERE.
+        """Construction de la clause WHERE, compilée une seule fois par classe de modèle.
 
         Args:
             column (Union[str, tuple]): La ou les colonnes.
@@ -249,39 +984,8 @@ class Model:
         Returns:
             tuple: La clause WHERE et les valeurs.
         """
-        query = Query()
-        if column is None:
-            reflection = Reflection(self)
-            column = reflection.getKeys()
-            values = reflection.getKeysValues()
-        else:
-            if not type(column) is tuple:
-                values = getattr(self, column)
-                column = Reflection.parseKey(column)
-            else:
-                values = tuple(getattr(self, c) for c in column)
-                column = tuple(Reflection.parseKey(c) for c in column)
-                
-            
-        if type(column) is tuple and type(clause) is tuple:
-            for i in range(len(column)):
-                if i == 0: query.where(column[i], '%s', clause[i])
-                else: query.and_(column[i], '%s', clause[i])
-                
-        elif type(column) is tuple:
-            for i in range(len(column)):
-                if i == 0: query.where(column[i], '%s', clause)
-                else: query.and_(column[i], '%s', clause)
-                
-        elif type(clause) is tuple:
-            for i in range(len(clause)):
-                if i == 0: query.where(column, '%s', clause[i])
-                else: query.and_(column, '%s', clause[i])
-                
-        else:
-            query.where(column, '%s', clause)
-                    
-        return (query, values)
+        where, attributes = Metadata.of(self.__class__).getClause(column, clause)
+        return (where, tuple(getattr(self, attribute) for attribute in attributes))
     
     
     def __str__(self):
@@ -290,9 +994,14 @@ class Model:
         Returns:
             str: Je JSON du modèle.
         """
-        connection = self.__getInstance()
+        database = Metadata.of(self.__class__).getDatabase()
+        if database in Connection.getAllInstances():
+            connection = Connection.getInstance(database)
+        else:
+            connection = AsyncConnection.getInstance(database)
         configuration = connection.getConfiguration()
+        values = Metadata.of(self.__class__).toDict(self)
         if configuration.isBeautify():
-            return json.dumps(self.__dict__, sort_keys=True, indent=4)
+            return json.dumps(values, sort_keys=True, indent=4)
         else:
-            return json.dumps(self.__dict__)
\ No newline at end of file
+            return json.dumps(values)
\ No newline at end of file
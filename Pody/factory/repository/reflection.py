@@ -4,9 +4,15 @@ from typing import Union
 
 class Reflection:
     """Gestion de la réflexion entre le modèle et la base de données
+    
+    Les attributs du modèle sont ceux de son manifeste (voir MANIFEST) s'il en déclare un,
+    ceux de son dictionnaire sinon.
     """
     
     
+    MANIFEST = '__attributes__' # type: str # Attribut de classe listant les attributs des modèles à __slots__, clés primaires préfixées par "_".
+    
+    
     def __init__(self, model : Union[object, type]) -> None:
         """Constructeur de la classe.
 
@@ -16,6 +22,17 @@ class Reflection:
         if type(model) is type:
             model = model()
         self.__model = model
+        manifest = getattr(model.__class__, Reflection.MANIFEST, None)
+        self.__attributes = tuple(model.__dict__) if manifest is None else tuple(manifest)
+    
+    
+    def getAttributes(self) -> tuple:
+        """Retourne les noms des attributs du modèle, clés primaires préfixées par "_".
+        
+        Returns:
+            tuple: Noms des attributs du modèle.
+        """
+        return self.__attributes
     
 
     def getDatabase(self) -> str:
@@ -42,7 +59,7 @@ class Reflection:
         Returns:
             tuple: Noms des colonnes liées au modèle.
         """
-        return tuple(Reflection.parseKey(attribute) for attribute in self.__model.__dict__)
+        return tuple(Reflection.parseKey(attribute) for attribute in self.__attributes)
     
     
     def getValues(self) -> tuple:
@@ -51,7 +68,7 @@ class Reflection:
         Returns:
             tuple: Liste des valeurs liées au modèle.
         """
-        return tuple(getattr(self.__model, attribute) for attribute in self.__model.__dict__)
+        return tuple(getattr(self.__model, attribute) for attribute in self.__attributes)
     
     
     def getKeys(self) -> tuple:
@@ -61,7 +78,7 @@ class Reflection:
             tuple: Liste des clés primaires liées au modèle.
         """
         primary = []
-        for attribute in self.__model.__dict__:
+        for attribute in self.__attributes:
             if attribute[0] == '_':
                 primary.append(Reflection.parseKey(attribute))
         return tuple(primary)
@@ -74,7 +91,7 @@ class Reflection:
             tuple: Liste des valeurs des clés primaires liées au modèle.
         """
         values = []
-        for attribute in self.__model.__dict__:
+        for attribute in self.__attributes:
             if attribute[0] == '_':
                 values.append(getattr(self.__model, attribute))
         return tuple(values)
@@ -87,7 +104,7 @@ class Reflection:
             tuple: Liste des champs liés au modèle.
         """
         fields = []
-        for attribute in self.__model.__dict__:
+        for attribute in self.__attributes:
             if attribute[0] != '_':
                 fields.append(attribute)
         return tuple(fields)
@@ -100,7 +117,7 @@ class Reflection:
             list: Liste des valeurs des champs liés au modèle.
         """
         values = []
-        for attribute in self.__model.__dict__:
+        for attribute in self.__attributes:
             if attribute[0] != '_':
                 values.append(getattr(self.__model, attribute))
         return tuple(values)
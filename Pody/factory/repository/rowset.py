@@ -0,0 +1,165 @@
+from typing import Any, Iterator, Union
+
+from Pody.factory.repository.converter import Converter
+from Pody.factory.repository.metadata import Metadata
+from Pody.factory.repository.rowview import RowView
+
+
+
+class RowSet:
+    """Résultat conservant les lignes brutes du curseur et donnant accès à chacune par une vue légère du modèle.
+    
+    Les lignes restent des tuples partagés avec un seul index des colonnes, chaque vue
+    (voir RowView) ne coûtant que quelques octets au lieu d'un objet modèle et de son
+    dictionnaire. Une vue est promue en modèle à la première écriture ou au premier appel
+    d'une méthode du modèle, le modèle étant alors retourné à la place de la vue.
+    """
+    
+    
+    def __init__(self, class_ : type, columns : tuple, rows : list) -> None:
+        """Constructeur de la classe.
+
+        Args:
+            class_ (type): Classe du modèle.
+            columns (tuple): Noms des colonnes des lignes, dans l'ordre du curseur.
+            rows (list): Lignes brutes du résultat.
+        """
+        metadata = Metadata.of(class_)
+        defaults = metadata.getDefaults()
+        index = {}
+        for position, column in enumerate(columns):
+            if column in defaults:
+                index[column] = position
+            elif f'_{column}' in defaults:
+                index[f'_{column}'] = position
+        self.__class = class_
+        self.__columns = tuple(columns)
+        self.__rows = rows
+        self.__index = index # type: dict[str, int] # Position de la valeur de chaque attribut dans une ligne.
+        self.__defaults = { attribute: value for attribute, value in defaults.items() if not attribute in index } # type: dict[str, Any] # Valeurs des attributs absents des lignes.
+        self.__converter = None # type: Converter # Convertisseur des lignes promues, créé à la première promotion.
+        self.__promoted = {} # type: dict[int, object] # Modèles promus par position de ligne.
+    
+    
+    def getClass(self) -> type:
+        """Retourne la classe du modèle.
+
+        Returns:
+            type: Classe du modèle.
+        """
+        return self.__class
+    
+    
+    def getColumns(self) -> tuple:
+        """Retourne les noms des colonnes des lignes.
+
+        Returns:
+            tuple: Noms des colonnes.
+        """
+        return self.__columns
+    
+    
+    def getRows(self) -> list:
+        """Retourne les lignes brutes du résultat.
+
+        Returns:
+            list: Lignes brutes.
+        """
+        return self.__rows
+    
+    
+    def getIndex(self) -> dict:
+        """Retourne la position de la valeur de chaque attribut dans une ligne.
+
+        Returns:
+            dict: Position par nom d'attribut.
+        """
+        return self.__index
+    
+    
+    def getDefaults(self) -> dict:
+        """Retourne les valeurs des attributs absents des lignes.
+
+        Returns:
+            dict: Valeur par nom d'attribut.
+        """
+        return self.__defaults
+    
+    
+    def getPromoted(self) -> list:
+        """Retourne les modèles promus, dans l'ordre des lignes.
+
+        Returns:
+            list: Modèles promus.
+        """
+        return [ self.__promoted[position] for position in sorted(self.__promoted) ]
+    
+    
+    def promote(self, position : int) -> object:
+        """Convertit une ligne en modèle, une seule fois par ligne.
+
+        Args:
+            position (int): Position de la ligne.
+
+        Returns:
+            object: Le modèle.
+        """
+        model = self.__promoted.get(position)
+        if model is None:
+            if self.__converter is None:
+                self.__converter = Converter(self.__class, self.__columns)
+            model = self.__converter.convertRow(self.__rows[position])
+            self.__promoted[position] = model
+        return model
+    
+    
+    def toModels(self) -> list:
+        """Convertit toutes les lignes en modèles.
+
+        Returns:
+            list: Modèles.
+        """
+        return [ self.promote(position) for position in range(len(self.__rows)) ]
+    
+    
+    def __len__(self) -> int:
+        """Retourne le nombre de lignes.
+
+        Returns:
+            int: Nombre de lignes.
+        """
+        return len(self.__rows)
+    
+    
+    def __getitem__(self, position : Union[int, slice]) -> Union[object, list]:
+        """Retourne la vue d'une ligne, ou son modèle si elle a été promue.
+
+        Args:
+            position (Union[int, slice]): Position de la ligne, ou tranche de positions.
+
+        Raises:
+            IndexError: La position est hors du résultat.
+
+        Returns:
+            Union[object, list]: Vue ou modèle, ou liste de vues ou modèles pour une tranche.
+        """
+        if type(position) is slice:
+            return [ self[index] for index in range(*position.indices(len(self.__rows))) ]
+        if position < 0:
+            position += len(self.__rows)
+        if not 0 <= position < len(self.__rows):
+            raise IndexError('Position de ligne hors du résultat !')
+        model = self.__promoted.get(position)
+        return RowView(self, position) if model is None else model
+    
+    
+    def __iter__(self) -> Iterator[object]:
+        """Parcourt les vues des lignes, ou leurs modèles si elles ont été promues.
+
+        Yields:
+            object: Vue ou modèle.
+        """
+        promoted = self.__promoted
+        for position in range(len(self.__rows)):
+            model = promoted.get(position)
+            yield RowView(self, position) if model is None else model
@@ -0,0 +1,117 @@
+import json
+from typing import Any
+
+from Pody.factory.repository.metadata import Metadata
+
+
+
+class RowView:
+    """Vue légère d'une ligne d'un RowSet, se lisant comme le modèle.
+    
+    Les attributs du modèle sont lus directement dans la ligne partagée. Une écriture, ou
+    l'appel d'une méthode du modèle (update, delete...), promeut la vue en modèle complet
+    (voir RowSet.promote) auquel elle délègue ensuite toutes les lectures et écritures.
+    """
+    
+    
+    __slots__ = ('__rows', '__position', '__row', '__model') # type: tuple # Résultat, position et ligne de la vue, modèle promu.
+    
+    
+    def __init__(self, rows : Any, position : int) -> None:
+        """Constructeur de la classe.
+
+        Args:
+            rows (RowSet): Le résultat de la ligne.
+            position (int): La position de la ligne.
+        """
+        object.__setattr__(self, '_RowView__rows', rows)
+        object.__setattr__(self, '_RowView__position', position)
+        object.__setattr__(self, '_RowView__row', rows.getRows()[position])
+        object.__setattr__(self, '_RowView__model', None)
+    
+    
+    def isPromoted(self) -> bool:
+        """Indique si la vue a été promue en modèle.
+
+        Returns:
+            bool: La vue a été promue.
+        """
+        return not self.__model is None
+    
+    
+    def toModel(self) -> object:
+        """Promeut la vue en modèle complet.
+
+        Returns:
+            object: Le modèle.
+        """
+        model = self.__model
+        if model is None:
+            model = self.__rows.promote(self.__position)
+            object.__setattr__(self, '_RowView__model', model)
+        return model
+    
+    
+    def toDict(self) -> dict:
+        """Retourne les valeurs des attributs, sans promouvoir la vue.
+
+        Returns:
+            dict: Valeur par nom d'attribut.
+        """
+        if not self.__model is None:
+            return Metadata.of(self.__rows.getClass()).toDict(self.__model)
+        row = self.__row
+        values = dict(self.__rows.getDefaults())
+        values.update((attribute, row[position]) for attribute, position in self.__rows.getIndex().items())
+        return values
+    
+    
+    def __getattr__(self, name : str) -> Any:
+        """Lit un attribut dans la ligne, ou dans le modèle promu.
+
+        Args:
+            name (str): Nom de l'attribut.
+
+        Raises:
+            AttributeError: L'attribut n'existe pas dans le modèle.
+
+        Returns:
+            Any: La valeur de l'attribut, ou la méthode du modèle promu.
+        """
+        if name.startswith('_RowView__'):
+            raise AttributeError(name)
+        model = self.__model
+        if not model is None:
+            return getattr(model, name)
+        rows = self.__rows
+        position = rows.getIndex().get(name)
+        if not position is None:
+            return self.__row[position]
+        defaults = rows.getDefaults()
+        if name in defaults:
+            return defaults[name]
+        if hasattr(rows.getClass(), name):
+            return getattr(self.toModel(), name)
+        raise AttributeError(f'Le modèle "{rows.getClass().__name__}" n\'a pas d\'attribut "{name}" !')
+    
+    
+    def __setattr__(self, name : str, value : Any) -> None:
+        """Écrit un attribut du modèle, en promouvant la vue.
+
+        Args:
+            name (str): Nom de l'attribut.
+            value (Any): Valeur de l'attribut.
+        """
+        if name.startswith('_RowView__'):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.toModel(), name, value)
+    
+    
+    def __str__(self) -> str:
+        """Retourne la vue au format JSON.
+
+        Returns:
+            str: Le JSON de la vue.
+        """
+        return json.dumps(self.toDict())
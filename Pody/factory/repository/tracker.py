@@ -0,0 +1,111 @@
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Optional
+
+from Pody.factory.repository.metadata import Metadata
+
+
+
+class Tracker:
+    """Suivi des modifications des modèles chargés depuis la base de données.
+    
+    Les valeurs lues sont conservées sans copie (la ligne brute du curseur) dans
+    l'emplacement "__pody__" déclaré par la classe Model, hors du dictionnaire des
+    attributs, afin de n'envoyer que les attributs modifiés lors d'une mise à jour.
+    Une valeur modifiable en place (bytearray, dict, list...) ne pouvant être comparée
+    à la valeur chargée qu'elle partage, ses attributs sont toujours envoyés.
+    """
+    
+    
+    SLOT = '__pody__' # type: str # Nom de l'emplacement des valeurs chargées.
+    IMMUTABLES = (type(None), bool, int, float, Decimal, str, bytes, datetime, date, time, timedelta) # type: tuple # Types des valeurs non modifiables en place, comparées à la valeur chargée.
+    
+    
+    @staticmethod
+    def isTrackable(class_ : type) -> bool:
+        """Indique si une classe déclare l'emplacement des valeurs chargées.
+
+        Args:
+            class_ (type): La classe du modèle.
+
+        Returns:
+            bool: Les modèles de la classe peuvent être suivis.
+        """
+        return hasattr(class_, Tracker.SLOT)
+    
+    
+    @staticmethod
+    def track(model : object, attributes : tuple, values : tuple) -> None:
+        """Mémorise les valeurs chargées d'un modèle.
+
+        Args:
+            model (object): Le modèle.
+            attributes (tuple): Les noms des attributs chargés.
+            values (tuple): Les valeurs chargées, dans l'ordre des attributs.
+        """
+        model.__pody__ = (attributes, values)
+    
+    
+    @staticmethod
+    def snapshot(model : object) -> None:
+        """Mémorise les valeurs courantes de tous les attributs d'un modèle, après son écriture en base.
+
+        Args:
+            model (object): Le modèle.
+        """
+        if Tracker.isTrackable(model.__class__):
+            metadata = Metadata.of(model.__class__)
+            model.__pody__ = (metadata.getAttributes(), metadata.getValues(model))
+    
+    
+    @staticmethod
+    def isTracked(model : object) -> bool:
+        """Indique si les valeurs chargées d'un modèle sont connues.
+
+        Args:
+            model (object): Le modèle.
+
+        Returns:
+            bool: Le modèle est suivi.
+        """
+        return not getattr(model, Tracker.SLOT, None) is None
+    
+    
+    @staticmethod
+    def getChanges(model : object) -> Optional[tuple]:
+        """Retourne les attributs modifiés d'un modèle depuis son chargement.
+        
+        Les attributs non chargés sont considérés modifiés s'ils diffèrent de leur valeur par défaut,
+        ceux dont la valeur est modifiable en place (voir IMMUTABLES) le sont toujours.
+
+        Args:
+            model (object): Le modèle.
+
+        Returns:
+            Optional[tuple]: Noms des attributs modifiés, dans l'ordre des attributs du modèle, None si le modèle n'est pas suivi.
+        """
+        snapshot = getattr(model, Tracker.SLOT, None)
+        if snapshot is None:
+            return None
+        attributes, values = snapshot
+        metadata = Metadata.of(model.__class__)
+        loaded = dict(metadata.getDefaults())
+        loaded.update(zip(attributes, values))
+        immutables = Tracker.IMMUTABLES
+        changes = []
+        for attribute in metadata.getAttributes():
+            value = getattr(model, attribute)
+            if not type(value) in immutables or value != loaded[attribute]:
+                changes.append(attribute)
+        return tuple(changes)
+    
+    
+    @staticmethod
+    def forget(model : object) -> None:
+        """Oublie les valeurs chargées d'un modèle.
+
+        Args:
+            model (object): Le modèle.
+        """
+        if Tracker.isTrackable(model.__class__):
+            model.__pody__ = None
\ No newline at end of file
@@ -0,0 +1,16 @@
+
+
+class Statement:
+    """Enumération des types de requête précompilées d'un modèle.
+    """
+    
+    ALL = 'ALL'            # type: str # SELECT de toutes les lignes
+    SIZE = 'SIZE'          # type: str # COUNT de toutes les lignes
+    TRUNCATE = 'TRUNCATE'  # type: str # TRUNCATE TABLE
+    INSERT = 'INSERT'      # type: str # INSERT INTO
+    SELECT = 'SELECT'      # type: str # SELECT avec clause WHERE
+    EXISTS = 'EXISTS'      # type: str # SELECT 1 avec clause WHERE
+    COUNT = 'COUNT'        # type: str # COUNT avec clause WHERE
+    UPDATE = 'UPDATE'      # type: str # UPDATE avec clause WHERE
+    DELETE = 'DELETE'      # type: str # DELETE avec clause WHERE
+    PAGE = 'PAGE'          # type: str # SELECT d'une page ordonnée après une clé (keyset)
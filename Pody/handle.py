@@ -0,0 +1,458 @@
+import logging
+from time import monotonic, perf_counter
+from typing import Any, Dict, Iterator, Union
+
+from Pody.configuration import Configuration
+from Pody.driver.driver import Driver
+from Pody.factory.columnar import Columnar
+from Pody.factory.fetch import Fetch
+from Pody.factory.repository.converter import Converter
+from Pody.factory.repository.rowset import RowSet
+from Pody.hooks import Hooks
+from Pody.resultcache import ResultCache
+from Pody.statistics import Statistics
+
+
+
+class Handle:
+    """Socket de connexion à la base de données géré par un pool.
+    """
+    
+    
+    def __init__(self, configuration : Configuration) -> None:
+        """Constructeur de la classe.
+
+        Args:
+            configuration (Configuration): Objet de configuration de la connexion à la base de données.
+
+        Raises:
+            error: Erreur de connexion à la base de données.
+        """
+        self.__configuration = configuration
+        self.__results = ResultCache.of(configuration)
+        self.__statistics = Statistics.of(configuration)
+        self.__statement = None # type: str # Dernière requête exécutée, rapportée avec les lignes lues.
+        self.__written = set() # type: set[str] # Tables modifiées par la transaction en cours.
+        self.__pending = None # type: tuple # Requête lente dont le plan d'exécution est lu une fois son résultat abandonné.
+        self.__connection = Driver.connect(configuration)
+        self.__connection.autocommit = configuration.isAutocommit()
+        self.__cursor = self.__connection.cursor(
+            dictionary = False,
+            prepared = configuration.isPrepared(),
+            buffered = configuration.isBuffered()
+        )
+        self.__cursors = {} # type: dict[tuple, Any] # Curseurs secondaires par mode (préparé, tampon).
+        self.__active = self.__cursor
+        self.__maxpacket = None
+        self.__created = monotonic()
+        self.__used = self.__created
+        self.__session = {}
+    
+    
+    def getConfiguration(self) -> Configuration:
+        """Retourne l'objet de configuration du socket.
+
+        Returns:
+            Configuration: Objet de configuration de la connexion à la base de données.
+        """
+        return self.__configuration
+    
+    
+    def getConnection(self) -> Any:
+        """Retourne l'objet de connexion du socket.
+
+        Returns:
+            Any: Objet de connexion du pilote (voir Driver).
+        """
+        return self.__connection
+    
+    
+    def getCursor(self) -> Any:
+        """Retourne l'objet de curseur du socket ayant exécuté la dernière requête.
+
+        Returns:
+            Any: Objet de curseur du pilote (voir Driver).
+        """
+        return self.__active
+    
+    
+    def getCreated(self) -> float:
+        """Retourne la date de création du socket.
+
+        Returns:
+            float: Date de création (horloge monotone) en secondes.
+        """
+        return self.__created
+    
+    
+    def getUsed(self) -> float:
+        """Retourne la date de dernière utilisation du socket.
+
+        Returns:
+            float: Date de dernière utilisation (horloge monotone) en secondes.
+        """
+        return self.__used
+    
+    
+    def touch(self) -> None:
+        """Met à jour la date de dernière utilisation du socket.
+        """
+        self.__used = monotonic()
+    
+    
+    def isExpired(self, lifetime : float) -> bool:
+        """Vérifie si le socket a dépassé sa durée de vie.
+
+        Args:
+            lifetime (float): Durée de vie maximale en secondes.
+
+        Returns:
+            bool: True si le socket est expiré, False sinon.
+        """
+        return lifetime is not None and monotonic() - self.__created > lifetime
+    
+    
+    def isIdle(self, idletime : float) -> bool:
+        """Vérifie si le socket est inactif depuis trop longtemps.
+
+        Args:
+            idletime (float): Durée d'inactivité maximale en secondes.
+
+        Returns:
+            bool: True si le socket est inactif, False sinon.
+        """
+        return idletime is not None and monotonic() - self.__used > idletime
+    
+    
+    def ping(self) -> bool:
+        """Vérifie que le socket est toujours connecté au serveur.
+
+        Returns:
+            bool: True si le socket répond, False sinon.
+        """
+        try:
+            self.__connection.ping(reconnect = False)
+            return True
+        except Driver.ERRORS as error:
+            logging.warning(f'Le socket ne répond plus : {error}')
+            return False
+    
+    
+    def isBroken(self, error : Exception) -> bool:
+        """Indique si une erreur a rendu le socket inutilisable, la connexion au serveur étant perdue.
+        
+        Les erreurs de la requête elle-même (doublon, syntaxe...) laissent le socket
+        et sa transaction en cours utilisables.
+
+        Args:
+            error (Exception): Erreur levée par le socket.
+
+        Returns:
+            bool: True si le socket doit être fermé, False sinon.
+        """
+        return isinstance(error, Driver.DISCONNECTS) and not self.ping()
+    
+    
+    def applySession(self, session : dict) -> None:
+        """Applique les variables de session sur le socket si elles ont changé.
+
+        Args:
+            session (dict): Variables de session à appliquer.
+        """
+        for name, value in session.items():
+            if self.__session.get(name) != value:
+                self.__cursor.execute(f'SET {name} = {value}')
+                self.__session[name] = value
+    
+    
+    def execute(self, sql : str, parameters : tuple = (), stream : bool = False, plain : bool = False) -> None:
+        """Exécute une requête SQL sur le socket.
+
+        Si le premier paramètre est un tuple, la requête est exécutée pour chaque
+        tuple de paramètres par paquets limités à la taille maximale des paquets.
+
+        Args:
+            sql (str): Requête SQL.
+            parameters (tuple, optional): Liste des paramètres de la requête. Par défaut, la liste est vide.
+            stream (bool, optional): Exécute la requête sur un curseur non mis en mémoire tampon, dont les lignes restent sur le serveur jusqu'à leur lecture. Par défaut False.
+            plain (bool, optional): Exécute la requête sur un curseur non préparé, les paramètres étant insérés dans le texte de la requête. Par défaut False.
+        """
+        self.reset()
+        configuration = self.__configuration
+        cursor = self.__cursorFor(
+            configuration.isPrepared() and not plain,
+            configuration.isBuffered() and not stream)
+        self.__active = cursor
+        statistics = self.__statistics
+        event = Hooks.emit(Hooks.BEFORE_EXECUTE, sql = sql, parameters = parameters, handle = self) if Hooks.isEnabled() else None
+        timed = not statistics is None or not event is None
+        self.__statement = sql
+        if timed:
+            start = perf_counter()
+        count = len(parameters)
+        try:
+            if count == 0 or type(parameters[0]) is not tuple:
+                cursor.execute(sql, parameters)
+            else:
+                size = self.__configuration.getMaxpacket()
+                lenght = max(1, round(size / len(parameters[0])))
+                for x in range(0, count, lenght):
+                    cursor.executemany(sql, parameters[x:x+lenght])
+        except Driver.ERRORS as error:
+            if timed:
+                seconds = perf_counter() - start
+                if not statistics is None:
+                    statistics.record(sql, parameters, seconds, True)
+                if not event is None:
+                    Hooks.emit(Hooks.ON_ERROR, event, seconds = seconds, error = error)
+            raise
+        if timed:
+            seconds = perf_counter() - start
+            if not statistics is None:
+                slow = statistics.record(sql, parameters, seconds)
+                if not slow is None:
+                    self.__pending = (slow, sql, parameters)
+            if not event is None:
+                Hooks.emit(Hooks.AFTER_EXECUTE, event, seconds = seconds)
+        self.touch()
+        if not self.__results is None:
+            tables = self.__results.invalidateWith(sql)
+            if not tables is None and self.__connection.in_transaction:
+                self.__written.update(tables)
+    
+    
+    def fetch(self, fetch : str, class_ : type = None) -> Any:
+        """Récupère le résultat de la dernière requête exécutée sur le socket.
+
+        Args:
+            fetch (str): Mode de récupération du résultat (voir Fetch).
+            class_ (type, optional): Type des objets pour les modes Fetch.OBJECT, Fetch.OBJECTS et Fetch.VIEWS. Par défaut None.
+
+        Returns:
+            Any: Résultat de la requête selon le mode de récupération.
+        """
+        if fetch == Fetch.NONE:
+            return None
+        columns, rows = self.fetchRows(fetch)
+        return Handle.convert(fetch, columns, rows, class_)
+    
+    
+    def fetchRows(self, fetch : str) -> tuple:
+        """Récupère les lignes brutes du résultat de la dernière requête exécutée sur le socket.
+
+        Args:
+            fetch (str): Mode de récupération du résultat (voir Fetch), seule la première ligne étant lue pour Fetch.ONE, Fetch.CELL et Fetch.OBJECT.
+
+        Returns:
+            tuple: Noms des colonnes et liste des lignes.
+        """
+        cursor = self.__active
+        if fetch in (Fetch.ALL, Fetch.OBJECTS, Fetch.VIEWS):
+            rows = cursor.fetchall()
+        else:
+            row = cursor.fetchone()
+            rows = [] if row is None else [ row ]
+        if not self.__statistics is None:
+            self.__statistics.count(self.__statement, len(rows))
+        if Hooks.isEnabled():
+            Hooks.emit(Hooks.ON_FETCH, sql = self.__statement, handle = self, rows = len(rows))
+        return (tuple(cursor.column_names), rows)
+    
+    
+    @staticmethod
+    def convert(fetch : str, columns : tuple, rows : list, class_ : type = None) -> Any:
+        """Convertit des lignes brutes selon un mode de récupération.
+
+        Args:
+            fetch (str): Mode de récupération du résultat (voir Fetch).
+            columns (tuple): Noms des colonnes.
+            rows (list): Lignes brutes.
+            class_ (type, optional): Type des objets pour les modes Fetch.OBJECT, Fetch.OBJECTS et Fetch.VIEWS. Par défaut None.
+
+        Returns:
+            Any: Résultat de la requête selon le mode de récupération.
+        """
+        if fetch == Fetch.ALL:
+            return [ dict(zip(columns, r)) for r in rows ]
+        elif fetch == Fetch.ONE:
+            return dict(zip(columns, rows[0])) if len(rows) > 0 else None
+        elif fetch == Fetch.CELL:
+            return rows[0][0] if len(rows) > 0 else None
+        elif fetch == Fetch.OBJECTS:
+            return Converter(class_, columns).convertRows(rows)
+        elif fetch == Fetch.OBJECT:
+            return Converter(class_, columns).convertRow(rows[0]) if len(rows) > 0 else None
+        elif fetch == Fetch.VIEWS:
+            return RowSet(class_, columns, rows)
+        else:
+            return None
+    
+    
+    def begin(self) -> None:
+        """Démarre une transaction si aucune n'est en cours.
+        """
+        if not self.__connection.in_transaction:
+            self.__connection.start_transaction()
+    
+    
+    def commit(self) -> None:
+        """Valide la transaction en cours et invalide les résultats en cache des tables qu'elle a modifiées.
+        """
+        self.__connection.commit()
+        if len(self.__written) > 0:
+            self.__results.invalidate(tuple(self.__written))
+            self.__written.clear()
+    
+    
+    def rollback(self) -> None:
+        """Annule la transaction en cours.
+        """
+        self.__connection.rollback()
+        self.__written.clear()
+    
+    
+    def getMaxAllowedPacket(self) -> int:
+        """Retourne la taille maximale d'un paquet acceptée par le serveur, lue une seule fois par socket.
+
+        Si elle ne peut être lue, la taille maximale des paquets de la configuration est utilisée.
+
+        Returns:
+            int: Taille maximale d'un paquet en octets.
+        """
+        if self.__maxpacket is None:
+            try:
+                self.execute('SELECT @@max_allowed_packet', (), False, True)
+                self.__maxpacket = int(self.fetch(Fetch.CELL))
+            except Driver.ERRORS + (TypeError, ValueError) as error:
+                logging.warning(f'Impossible de lire la taille maximale des paquets du serveur : {error}')
+                self.__maxpacket = self.__configuration.getMaxpacket()
+        return self.__maxpacket
+    
+    
+    def iterate(self, batch : int = 1000, class_ : type = None) -> Iterator[Union[Dict, object]]:
+        """Parcourt le résultat de la dernière requête par lots de lignes.
+
+        Args:
+            batch (int, optional): Nombre de lignes lues à chaque échange avec le serveur. Par défaut 1000.
+            class_ (type, optional): Type des objets à produire, None pour des dictionnaires. Par défaut None.
+
+        Yields:
+            Union[Dict, object]: Ligne ou objet du résultat.
+        """
+        cursor = self.__active
+        columns = cursor.column_names
+        converter = None if class_ is None else Converter(class_, columns)
+        statistics, statement = self.__statistics, self.__statement
+        while True:
+            rows = cursor.fetchmany(batch)
+            if not rows:
+                break
+            if not statistics is None:
+                statistics.count(statement, len(rows))
+            if Hooks.isEnabled():
+                Hooks.emit(Hooks.ON_FETCH, sql = statement, handle = self, rows = len(rows))
+            if converter is None:
+                for row in rows:
+                    yield dict(zip(columns, row))
+            else:
+                yield from converter.convertRows(rows)
+            self.touch()
+    
+    
+    def fetchColumns(self, types : dict = None, batch : int = 10000, numpy : bool = None) -> dict:
+        """Récupère le résultat de la dernière requête par lots, directement dans des colonnes typées (voir Columnar).
+
+        Args:
+            types (dict, optional): Type Python par nom de colonne, les autres étant déduits des valeurs. Par défaut None.
+            batch (int, optional): Nombre de lignes lues à chaque échange avec le serveur. Par défaut 10000.
+            numpy (bool, optional): Retourne des tableaux NumPy, None pour les utiliser s'ils sont installés. Par défaut None.
+
+        Returns:
+            dict: Colonne typée par nom de colonne.
+        """
+        cursor = self.__active
+        columnar = Columnar(tuple(cursor.column_names), types, numpy)
+        statistics, statement = self.__statistics, self.__statement
+        while True:
+            rows = cursor.fetchmany(batch)
+            if not rows:
+                break
+            if not statistics is None:
+                statistics.count(statement, len(rows))
+            if Hooks.isEnabled():
+                Hooks.emit(Hooks.ON_FETCH, sql = statement, handle = self, rows = len(rows))
+            columnar.append(rows)
+            self.touch()
+        return columnar.getColumns()
+    
+    
+    def reset(self) -> None:
+        """Abandonne le résultat non lu de la dernière requête, puis lit le plan d'exécution de celle-ci si elle était lente.
+        """
+        if self.__connection.unread_result:
+            self.__active.fetchall()
+        self.__active = self.__cursor
+        pending = self.__pending
+        if not pending is None:
+            self.__pending = None
+            slow, sql, parameters = pending
+            self.__statistics.setPlan(slow, self.__explain(sql, parameters))
+    
+    
+    def close(self) -> None:
+        """Ferme le socket.
+        """
+        try:
+            self.__cursor.close()
+            for cursor in self.__cursors.values():
+                cursor.close()
+            self.__connection.close()
+        except Driver.ERRORS as error:
+            logging.warning(f'Impossible de fermer proprement le socket : {error}')
+    
+    
+    def __explain(self, sql : str, parameters : tuple) -> tuple:
+        """Lit le plan d'exécution d'une requête sur le socket, dont le résultat a été abandonné.
+
+        La lecture est interne : ni crochets, ni statistiques, ni invalidation du cache des résultats.
+
+        Args:
+            sql (str): Requête SQL.
+            parameters (tuple): Liste des paramètres de la requête.
+
+        Returns:
+            tuple: Les lignes du plan d'exécution sous forme de dictionnaires, vide s'il n'a pas pu être lu.
+        """
+        if len(parameters) > 0 and type(parameters[0]) is tuple:
+            parameters = parameters[0]
+        cursor = self.__cursorFor(False, True)
+        try:
+            cursor.execute(f'EXPLAIN {sql}', parameters)
+            return tuple(Handle.convert(Fetch.ALL, tuple(cursor.column_names), cursor.fetchall()))
+        except Driver.ERRORS as error:
+            logging.warning(f'Impossible de lire le plan d\'exécution de la requête lente : {error}')
+            return ()
+    
+    
+    def __cursorFor(self, prepared : bool, buffered : bool) -> Any:
+        """Retourne le curseur du socket correspondant au mode demandé, en le créant si besoin.
+
+        Args:
+            prepared (bool): Curseur de requêtes préparées.
+            buffered (bool): Curseur mis en mémoire tampon.
+
+        Returns:
+            Any: Curseur correspondant.
+        """
+        configuration = self.__configuration
+        if prepared == configuration.isPrepared() and buffered == configuration.isBuffered():
+            return self.__cursor
+        cursor = self.__cursors.get((prepared, buffered))
+        if cursor is None:
+            cursor = self.__connection.cursor(
+                dictionary = False,
+                prepared = prepared,
+                buffered = buffered
+            )
+            self.__cursors[(prepared, buffered)] = cursor
+        return cursor
@@ -0,0 +1,126 @@
+import logging
+import threading
+from typing import Callable, Optional
+
+
+
+class Hooks:
+    """Registre des fonctions appelées lors de l'exécution des requêtes et des emprunts de sockets.
+    
+    Chaque fonction reçoit un dictionnaire décrivant l'événement. Le même dictionnaire est
+    transmis aux fonctions BEFORE_EXECUTE puis AFTER_EXECUTE ou ON_ERROR d'une même requête,
+    une fonction peut donc y déposer une valeur (une trace, un chronomètre...) pour la suivante.
+    Une exception levée par une fonction est journalisée sans interrompre la requête.
+    
+    Tant qu'aucune fonction n'est enregistrée, le coût pour chaque requête se limite à
+    un appel de isEnabled.
+    """
+    
+    
+    BEFORE_EXECUTE = 'before_execute' # type: str # Avant l'exécution d'une requête : sql, parameters, handle.
+    AFTER_EXECUTE = 'after_execute' # type: str # Après l'exécution d'une requête : sql, parameters, handle, seconds.
+    ON_ERROR = 'on_error' # type: str # Après l'échec d'une requête : sql, parameters, handle, seconds, error.
+    ON_FETCH = 'on_fetch' # type: str # Après la lecture de lignes d'un résultat : sql, handle, rows.
+    ON_BORROW = 'on_borrow' # type: str # Après l'emprunt d'un socket au pool : pool, handle, seconds.
+    ON_RELEASE = 'on_release' # type: str # Après le retour d'un socket au pool : pool, handle, broken.
+    
+    __hooks = {} # type: dict[str, tuple] # Fonctions enregistrées par événement.
+    __enabled = False # type: bool # Au moins une fonction est enregistrée.
+    __lock = threading.Lock() # type: threading.Lock # Verrou du registre.
+    
+    
+    @classmethod
+    def register(cls, event : str, function : Callable = None) -> Callable:
+        """Enregistre une fonction appelée à chaque événement, utilisable comme décorateur.
+
+        Args:
+            event (str): L'événement (voir les constantes de la classe).
+            function (Callable, optional): La fonction recevant le dictionnaire de l'événement. Par défaut None pour un décorateur.
+
+        Raises:
+            Exception: L'événement n'existe pas.
+
+        Returns:
+            Callable: La fonction, ou le décorateur si elle n'est pas donnée.
+        """
+        if not event in cls.getEvents():
+            raise Exception(f'L\'événement "{event}" n\'existe pas !')
+        if function is None:
+            return lambda function: cls.register(event, function)
+        with cls.__lock:
+            cls.__hooks[event] = cls.__hooks.get(event, ()) + (function,)
+            cls.__enabled = True
+        return function
+    
+    
+    @classmethod
+    def unregister(cls, event : str, function : Callable) -> None:
+        """Retire une fonction enregistrée.
+
+        Args:
+            event (str): L'événement.
+            function (Callable): La fonction.
+        """
+        with cls.__lock:
+            cls.__hooks[event] = tuple(hook for hook in cls.__hooks.get(event, ()) if hook != function)
+            cls.__enabled = any(len(hooks) > 0 for hooks in cls.__hooks.values())
+    
+    
+    @classmethod
+    def clear(cls, event : str = None) -> None:
+        """Retire les fonctions enregistrées.
+
+        Args:
+            event (str, optional): L'événement, None pour tous les événements. Par défaut None.
+        """
+        with cls.__lock:
+            if event is None:
+                cls.__hooks.clear()
+            else:
+                cls.__hooks.pop(event, None)
+            cls.__enabled = any(len(hooks) > 0 for hooks in cls.__hooks.values())
+    
+    
+    @classmethod
+    def getEvents(cls) -> tuple:
+        """Retourne la liste des événements.
+
+        Returns:
+            tuple: Noms des événements.
+        """
+        return (cls.BEFORE_EXECUTE, cls.AFTER_EXECUTE, cls.ON_ERROR, cls.ON_FETCH, cls.ON_BORROW, cls.ON_RELEASE)
+    
+    
+    @classmethod
+    def isEnabled(cls) -> bool:
+        """Indique si au moins une fonction est enregistrée.
+
+        Returns:
+            bool: Des fonctions sont enregistrées.
+        """
+        return cls.__enabled
+    
+    
+    @classmethod
+    def emit(cls, event : str, values : Optional[dict] = None, **others) -> dict:
+        """Appelle les fonctions enregistrées pour un événement.
+
+        Args:
+            event (str): L'événement.
+            values (Optional[dict], optional): Le dictionnaire de l'événement précédent de la même requête, complété puis transmis. Par défaut None.
+            others: Valeurs décrivant l'événement.
+
+        Returns:
+            dict: Le dictionnaire transmis aux fonctions.
+        """
+        if values is None:
+            values = others
+        else:
+            values.update(others)
+        values['event'] = event
+        for hook in cls.__hooks.get(event, ()):
+            try:
+                hook(values)
+            except Exception as error:
+                logging.warning(f'Erreur de la fonction de l\'événement "{event}" : {error}')
+        return values
@@ -0,0 +1,65 @@
+import logging
+
+from Pody.handle import Handle
+from Pody.pool import Pool
+
+
+
+class Pin:
+    """Attache d'un socket du pool à un thread.
+    
+    La connexion conserve une attache par thread dans son stockage local, détruit à la
+    fin du thread : le socket encore attaché (transaction non validée, résultat non lu)
+    est alors annulé et rendu au pool au lieu d'être perdu.
+    """
+    
+    
+    __slots__ = ('__pool', '__handle') # type: tuple # Pool et socket attaché.
+    
+    
+    def __init__(self, pool : Pool) -> None:
+        """Constructeur de la classe.
+
+        Args:
+            pool (Pool): Pool des sockets.
+        """
+        self.__pool = pool
+        self.__handle = None
+    
+    
+    def getHandle(self) -> Handle:
+        """Retourne le socket attaché au thread.
+
+        Returns:
+            Handle: Socket attaché, None si aucun.
+        """
+        return self.__handle
+    
+    
+    def setHandle(self, handle : Handle) -> None:
+        """Attache un socket au thread, ou le détache.
+
+        Args:
+            handle (Handle): Socket à attacher, None pour le détacher.
+        """
+        self.__handle = handle
+    
+    
+    def __del__(self) -> None:
+        """Annule la transaction du socket encore attaché à la fin du thread et le rend au pool.
+        """
+        handle = self.__handle
+        if handle is None:
+            return
+        self.__handle = None
+        broken = False
+        try:
+            handle.reset()
+            handle.rollback()
+        except Exception as error:
+            logging.warning(f'Impossible d\'annuler la transaction du socket d\'un thread terminé : {error}')
+            broken = True
+        try:
+            self.__pool.release(handle, broken)
+        except Exception as error:
+            logging.warning(f'Impossible de rendre au pool le socket d\'un thread terminé : {error}')
@@ -0,0 +1,284 @@
+import logging
+import threading
+from collections import deque
+from time import monotonic
+
+from Pody.configuration import Configuration
+from Pody.handle import Handle
+from Pody.hooks import Hooks
+
+
+
+class Pool:
+    """Pool de sockets de connexion à la base de données.
+    """
+    
+    
+    def __init__(self, configuration : Configuration) -> None:
+        """Constructeur de la classe. Ouvre le nombre minimum de sockets.
+
+        Args:
+            configuration (Configuration): Objet de configuration de la connexion à la base de données.
+
+        Raises:
+            error: Erreur de connexion à la base de données.
+        """
+        self.__configuration = configuration
+        self.__condition = threading.Condition()
+        self.__idle = deque() # type: deque[Handle] # Sockets disponibles, le plus récent à droite.
+        self.__session = {} # type: dict[str, str] # Variables de session appliquées à chaque socket.
+        self.__size = 0
+        self.__closed = False
+        self.__stats = {
+            'created': 0,
+            'closed': 0,
+            'borrowed': 0,
+            'released': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'evicted': 0,
+            'expired': 0,
+            'broken': 0
+        }
+        try:
+            for _ in range(configuration.getPoolmin()):
+                self.__idle.append(self.__open())
+                self.__size += 1
+        except Exception:
+            for handle in self.__idle:
+                handle.close()
+            raise
+    
+    
+    def getConfiguration(self) -> Configuration:
+        """Retourne l'objet de configuration du pool.
+
+        Returns:
+            Configuration: Objet de configuration de la connexion à la base de données.
+        """
+        return self.__configuration
+    
+    
+    def getStats(self) -> dict:
+        """Retourne les statistiques du pool.
+
+        Returns:
+            dict: Compteurs du pool ainsi que le nombre de sockets ouverts, libres et empruntés.
+        """
+        with self.__condition:
+            stats = dict(self.__stats)
+            stats['size'] = self.__size
+            stats['idle'] = len(self.__idle)
+            stats['inuse'] = self.__size - len(self.__idle)
+            stats['min'] = self.__configuration.getPoolmin()
+            stats['max'] = self.__configuration.getPoolmax()
+        return stats
+    
+    
+    def getSession(self) -> dict:
+        """Retourne les variables de session appliquées à tous les sockets du pool.
+
+        Returns:
+            dict: Variables de session.
+        """
+        return self.__session
+    
+    
+    def setSession(self, name : str, value : str) -> None:
+        """Définit une variable de session appliquée à tous les sockets du pool.
+
+        Args:
+            name (str): Nom de la variable.
+            value (str): Valeur de la variable.
+        """
+        with self.__condition:
+            self.__session = { **self.__session, name: value }
+    
+    
+    def borrow(self) -> Handle:
+        """Emprunte un socket au pool, en ouvre un nouveau si besoin.
+
+        Raises:
+            Exception: Le pool est fermé ou aucun socket ne s'est libéré à temps.
+
+        Returns:
+            Handle: Socket emprunté.
+        """
+        configuration = self.__configuration
+        timeout = configuration.getPooltimeout()
+        begin = monotonic()
+        deadline = None if timeout is None else begin + timeout
+        while True:
+            handle = None
+            evicted = []
+            try:
+                with self.__condition:
+                    if self.__closed:
+                        raise Exception(f'Le pool de la base de données "{configuration.getDatabase()}" est fermé !')
+                    evicted = self.__evictLocked()
+                    while not self.__idle and self.__size >= configuration.getPoolmax():
+                        self.__stats['waits'] += 1
+                        remaining = None if deadline is None else deadline - monotonic()
+                        if remaining is not None and remaining <= 0:
+                            self.__stats['timeouts'] += 1
+                            raise Exception(f'Aucun socket libre dans le pool de la base de données "{configuration.getDatabase()}" !')
+                        self.__condition.wait(remaining)
+                        if self.__closed:
+                            raise Exception(f'Le pool de la base de données "{configuration.getDatabase()}" est fermé !')
+                    if self.__idle:
+                        handle = self.__idle.pop()
+                    else:
+                        self.__size += 1
+                    session = self.__session
+            finally:
+                for closed in evicted:
+                    closed.close()
+            if handle is None:
+                try:
+                    handle = self.__open()
+                except Exception:
+                    self.__discard(None)
+                    raise
+            elif not self.__validate(handle):
+                self.__discard(handle)
+                continue
+            handle.applySession(session)
+            with self.__condition:
+                self.__stats['borrowed'] += 1
+            if Hooks.isEnabled():
+                Hooks.emit(Hooks.ON_BORROW, pool = self, handle = handle, seconds = monotonic() - begin)
+            return handle
+    
+    
+    def release(self, handle : Handle, broken : bool = False) -> None:
+        """Rend un socket au pool, après avoir abandonné son résultat non lu et annulé sa transaction en cours.
+
+        Args:
+            handle (Handle): Socket à rendre.
+            broken (bool, optional): Indique que le socket est inutilisable et doit être fermé. Par défaut False.
+        """
+        if not broken:
+            try:
+                handle.reset()
+                if handle.getConnection().in_transaction:
+                    handle.rollback()
+            except Exception as error:
+                logging.warning(f'Impossible de réinitialiser le socket : {error}')
+                broken = True
+        if broken or self.__closed or handle.isExpired(self.__configuration.getLifetime()):
+            if broken:
+                with self.__condition:
+                    self.__stats['broken'] += 1
+            self.__discard(handle)
+        else:
+            handle.touch()
+            with self.__condition:
+                self.__stats['released'] += 1
+                self.__idle.append(handle)
+                self.__condition.notify()
+        if Hooks.isEnabled():
+            Hooks.emit(Hooks.ON_RELEASE, pool = self, handle = handle, broken = broken)
+    
+    
+    def evict(self) -> None:
+        """Ferme les sockets libres inactifs ou expirés en conservant le nombre minimum de sockets.
+        """
+        with self.__condition:
+            evicted = self.__evictLocked()
+        for handle in evicted:
+            handle.close()
+    
+    
+    def close(self) -> None:
+        """Ferme tous les sockets libres du pool, les sockets empruntés seront fermés à leur retour.
+        """
+        with self.__condition:
+            self.__closed = True
+            handles = list(self.__idle)
+            self.__idle.clear()
+            self.__size -= len(handles)
+            self.__stats['closed'] += len(handles)
+            self.__condition.notify_all()
+        for handle in handles:
+            handle.close()
+    
+    
+    def __open(self) -> Handle:
+        """Ouvre un nouveau socket.
+
+        Returns:
+            Handle: Nouveau socket.
+        """
+        handle = Handle(self.__configuration)
+        with self.__condition:
+            self.__stats['created'] += 1
+        return handle
+    
+    
+    def __validate(self, handle : Handle) -> bool:
+        """Vérifie qu'un socket libre est encore utilisable avant de l'emprunter.
+
+        Args:
+            handle (Handle): Socket à vérifier.
+
+        Returns:
+            bool: True si le socket est utilisable, False sinon.
+        """
+        configuration = self.__configuration
+        if handle.isExpired(configuration.getLifetime()):
+            with self.__condition:
+                self.__stats['expired'] += 1
+            return False
+        ping = configuration.getPing()
+        if ping is not None and handle.isIdle(ping) and not handle.ping():
+            with self.__condition:
+                self.__stats['broken'] += 1
+            return False
+        return True
+    
+    
+    def __discard(self, handle : Handle) -> None:
+        """Retire un socket du pool et le ferme.
+
+        Args:
+            handle (Handle): Socket à fermer, None si l'ouverture a échoué.
+        """
+        with self.__condition:
+            self.__size -= 1
+            if handle is not None:
+                self.__stats['closed'] += 1
+            self.__condition.notify()
+        if handle is not None:
+            handle.close()
+    
+    
+    def __evictLocked(self) -> list:
+        """Retire du pool les sockets libres inactifs ou expirés, le verrou doit être détenu.
+        
+        Les sockets retirés sont à fermer une fois le verrou relâché, leur fermeture
+        échangeant avec le serveur.
+
+        Returns:
+            list: Sockets retirés, à fermer.
+        """
+        configuration = self.__configuration
+        idletime = configuration.getIdletime()
+        lifetime = configuration.getLifetime()
+        minimum = configuration.getPoolmin()
+        kept = deque()
+        evicted = []
+        # Les sockets les plus anciennement utilisés sont à gauche.
+        while self.__idle:
+            handle = self.__idle.popleft()
+            if handle.isExpired(lifetime):
+                self.__stats['expired'] += 1
+            elif handle.isIdle(idletime) and self.__size > minimum:
+                self.__stats['evicted'] += 1
+            else:
+                kept.append(handle)
+                continue
+            self.__size -= 1
+            self.__stats['closed'] += 1
+            evicted.append(handle)
+        self.__idle = kept
+        return evicted
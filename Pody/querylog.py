@@ -0,0 +1,116 @@
+import logging
+import random
+import threading
+from time import monotonic
+from typing import Any
+
+from Pody.configuration import Configuration
+
+
+
+class QueryLog:
+    """Journal des requêtes exécutées d'une connexion.
+    
+    Le détail des requêtes est écrit sur le logger "Pody.query", formaté uniquement si
+    le niveau INFO y est actif et pour une fraction tirée au sort des requêtes. Le mode
+    résumé écrit périodiquement sur le logger "Pody.summary" une ligne de synthèse
+    (nombre de requêtes, erreurs, durées), même si le détail est désactivé.
+    """
+    
+    
+    LOGGER = logging.getLogger('Pody.query') # type: logging.Logger # Logger du détail des requêtes.
+    SUMMARY = logging.getLogger('Pody.summary') # type: logging.Logger # Logger du résumé des requêtes.
+    
+    
+    def __init__(self, configuration : Configuration) -> None:
+        """Constructeur de la classe.
+
+        Args:
+            configuration (Configuration): Objet de configuration de la connexion à la base de données.
+        """
+        self.__sample = configuration.getLogsample()
+        self.__interval = configuration.getLogsummary()
+        self.__timer = configuration.hasTimer()
+        self.__lock = threading.Lock()
+        self.__count = 0 # type: int # Requêtes exécutées depuis le dernier résumé.
+        self.__errors = 0 # type: int # Requêtes en erreur depuis le dernier résumé.
+        self.__seconds = 0.0 # type: float # Durée cumulée des requêtes depuis le dernier résumé.
+        self.__slowest = 0.0 # type: float # Durée de la requête la plus lente depuis le dernier résumé.
+        self.__since = monotonic() # type: float # Date du dernier résumé.
+    
+    
+    def isTimed(self) -> bool:
+        """Indique si la durée des requêtes doit être mesurée.
+
+        Returns:
+            bool: Le chronomètre ou le résumé est activé.
+        """
+        return self.__timer or self.__interval > 0
+    
+    
+    def isDetailed(self) -> bool:
+        """Indique si le détail de la requête à exécuter doit être journalisé.
+
+        Returns:
+            bool: Le niveau INFO est actif et la requête fait partie de l'échantillon.
+        """
+        if not QueryLog.LOGGER.isEnabledFor(logging.INFO):
+            return False
+        sample = self.__sample
+        return sample >= 1.0 or (sample > 0.0 and random.random() < sample)
+    
+    
+    def start(self, query : Any, parameters : tuple) -> None:
+        """Journalise le début de l'exécution d'une requête.
+
+        Args:
+            query (Any): Objet de requête.
+            parameters (tuple): Liste des paramètres de la requête.
+        """
+        QueryLog.LOGGER.info('Exécution de la requête "%s"...', query)
+        if len(parameters) == 0 or type(parameters[0]) is not tuple:
+            QueryLog.LOGGER.info('Paramètres de la requête "%s"...', parameters)
+        else:
+            QueryLog.LOGGER.info('Exécution multiple, paramètres non affichables...')
+    
+    
+    def finish(self, seconds : float, detailed : bool, failed : bool = False) -> None:
+        """Journalise la fin de l'exécution d'une requête et la compte dans le résumé.
+
+        Args:
+            seconds (float): Durée de la requête en secondes, ignorée si elle n'est pas mesurée.
+            detailed (bool): Le détail de la requête est journalisé (voir isDetailed).
+            failed (bool, optional): La requête a échoué. Par défaut False.
+        """
+        if detailed and not failed:
+            QueryLog.LOGGER.info('Exécution de la requête terminée.')
+            if self.__timer:
+                QueryLog.LOGGER.info('Temps d\'exécution de la requête : %s secondes.', round(seconds, 3))
+        if self.__interval > 0:
+            self.__record(seconds, failed)
+    
+    
+    def __record(self, seconds : float, failed : bool) -> None:
+        """Compte une requête dans le résumé, et écrit celui-ci si l'intervalle est écoulé.
+
+        Args:
+            seconds (float): Durée de la requête en secondes.
+            failed (bool): La requête a échoué.
+        """
+        with self.__lock:
+            self.__count += 1
+            self.__seconds += seconds
+            if failed:
+                self.__errors += 1
+            if seconds > self.__slowest:
+                self.__slowest = seconds
+            now = monotonic()
+            elapsed = now - self.__since
+            if elapsed < self.__interval:
+                return
+            count, errors, total, slowest = self.__count, self.__errors, self.__seconds, self.__slowest
+            self.__count, self.__errors, self.__seconds, self.__slowest = 0, 0, 0.0, 0.0
+            self.__since = now
+        QueryLog.SUMMARY.info(
+            '%d requêtes en %.1f secondes (%.1f par seconde), %d erreurs, durée moyenne %.6f secondes, maximale %.6f secondes.',
+            count, elapsed, count / elapsed, errors, total / count, slowest)
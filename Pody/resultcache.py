@@ -0,0 +1,231 @@
+import re
+import sys
+import threading
+from functools import lru_cache
+from typing import Any, Optional
+
+from Pody.cache import Cache
+from Pody.configuration import Configuration
+
+
+
+class ResultCache:
+    """Cache des résultats des requêtes de lecture, partagé par toutes les connexions d'une même base de données.
+    
+    Chaque table possède un numéro de version incrémenté à chaque écriture passant par
+    Pody. Un résultat est enregistré avec les versions de ses tables relevées avant
+    l'exécution de la requête, et n'est plus servi dès que l'une d'elles a changé.
+    """
+    
+    
+    MISS = None # type: None # Résultat absent du cache.
+    
+    __registry = {} # type: dict[str, ResultCache] # Caches de résultats par nom de base de données.
+    __lock = threading.Lock() # type: threading.Lock # Verrou du registre.
+    __readers = ('SELECT',) # type: tuple # Débuts des requêtes de lecture pouvant être mises en cache.
+    __neutrals = ('SELECT', 'SHOW', 'DESC', 'EXPLAIN', 'SET', 'USE', 'START', 'BEGIN', 'COMMIT', 'ROLLBACK') # type: tuple # Débuts des requêtes ne modifiant aucune table.
+    __tables = re.compile(
+        r'\b(?:FROM|JOIN|INTO|UPDATE|TABLE)\s+(?:TABLE\s+)?(?:IF\s+(?:NOT\s+)?EXISTS\s+)?(?:(?:LOW_PRIORITY|IGNORE)\s+)*'
+        r'(.*?)(?=\b(?:WHERE|SET|ON|USING|GROUP|ORDER|LIMIT|HAVING|VALUES|VALUE|SELECT|UNION|WINDOW|FOR|LOCK|PARTITION|'
+        r'JOIN|LEFT|RIGHT|INNER|CROSS|OUTER|NATURAL|STRAIGHT_JOIN|CHARACTER|FIELDS|COLUMNS|LINES)\b|[();]|$)',
+        re.IGNORECASE | re.DOTALL) # type: re.Pattern # Listes de tables suivant les mots clés.
+    __volatiles = re.compile(
+        r'@|\bINTO\b|\bFOR\s+(?:UPDATE|SHARE)\b|\bLOCK\s+IN\s+SHARE\s+MODE\b|\bCURRENT_(?:DATE|TIME|TIMESTAMP|USER)\b|'
+        r'\b(?:NOW|SYSDATE|CURDATE|CURTIME|UNIX_TIMESTAMP|UTC_DATE|UTC_TIME|UTC_TIMESTAMP|RAND|UUID|UUID_SHORT|'
+        r'LAST_INSERT_ID|FOUND_ROWS|ROW_COUNT|CONNECTION_ID|USER|SLEEP|GET_LOCK|RELEASE_LOCK)\s*\(',
+        re.IGNORECASE) # type: re.Pattern # Éléments rendant le résultat d'une lecture non reproductible.
+    
+    
+    @classmethod
+    def of(cls, configuration : Configuration) -> Optional['ResultCache']:
+        """Retourne le cache de résultats de la base de données, en le créant à la première demande.
+
+        Args:
+            configuration (Configuration): Objet de configuration de la connexion à la base de données.
+
+        Returns:
+            Optional[ResultCache]: Cache de résultats, None s'il est désactivé par la configuration.
+        """
+        if configuration.getResultcache() <= 0:
+            return None
+        database = configuration.getDatabase()
+        results = cls.__registry.get(database)
+        if results is None:
+            with cls.__lock:
+                results = cls.__registry.get(database)
+                if results is None:
+                    results = ResultCache(
+                        configuration.getResultcache(),
+                        configuration.getResultttl(),
+                        configuration.getResultbudget())
+                    cls.__registry[database] = results
+        return results
+    
+    
+    @staticmethod
+    @lru_cache(maxsize = 4096)
+    def parse(sql : str) -> tuple:
+        """Analyse une requête SQL.
+
+        Args:
+            sql (str): Requête SQL.
+
+        Returns:
+            tuple: Indique si le résultat peut être mis en cache, si la requête modifie des tables, et les noms des tables citées.
+        """
+        tables = set()
+        for match in ResultCache.__tables.finditer(sql):
+            for part in match.group(1).split(','):
+                words = part.split()
+                if len(words) > 0:
+                    tables.add(words[0].replace('`', '').split('.')[-1].lower())
+        start = sql.lstrip(' \t\r\n(').upper()
+        cacheable = start.startswith(ResultCache.__readers) and ResultCache.__volatiles.search(sql) is None
+        write = not start.startswith(ResultCache.__neutrals)
+        return (cacheable, write, tuple(sorted(tables)))
+    
+    
+    def __init__(self, size : int = 1024, ttl : float = 60.0, budget : int = 16777216) -> None:
+        """Constructeur de la classe.
+
+        Args:
+            size (int, optional): Nombre maximum de résultats en cache. Par défaut 1024.
+            ttl (float, optional): Durée de vie des résultats en secondes, None pour ne jamais expirer. Par défaut 60.
+            budget (int, optional): Taille mémoire maximale estimée des résultats en octets. Par défaut 16777216.
+        """
+        self.__cache = Cache(size, ttl, budget)
+        self.__versions = {} # type: dict[str, int] # Versions des tables.
+        self.__epoch = 0 # type: int # Version commune à toutes les tables.
+        self.__stale = 0 # type: int # Résultats ignorés suite à une écriture.
+    
+    
+    def getStats(self) -> dict:
+        """Retourne les statistiques du cache de résultats.
+
+        Returns:
+            dict: Statistiques du cache, ainsi que le nombre de résultats ignorés suite à une écriture.
+        """
+        stats = self.__cache.getStats()
+        stats['hits'] -= self.__stale
+        stats['misses'] += self.__stale
+        stats['stale'] = self.__stale
+        return stats
+    
+    
+    def prepare(self, sql : str, parameters : tuple, many : bool) -> Optional[tuple]:
+        """Prépare la recherche d'un résultat, en relevant les versions de ses tables avant l'exécution de la requête.
+
+        Args:
+            sql (str): Requête SQL.
+            parameters (tuple): Liste des paramètres de la requête.
+            many (bool): Indique que toutes les lignes du résultat sont récupérées.
+
+        Returns:
+            Optional[tuple]: Ticket de recherche, None si la requête ne peut être mise en cache.
+        """
+        cacheable, _, tables = ResultCache.parse(sql)
+        if not cacheable:
+            return None
+        try:
+            key = (sql, parameters, many)
+            hash(key)
+        except TypeError:
+            return None
+        return (key, tables, self.__versionsOf(tables))
+    
+    
+    def get(self, ticket : tuple) -> Any:
+        """Retourne le résultat d'une requête s'il est en cache et qu'aucune de ses tables n'a été modifiée depuis.
+
+        Args:
+            ticket (tuple): Ticket de recherche (voir prepare).
+
+        Returns:
+            Any: Le résultat, ResultCache.MISS s'il est absent.
+        """
+        key, tables, _ = ticket
+        entry = self.__cache.get(key)
+        if entry is None:
+            return ResultCache.MISS
+        result, versions = entry
+        if versions != self.__versionsOf(tables):
+            self.__stale += 1
+            self.__cache.invalidate(key)
+            return ResultCache.MISS
+        return result
+    
+    
+    def put(self, ticket : tuple, result : Any) -> None:
+        """Enregistre le résultat d'une requête avec les versions relevées avant son exécution.
+
+        Args:
+            ticket (tuple): Ticket de recherche (voir prepare).
+            result (Any): Le résultat.
+        """
+        key, _, versions = ticket
+        self.__cache.put(key, (result, versions), ResultCache.weigh(result))
+    
+    
+    def invalidate(self, tables : tuple = None) -> None:
+        """Invalide les résultats liés à des tables.
+
+        Args:
+            tables (tuple, optional): Noms des tables, None pour invalider tous les résultats. Par défaut None.
+        """
+        with self.__lock:
+            if tables is None or len(tables) == 0:
+                self.__epoch += 1
+            else:
+                for table in tables:
+                    self.__versions[table] = self.__versions.get(table, 0) + 1
+    
+    
+    def invalidateWith(self, sql : str) -> Optional[tuple]:
+        """Invalide les résultats liés aux tables modifiées par une requête.
+
+        Args:
+            sql (str): Requête SQL exécutée.
+
+        Returns:
+            Optional[tuple]: Noms des tables modifiées, None si la requête ne modifie aucune table.
+        """
+        _, write, tables = ResultCache.parse(sql)
+        if not write:
+            return None
+        self.invalidate(tables)
+        return tables
+    
+    
+    def clear(self) -> None:
+        """Vide le cache de résultats.
+        """
+        self.__cache.clear()
+    
+    
+    @staticmethod
+    def weigh(result : Any) -> int:
+        """Estime la taille mémoire d'un résultat.
+
+        Args:
+            result (Any): Le résultat (colonnes et lignes brutes).
+
+        Returns:
+            int: Taille estimée en octets.
+        """
+        getsizeof = sys.getsizeof
+        if type(result) in (list, tuple):
+            return getsizeof(result) + sum(ResultCache.weigh(item) for item in result)
+        return getsizeof(result)
+    
+    
+    def __versionsOf(self, tables : tuple) -> tuple:
+        """Relève les versions de tables.
+
+        Args:
+            tables (tuple): Noms des tables.
+
+        Returns:
+            tuple: Version commune puis versions des tables.
+        """
+        versions = self.__versions
+        return (self.__epoch,) + tuple(versions.get(table, 0) for table in tables)
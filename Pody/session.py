@@ -0,0 +1,269 @@
+import logging
+from time import perf_counter
+from typing import Iterable, Union
+
+from Pody.connection import Connection
+from Pody.factory.repository.bulk import Bulk
+from Pody.factory.repository.metadata import Metadata
+from Pody.factory.repository.tracker import Tracker
+
+
+
+class Session:
+    """Unité de travail regroupant les écritures de modèles.
+    
+    Les modèles ajoutés, modifiés et supprimés sont mémorisés puis envoyés en une
+    seule transaction, par requêtes multi-lignes regroupées par table et par opération.
+    """
+    
+    
+    def __init__(self, connection : Connection, transaction : bool = True) -> None:
+        """Constructeur de la classe.
+
+        Args:
+            connection (Connection): La connexion à la base de données des modèles.
+            transaction (bool, optional): Envoie les écritures dans une seule transaction. Par défaut True.
+        """
+        self.__connection = connection
+        self.__transaction = transaction
+        self.__new = {} # type: dict[type, list] # Modèles à insérer par classe, dans l'ordre d'ajout.
+        self.__dirty = {} # type: dict[type, dict] # Modèles à mettre à jour par classe, indexés par identité.
+        self.__deleted = {} # type: dict[type, dict] # Modèles à supprimer par classe, indexés par identité.
+    
+    
+    def __enter__(self) -> 'Session':
+        """Ouvre la session.
+
+        Returns:
+            Session: La session.
+        """
+        return self
+    
+    
+    def __exit__(self, type_ : type, value : BaseException, traceback : object) -> None:
+        """Envoie les écritures de la session, ou les abandonne si le bloc a levé une exception.
+
+        Args:
+            type_ (type): Type de l'exception levée dans le bloc, None si aucune.
+            value (BaseException): Exception levée dans le bloc.
+            traceback (object): Pile d'appels de l'exception.
+        """
+        if type_ is None:
+            self.flush()
+        else:
+            logging.warning('Écritures de la session abandonnées suite à une erreur.')
+            self.clear()
+    
+    
+    def getConnection(self) -> Connection:
+        """Retourne la connexion de la session.
+
+        Returns:
+            Connection: La connexion à la base de données des modèles.
+        """
+        return self.__connection
+    
+    
+    def add(self, models : Union[object, Iterable[object]]) -> 'Session':
+        """Ajoute des modèles à insérer.
+
+        Args:
+            models (Union[object, Iterable[object]]): Le ou les modèles.
+
+        Returns:
+            Session: La session.
+        """
+        for model in self.__list(models):
+            self.__new.setdefault(model.__class__, []).append(model)
+        return self
+    
+    
+    def attach(self, models : Union[object, Iterable[object]]) -> 'Session':
+        """Attache des modèles existants, mis à jour s'ils ont été modifiés depuis leur lecture.
+
+        Un modèle qui n'a pas été lu depuis la base est mis à jour entièrement.
+
+        Args:
+            models (Union[object, Iterable[object]]): Le ou les modèles.
+
+        Returns:
+            Session: La session.
+        """
+        for model in self.__list(models):
+            self.__dirty.setdefault(model.__class__, {})[id(model)] = model
+        return self
+    
+    
+    def delete(self, models : Union[object, Iterable[object]]) -> 'Session':
+        """Ajoute des modèles à supprimer, ou retire ceux ajoutés dans la session.
+
+        Args:
+            models (Union[object, Iterable[object]]): Le ou les modèles.
+
+        Returns:
+            Session: La session.
+        """
+        for model in self.__list(models):
+            new = self.__new.get(model.__class__, [])
+            if any(other is model for other in new):
+                # Modèle ajouté puis supprimé dans la même session : rien à envoyer.
+                new[:] = [ other for other in new if not other is model ]
+                continue
+            self.__dirty.get(model.__class__, {}).pop(id(model), None)
+            self.__deleted.setdefault(model.__class__, {})[id(model)] = model
+        return self
+    
+    
+    def clear(self) -> None:
+        """Abandonne les écritures en attente.
+        """
+        self.__new.clear()
+        self.__dirty.clear()
+        self.__deleted.clear()
+    
+    
+    def flush(self) -> dict:
+        """Envoie les écritures en attente : insertions, puis mises à jour, puis suppressions
+        dans l'ordre inverse des classes.
+
+        Un modèle ajouté dont la clé primaire est celle d'un modèle supprimé dans la session
+        remplace ce dernier : la ligne est mise à jour au lieu d'être supprimée puis insérée.
+
+        Raises:
+            Exception: Un modèle n'appartient pas à la base de données de la session, ou sa clé primaire a été modifiée.
+
+        Returns:
+            dict: Le rapport de l'envoi (lignes insérées, mises à jour, supprimées, requêtes, secondes).
+        """
+        database = self.__connection.getConfiguration().getDatabase()
+        classes = list(dict.fromkeys(list(self.__new) + list(self.__dirty) + list(self.__deleted)))
+        for class_ in classes:
+            if Metadata.of(class_).getDatabase() != database:
+                raise Exception(f'Le modèle "{class_.__name__}" n\'appartient pas à la base de données "{database}" !')
+        updates = self.__findUpdates()
+        added, removed = self.__findReplacements()
+        report = { 'inserted': 0, 'updated': 0, 'deleted': 0, 'statements': 0, 'seconds': 0.0 }
+        if len(classes) == 0:
+            return report
+
+        logging.info(f'Envoi des écritures de la session sur la base de données "{database}"...')
+        connection = self.__connection
+        start = perf_counter()
+        with connection.borrow() as handle:
+            try:
+                if self.__transaction and not handle.getConnection().in_transaction:
+                    handle.getConnection().start_transaction()
+                for class_, models in self.__new.items():
+                    models = [ model for model in models if not id(model) in added ]
+                    if len(models) > 0:
+                        self.__count(report, 'inserted', Bulk(class_, handle).inject(models))
+                for class_, columns, models in updates:
+                    self.__count(report, 'updated', Bulk(class_, handle).updateMany(models, columns))
+                for class_, models in self.__new.items():
+                    models = [ model for model in models if id(model) in added ]
+                    if len(models) > 0 and len(Metadata.of(class_).getFields()) > 0:
+                        self.__count(report, 'updated', Bulk(class_, handle).updateMany(models))
+                for class_, models in reversed(list(self.__deleted.items())):
+                    models = [ model for model in models.values() if not id(model) in removed ]
+                    if len(models) > 0:
+                        self.__count(report, 'deleted', Bulk(class_, handle).deleteMany(models))
+                if self.__transaction:
+                    connection.commitChanges()
+            except Exception:
+                if self.__transaction:
+                    connection.rollbackChanges()
+                raise
+            finally:
+                for class_ in classes:
+                    cache = Metadata.of(class_).getCache()
+                    if not cache is None:
+                        cache.clear()
+
+        for models in self.__new.values():
+            for model in models:
+                Tracker.snapshot(model)
+        for _, _, models in updates:
+            for model in models:
+                Tracker.snapshot(model)
+        for models in self.__deleted.values():
+            for model in models.values():
+                Tracker.forget(model)
+        self.clear()
+        report['seconds'] = perf_counter() - start
+        logging.info(f'Écritures de la session envoyées : {report["inserted"]} insertions, {report["updated"]} mises à jour, {report["deleted"]} suppressions en {report["statements"]} requêtes.')
+        return report
+    
+    
+    def __findUpdates(self) -> list:
+        """Regroupe les modèles modifiés par classe et par attributs modifiés.
+
+        Raises:
+            Exception: La clé primaire d'un modèle a été modifiée.
+
+        Returns:
+            list: Classe, attributs à mettre à jour (None pour tous) et modèles de chaque groupe.
+        """
+        groups = {}
+        for class_, models in self.__dirty.items():
+            keys = set(Metadata.of(class_).getKeyAttributes())
+            for model in models.values():
+                changes = Tracker.getChanges(model)
+                if not changes is None:
+                    if len(changes) == 0:
+                        continue
+                    if not keys.isdisjoint(changes):
+                        raise Exception(f'La clé primaire d\'un modèle "{class_.__name__}" a été modifiée, utilisez update() !')
+                groups.setdefault((class_, changes), []).append(model)
+        return [ (class_, changes, models) for (class_, changes), models in groups.items() ]
+    
+    
+    def __findReplacements(self) -> tuple:
+        """Associe les modèles ajoutés aux modèles supprimés de même classe et de même clé primaire.
+
+        Returns:
+            tuple: Identités des modèles ajoutés à mettre à jour, et des modèles supprimés qu'ils remplacent.
+        """
+        added = set()
+        removed = set()
+        for class_, deleted in self.__deleted.items():
+            new = self.__new.get(class_)
+            if not new:
+                continue
+            metadata = Metadata.of(class_)
+            keys = {}
+            for model in deleted.values():
+                keys[metadata.getKeysValues(model)] = id(model)
+            for model in new:
+                key = metadata.getKeysValues(model)
+                if len(key) > 0 and not None in key and key in keys:
+                    added.add(id(model))
+                    removed.add(keys.pop(key))
+        return (added, removed)
+    
+    
+    @staticmethod
+    def __count(report : dict, operation : str, bulk : dict) -> None:
+        """Ajoute le rapport d'une opération de masse au rapport de la session.
+
+        Args:
+            report (dict): Le rapport de la session.
+            operation (str): La clé de l'opération dans le rapport.
+            bulk (dict): Le rapport de l'opération de masse.
+        """
+        report[operation] += bulk['rows']
+        report['statements'] += bulk['statements']
+    
+    
+    @staticmethod
+    def __list(models : Union[object, Iterable[object]]) -> list:
+        """Retourne une liste de modèles.
+
+        Args:
+            models (Union[object, Iterable[object]]): Le ou les modèles.
+
+        Returns:
+            list: Les modèles.
+        """
+        if isinstance(models, (list, tuple, set)):
+            return list(models)
+        return [ models ]
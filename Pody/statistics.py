@@ -0,0 +1,268 @@
+import logging
+import re
+import threading
+from bisect import bisect_left
+from collections import deque
+from functools import lru_cache
+from time import time
+from typing import Optional
+
+from Pody.configuration import Configuration
+from Pody.factory.query import Query
+
+
+
+class Statistics:
+    """Statistiques des requêtes exécutées sur une même base de données, regroupées par requête normalisée.
+    
+    Les valeurs littérales et les listes de paramètres étant normalisées, une même requête
+    multi-lignes ou avec une liste IN de taille variable est comptée une seule fois. Les
+    durées sont réparties dans un histogramme à seaux fixes dont sont estimés les percentiles.
+    """
+    
+    
+    BOUNDS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0) # type: tuple # Bornes supérieures des seaux de l'histogramme des durées en secondes.
+    SLOWLOG = 100 # type: int # Nombre de requêtes lentes conservées.
+    LOGGER = logging.getLogger('Pody.slow') # type: logging.Logger # Logger des requêtes lentes.
+    
+    __registry = {} # type: dict[str, Statistics] # Statistiques par nom de base de données.
+    __lock = threading.Lock() # type: threading.Lock # Verrou du registre.
+    __explainables = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE', 'WITH') # type: tuple # Débuts des requêtes dont le plan d'exécution peut être lu.
+    __rows = re.compile(r'\(\?\+\)(?: ?, ?\(\?\+\))+') # type: re.Pattern # Listes de lignes d'une requête multi-lignes normalisée.
+    __cases = re.compile(r'(?:WHEN \? THEN \? ?){2,}') # type: re.Pattern # Cas d'une mise à jour multi-lignes normalisée.
+    
+    
+    @classmethod
+    def of(cls, configuration : Configuration) -> Optional['Statistics']:
+        """Retourne les statistiques de la base de données, en les créant à la première demande.
+
+        Args:
+            configuration (Configuration): Objet de configuration de la connexion à la base de données.
+
+        Returns:
+            Optional[Statistics]: Statistiques, None si ni les statistiques ni les requêtes lentes ne sont activées.
+        """
+        if not configuration.isStatistics() and not configuration.getSlowquery() > 0:
+            return None
+        database = configuration.getDatabase()
+        statistics = cls.__registry.get(database)
+        if statistics is None:
+            with cls.__lock:
+                statistics = cls.__registry.get(database)
+                if statistics is None:
+                    statistics = Statistics(
+                        configuration.isStatistics(),
+                        configuration.getSlowquery(),
+                        configuration.isSlowexplain())
+                    cls.__registry[database] = statistics
+        return statistics
+    
+    
+    @staticmethod
+    @lru_cache(maxsize = 4096)
+    def normalize(sql : str) -> str:
+        """Normalise une requête SQL (voir Query.getNormalized), les lignes d'une requête multi-lignes étant réduites à une seule.
+
+        Args:
+            sql (str): Requête SQL.
+
+        Returns:
+            str: Requête normalisée.
+        """
+        normalized = Query(sql).getNormalized()
+        normalized = Statistics.__rows.sub('(?+), ...', normalized)
+        return Statistics.__cases.sub('WHEN ? THEN ? ... ', normalized)
+    
+    
+    @staticmethod
+    def shape(parameters : tuple) -> str:
+        """Décrit la forme des paramètres d'une requête sans leurs valeurs.
+
+        Args:
+            parameters (tuple): Liste des paramètres de la requête, ou liste de tuples pour une exécution multiple.
+
+        Returns:
+            str: Types des paramètres, précédés du nombre d'exécutions pour une exécution multiple.
+        """
+        if len(parameters) > 0 and type(parameters[0]) is tuple:
+            return f'{len(parameters)} x {Statistics.shape(parameters[0])}'
+        types = [ type(parameter).__name__ for parameter in parameters[:8] ]
+        if len(parameters) > 8:
+            types.append(f'... {len(parameters)} paramètres')
+        return f'({", ".join(types)})'
+    
+    
+    @staticmethod
+    def percentile(buckets : list, quantile : float) -> float:
+        """Estime un percentile des durées depuis un histogramme, par interpolation dans son seau.
+
+        Args:
+            buckets (list): Nombre de durées de chaque seau, le dernier étant au-delà de la plus grande borne.
+            quantile (float): Le quantile, entre 0 et 1.
+
+        Returns:
+            float: La durée estimée en secondes, 0 si l'histogramme est vide.
+        """
+        count = sum(buckets)
+        if count == 0:
+            return 0.0
+        rank = quantile * count
+        seen = 0
+        bounds = Statistics.BOUNDS
+        for index, length in enumerate(buckets):
+            if length > 0 and seen + length >= rank:
+                if index >= len(bounds):
+                    return bounds[-1]
+                lower = bounds[index - 1] if index > 0 else 0.0
+                return lower + (bounds[index] - lower) * (rank - seen) / length
+            seen += length
+        return bounds[-1]
+    
+    
+    def __init__(self, enabled : bool = True, threshold : float = 0.0, explain : bool = False) -> None:
+        """Constructeur de la classe.
+
+        Args:
+            enabled (bool, optional): Activation des statistiques par requête normalisée. Par défaut True.
+            threshold (float, optional): Durée en secondes au-delà de laquelle une requête est lente, 0 pour désactiver. Par défaut 0.
+            explain (bool, optional): Enregistrement du plan d'exécution des requêtes lentes. Par défaut False.
+        """
+        self.__enabled = enabled
+        self.__threshold = threshold
+        self.__explain = explain
+        self.__lock = threading.Lock()
+        self.__statements = {} # type: dict[str, list] # Appels, erreurs, lignes, durée totale, durée maximale et seaux par requête normalisée.
+        self.__slow = deque(maxlen = Statistics.SLOWLOG) # type: deque[dict] # Dernières requêtes lentes.
+        self.__slowcount = 0 # type: int # Nombre total de requêtes lentes.
+        self.__plans = {} # type: dict[str, tuple] # Plans d'exécution par requête normalisée.
+    
+    
+    def getStatements(self) -> dict:
+        """Retourne les statistiques de chaque requête normalisée.
+
+        Returns:
+            dict: Par requête normalisée, appels, erreurs, lignes lues, durées totale, moyenne, maximale, percentiles 50, 95 et 99, et seaux de l'histogramme.
+        """
+        with self.__lock:
+            statements = { normalized: list(counters[:5]) + [ list(counters[5]) ] for normalized, counters in self.__statements.items() }
+        stats = {}
+        for normalized, (calls, errors, rows, seconds, slowest, buckets) in statements.items():
+            stats[normalized] = {
+                'calls': calls,
+                'errors': errors,
+                'rows': rows,
+                'seconds': seconds,
+                'mean': seconds / calls if calls > 0 else 0.0,
+                'max': slowest,
+                'p50': min(Statistics.percentile(buckets, 0.50), slowest),
+                'p95': min(Statistics.percentile(buckets, 0.95), slowest),
+                'p99': min(Statistics.percentile(buckets, 0.99), slowest),
+                'buckets': buckets
+            }
+        return stats
+    
+    
+    def getSlowQueries(self) -> list:
+        """Retourne les dernières requêtes lentes, de la plus ancienne à la plus récente.
+
+        Returns:
+            list: Requête, requête normalisée, forme des paramètres, durée, date et plan d'exécution de chaque requête lente.
+        """
+        with self.__lock:
+            return [ dict(entry) for entry in self.__slow ]
+    
+    
+    def getSlowCount(self) -> int:
+        """Retourne le nombre total de requêtes lentes, y compris celles qui ne sont plus conservées.
+
+        Returns:
+            int: Nombre de requêtes lentes.
+        """
+        return self.__slowcount
+    
+    
+    def record(self, sql : str, parameters : tuple, seconds : float, failed : bool = False) -> Optional[dict]:
+        """Compte l'exécution d'une requête et l'enregistre si elle est lente.
+
+        Args:
+            sql (str): Requête SQL.
+            parameters (tuple): Liste des paramètres de la requête.
+            seconds (float): Durée de l'exécution en secondes.
+            failed (bool, optional): L'exécution a échoué. Par défaut False.
+
+        Returns:
+            Optional[dict]: La requête lente dont le plan d'exécution est à lire (voir setPlan), None sinon.
+        """
+        normalized = Statistics.normalize(sql)
+        slow = self.__threshold > 0 and seconds >= self.__threshold
+        entry = None
+        with self.__lock:
+            if self.__enabled:
+                counters = self.__statements.get(normalized)
+                if counters is None:
+                    counters = [ 0, 0, 0, 0.0, 0.0, [ 0 ] * (len(Statistics.BOUNDS) + 1) ]
+                    self.__statements[normalized] = counters
+                counters[0] += 1
+                if failed:
+                    counters[1] += 1
+                counters[3] += seconds
+                if seconds > counters[4]:
+                    counters[4] = seconds
+                counters[5][bisect_left(Statistics.BOUNDS, seconds)] += 1
+            if slow:
+                entry = {
+                    'sql': sql,
+                    'statement': normalized,
+                    'parameters': Statistics.shape(parameters),
+                    'seconds': seconds,
+                    'time': time(),
+                    'failed': failed,
+                    'plan': self.__plans.get(normalized)
+                }
+                self.__slow.append(entry)
+                self.__slowcount += 1
+        if not slow:
+            return None
+        Statistics.LOGGER.warning('Requête lente (%.3f secondes) : %s %s', seconds, normalized, entry['parameters'])
+        explainable = sql.lstrip(' \t\r\n(').upper().startswith(Statistics.__explainables)
+        if self.__explain and not failed and entry['plan'] is None and explainable:
+            return entry
+        return None
+    
+    
+    def count(self, sql : str, rows : int) -> None:
+        """Ajoute des lignes lues aux statistiques d'une requête.
+
+        Args:
+            sql (str): Requête SQL.
+            rows (int): Nombre de lignes lues.
+        """
+        if not self.__enabled:
+            return
+        normalized = Statistics.normalize(sql)
+        with self.__lock:
+            counters = self.__statements.get(normalized)
+            if not counters is None:
+                counters[2] += rows
+    
+    
+    def setPlan(self, entry : dict, plan : tuple) -> None:
+        """Attache le plan d'exécution d'une requête lente, conservé pour les suivantes de même forme.
+
+        Args:
+            entry (dict): La requête lente (voir record).
+            plan (tuple): Les lignes du plan d'exécution, vide s'il n'a pas pu être lu.
+        """
+        with self.__lock:
+            entry['plan'] = plan
+            self.__plans[entry['statement']] = plan
+    
+    
+    def clear(self) -> None:
+        """Remet à zéro les statistiques et les requêtes lentes.
+        """
+        with self.__lock:
+            self.__statements.clear()
+            self.__slow.clear()
+            self.__slowcount = 0
+            self.__plans.clear()
@@ -0,0 +1,132 @@
+import logging
+from time import perf_counter
+from typing import Callable
+
+from Pody.factory.repository.converter import Converter
+from Pody.factory.repository.model import Model
+
+
+
+
+class Mesure(Model):
+    """Modèle de test de dix colonnes.
+    
+    Args:
+        Model (Model): Modèle de base.
+    """
+    
+    
+    def __init__(self, _id : int = None, capteur : str = None, valeur : float = None, unite : str = None,
+        minimum : float = None, maximum : float = None, moyenne : float = None, etat : bool = None,
+        zone : str = None, commentaire : str = None):
+        """Constructeur de la classe.
+        """
+        self._id = _id
+        self.capteur = capteur
+        self.valeur = valeur
+        self.unite = unite
+        self.minimum = minimum
+        self.maximum = maximum
+        self.moyenne = moyenne
+        self.etat = etat
+        self.zone = zone
+        self.commentaire = commentaire
+
+
+class Mesurecompacte(Model):
+    """Modèle de test de dix colonnes à __slots__, sans dictionnaire par instance.
+    
+    Args:
+        Model (Model): Modèle de base.
+    """
+    
+    
+    __slots__ = ('_id', 'capteur', 'valeur', 'unite', 'minimum', 'maximum', 'moyenne', 'etat', 'zone', 'commentaire') # type: tuple # Attributs du modèle, sans dictionnaire par instance.
+    __attributes__ = __slots__ # type: tuple # Manifeste des attributs lu par Pody.
+    
+    
+    def __init__(self, _id : int = None, capteur : str = None, valeur : float = None, unite : str = None,
+        minimum : float = None, maximum : float = None, moyenne : float = None, etat : bool = None,
+        zone : str = None, commentaire : str = None):
+        """Constructeur de la classe.
+        """
+        self._id = _id
+        self.capteur = capteur
+        self.valeur = valeur
+        self.unite = unite
+        self.minimum = minimum
+        self.maximum = maximum
+        self.moyenne = moyenne
+        self.etat = etat
+        self.zone = zone
+        self.commentaire = commentaire
+
+
+def legacy(class_ : type, columns : tuple, rows : list) -> list:
+    """Conversion telle que réalisée avant la compilation : un dictionnaire par ligne, puis hasattr et setattr par colonne.
+    
+    Args:
+        class_ (type): Le modèle à convertir.
+        columns (tuple): Les noms des colonnes.
+        rows (list): Les lignes brutes.
+    
+    Returns:
+        list: Les modèles convertis.
+    """
+    objects = []
+    for row in rows:
+        data = dict(zip(columns, row))
+        newmodel = class_()
+        for key, value in data.items():
+            if hasattr(newmodel, key):
+                setattr(newmodel, key, value)
+            elif hasattr(newmodel, f'_{key}'):
+                setattr(newmodel, f'_{key}', value)
+        objects.append(newmodel)
+    return objects
+
+
+def compiled(class_ : type, columns : tuple, rows : list) -> list:
+    """Conversion compilée depuis les lignes brutes.
+    
+    Args:
+        class_ (type): Le modèle à convertir.
+        columns (tuple): Les noms des colonnes.
+        rows (list): Les lignes brutes.
+    
+    Returns:
+        list: Les modèles convertis.
+    """
+    return Converter(class_, columns).convertRows(rows)
+
+
+def measure(function : Callable, columns : tuple, rows : list, repeat : int = 5) -> float:
+    """Mesure le meilleur débit d'une fonction de conversion.
+    
+    Args:
+        function (Callable): La fonction de conversion.
+        columns (tuple): Les noms des colonnes.
+        rows (list): Les lignes brutes.
+        repeat (int, optional): Le nombre de mesures. Par défaut 5.
+    
+    Returns:
+        float: Le nombre de lignes converties par seconde.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        function(Mesure, columns, rows)
+        best = min(best, perf_counter() - start)
+    return len(rows) / best
+
+
+if __name__ == '__main__':
+    # Lancement depuis la racine du projet : python -m benchmark.converter
+    logging.basicConfig()
+    columns = ('id', 'capteur', 'valeur', 'unite', 'minimum', 'maximum', 'moyenne', 'etat', 'zone', 'commentaire')
+    rows = [ (i, f'c{i % 50}', i * 0.5, 'kWh', 0.0, 100.0, 50.0, True, 'nord', None) for i in range(100000) ]
+    before = measure(legacy, columns, rows)
+    after = measure(compiled, columns, rows)
+    print(f'Avant : {before:,.0f} lignes/s')
+    print(f'Après : {after:,.0f} lignes/s')
+    print(f'Gain : x{after / before:.1f}')
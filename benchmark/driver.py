@@ -0,0 +1,217 @@
+import re
+from typing import Any
+
+from Pody.driver.driver import Driver
+
+
+
+class FakeCursor:
+    """Curseur en mémoire imitant celui de mysql.connector, sans aucun échange réseau.
+
+    Les lectures renvoient les lignes enregistrées dans FakeConnection.TABLES pour la table
+    de la requête, les écritures ne sont que comptées : seul le coût de Pody est mesuré.
+    """
+
+
+    __table = re.compile(r'\b(?:FROM|INTO|UPDATE)\s+`?(\w+)`?', re.IGNORECASE) # type: re.Pattern # Nom de la table d'une requête.
+    __key = re.compile(r'\bWHERE\s+`?id`?\s*=\s*%s\s*$', re.IGNORECASE) # type: re.Pattern # Lecture par clé primaire.
+
+
+    def __init__(self, connection : 'FakeConnection') -> None:
+        """Constructeur de la classe.
+
+        Args:
+            connection (FakeConnection): La connexion du curseur.
+        """
+        self.__connection = connection
+        self.__rows = [] # type: list # Lignes du dernier résultat.
+        self.__position = 0 # type: int # Position de la prochaine ligne à lire.
+        self.description = None
+        self.column_names = ()
+        self.lastrowid = None
+        self.rowcount = -1
+
+
+    @property
+    def with_rows(self) -> bool:
+        """Indique si la dernière requête a un résultat.
+
+        Returns:
+            bool: La requête a un résultat.
+        """
+        return not self.description is None
+
+
+    def execute(self, sql : Any, parameters : tuple = ()) -> None:
+        """Exécute une requête.
+
+        Args:
+            sql (Any): La requête.
+            parameters (tuple, optional): Les paramètres. Par défaut, la liste est vide.
+        """
+        sql = str(sql)
+        upper = sql.lstrip().upper()
+        self.__position = 0
+        if not upper.startswith(('SELECT', 'SHOW', 'EXPLAIN')):
+            self.__result((), [])
+            self.description = None
+            self.rowcount = 1
+            if upper.startswith('INSERT'):
+                self.lastrowid = 1
+            return
+        if '@@' in upper:
+            self.__result(('value',), [ (0 if 'LOCAL_INFILE' in upper else 4194304,) ])
+            return
+        match = FakeCursor.__table.search(sql)
+        rows = FakeConnection.TABLES.get(match.group(1).lower(), []) if not match is None else []
+        columns = tuple(column.strip().strip('`') for column in sql[sql.upper().index('SELECT') + 6:sql.upper().index(' FROM ')].split(',')) if ' FROM ' in sql.upper() else ('value',)
+        if upper.startswith('SELECT COUNT(') or upper.startswith('SELECT 1 FROM'):
+            self.__result(columns, [ (len(rows),) ])
+        elif not FakeCursor.__key.search(sql) is None:
+            index = parameters[0] - 1 if len(parameters) > 0 and type(parameters[0]) is int else 0
+            self.__result(columns, rows[index:index + 1])
+        elif ' WHERE ' in upper:
+            self.__result(columns, rows[:max(1, len(rows) // 10)])
+        else:
+            self.__result(columns, rows)
+
+
+    def executemany(self, sql : Any, parameters : list) -> None:
+        """Exécute une requête pour chaque liste de paramètres.
+
+        Args:
+            sql (Any): La requête.
+            parameters (list): Les listes de paramètres.
+        """
+        self.execute(sql)
+        self.rowcount = len(parameters)
+
+
+    def fetchall(self) -> list:
+        """Lit les lignes restantes du résultat.
+
+        Returns:
+            list: Les lignes.
+        """
+        rows = self.__rows[self.__position:] if self.__position > 0 else self.__rows
+        self.__position = len(self.__rows)
+        self.__connection.unread_result = False
+        return rows
+
+
+    def fetchone(self) -> Any:
+        """Lit la ligne suivante du résultat.
+
+        Returns:
+            Any: La ligne, None s'il n'y en a plus.
+        """
+        rows = self.fetchmany(1)
+        return rows[0] if len(rows) > 0 else None
+
+
+    def fetchmany(self, size : int = 1) -> list:
+        """Lit les lignes suivantes du résultat.
+
+        Args:
+            size (int, optional): Nombre de lignes. Par défaut 1.
+
+        Returns:
+            list: Les lignes.
+        """
+        start = self.__position
+        self.__position = min(len(self.__rows), start + size)
+        if self.__position >= len(self.__rows):
+            self.__connection.unread_result = False
+        return self.__rows[start:self.__position]
+
+
+    def close(self) -> None:
+        """Ferme le curseur.
+        """
+        self.__rows = []
+
+
+    def __result(self, columns : tuple, rows : list) -> None:
+        """Enregistre le résultat de la dernière requête.
+
+        Args:
+            columns (tuple): Les noms des colonnes.
+            rows (list): Les lignes.
+        """
+        self.__rows = rows
+        self.description = tuple((column, None) for column in columns)
+        self.column_names = columns
+        self.rowcount = len(rows)
+        self.__connection.unread_result = len(rows) > 0
+
+
+
+class FakeConnection:
+    """Connexion en mémoire imitant celle de mysql.connector.
+    """
+
+
+    TABLES = {} # type: dict[str, list] # Lignes renvoyées par les lectures, par nom de table.
+
+
+    def __init__(self) -> None:
+        """Constructeur de la classe.
+        """
+        self.autocommit = True
+        self.unread_result = False
+        self.in_transaction = False
+
+
+    def cursor(self, dictionary : bool = False, prepared : bool = False, buffered : bool = False) -> FakeCursor:
+        """Retourne un nouveau curseur.
+
+        Returns:
+            FakeCursor: Le curseur.
+        """
+        return FakeCursor(self)
+
+
+    def start_transaction(self) -> None:
+        """Démarre une transaction.
+        """
+        self.in_transaction = True
+
+
+    def commit(self) -> None:
+        """Valide la transaction.
+        """
+        self.in_transaction = False
+
+
+    def rollback(self) -> None:
+        """Annule la transaction.
+        """
+        self.in_transaction = False
+
+
+    def ping(self, reconnect : bool = False, attempts : int = 1, delay : int = 0) -> None:
+        """Vérifie la connexion.
+        """
+        pass
+
+
+    def is_connected(self) -> bool:
+        """Indique si la connexion est ouverte.
+
+        Returns:
+            bool: Toujours vrai.
+        """
+        return True
+
+
+    def close(self) -> None:
+        """Ferme la connexion.
+        """
+        pass
+
+
+
+def install() -> None:
+    """Enregistre le pilote en mémoire sous le nom "memoire" (voir Driver).
+    """
+    Driver.register('memoire', lambda configuration: FakeConnection())
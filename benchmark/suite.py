@@ -0,0 +1,237 @@
+import argparse
+import json
+import logging
+import platform
+import sys
+import tracemalloc
+from time import perf_counter
+from typing import Callable
+
+
+
+SCENARIOS = (
+    ('query', 'requêtes'),
+    ('reflection', 'modèles'),
+    ('converter', 'lignes'),
+    ('slots', 'lignes'),
+    ('read', 'lectures'),
+    ('fetch', 'lignes'),
+    ('inject', 'lignes'),
+    ('all', 'lignes'),
+    ('views', 'lignes'),
+    ('many', 'lignes'),
+    ('columns', 'lignes')
+) # Noms et unités des scénarios, dans l'ordre d'exécution.
+
+
+def measure(function : Callable, repeat : int = 5, minimum : float = 0.2) -> float:
+    """Mesure le meilleur débit d'un scénario, chaque mesure enchaînant les appels pendant une durée minimale.
+
+    Args:
+        function (Callable): Le scénario, retournant le nombre d'unités traitées par appel.
+        repeat (int, optional): Le nombre de mesures. Par défaut 5.
+        minimum (float, optional): La durée minimale d'une mesure en secondes. Par défaut 0.2.
+
+    Returns:
+        float: Le nombre d'unités traitées par seconde.
+    """
+    best = 0.0
+    for _ in range(repeat):
+        units = 0
+        start = perf_counter()
+        while True:
+            units += function()
+            elapsed = perf_counter() - start
+            if elapsed >= minimum:
+                break
+        best = max(best, units / elapsed)
+    return best
+
+
+def peak(function : Callable) -> int:
+    """Mesure le pic de mémoire allouée par un appel d'un scénario.
+
+    Args:
+        function (Callable): Le scénario.
+
+    Returns:
+        int: Le pic de mémoire en octets.
+    """
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def prepare(rows : int, arguments : argparse.Namespace) -> dict:
+    """Ouvre la connexion et prépare les scénarios sur la table "mesure" de la base "benchmark".
+
+    Args:
+        rows (int): Le nombre de lignes de la table.
+        arguments (argparse.Namespace): Le pilote et les paramètres de connexion au serveur.
+
+    Returns:
+        dict: Les scénarios par nom.
+    """
+    from benchmark import driver
+    driver.install()
+    from Pody.configuration import Configuration
+    from Pody.connection import Connection
+    from Pody.factory.clause import Clause
+    from Pody.factory.query import Query
+    from Pody.factory.repository.converter import Converter
+    from Pody.factory.repository.reflection import Reflection
+    from benchmark.converter import Mesure, Mesurecompacte
+
+    columns = ('id', 'capteur', 'valeur', 'unite', 'minimum', 'maximum', 'moyenne', 'etat', 'zone', 'commentaire')
+    data = [ (i, f'c{i % 50}', i * 0.5, 'kWh', 0.0, 100.0, 50.0, True, 'nord', None) for i in range(1, rows + 1) ]
+    models = [ Mesure(None, *row[1:]) for row in data[:1000] ]
+    memory = arguments.driver == 'memoire'
+    socket = Connection(Configuration('benchmark', arguments.user, arguments.password, arguments.host, arguments.port, timer = False, driver = arguments.driver))
+    if memory:
+        driver.FakeConnection.TABLES['mesure'] = data
+    else:
+        key = 'INTEGER PRIMARY KEY AUTOINCREMENT' if arguments.driver == 'sqlite' else 'INT PRIMARY KEY AUTO_INCREMENT'
+        socket.runQuery(Query('DROP TABLE IF EXISTS mesure'))
+        socket.runQuery(Query(f'CREATE TABLE mesure (id {key}, capteur VARCHAR(50), valeur DOUBLE, unite VARCHAR(10), '
+            'minimum DOUBLE, maximum DOUBLE, moyenne DOUBLE, etat BOOLEAN, zone VARCHAR(50), commentaire TEXT)'))
+        Mesure.inject([ Mesure(None, *row[1:]) for row in data ])
+    select = Query().select(columns).from_('mesure')
+
+    def query() -> int:
+        str(Query().select(columns).from_('mesure').where('id', '%s').and_('capteur', '%s', Clause.LIKE).order('id'))
+        return 1
+
+    def reflection() -> int:
+        reflect = Reflection(models[0])
+        reflect.getColumns()
+        reflect.getValues()
+        return 1
+
+    def converter() -> int:
+        return len(Converter(Mesure, columns).convertRows(data))
+
+    def slots() -> int:
+        return len(Converter(Mesurecompacte, columns).convertRows(data))
+
+    def read() -> int:
+        Mesure(1).read()
+        return 1
+
+    def fetch() -> int:
+        socket.runQuery(select)
+        return len(socket.fetchAll())
+
+    def inject() -> int:
+        Mesure.inject(models)
+        if not memory:
+            socket.runQuery(Query('DELETE FROM mesure WHERE id > %s'), (rows,))
+        return len(models)
+
+    def all() -> int:
+        return len(Mesure.all())
+
+    def views() -> int:
+        return len([ view.valeur for view in Mesure.allViews() ])
+
+    def many() -> int:
+        return len(Mesure(None, 'c1%').many('capteur', Clause.LIKE))
+
+    def columnar() -> int:
+        return len(Mesure.columns()['valeur'])
+
+    return {
+        'query': query,
+        'reflection': reflection,
+        'converter': converter,
+        'slots': slots,
+        'read': read,
+        'fetch': fetch,
+        'inject': inject,
+        'all': all,
+        'views': views,
+        'many': many,
+        'columns': columnar
+    }
+
+
+def compare(results : dict, baseline : dict, tolerance : float) -> list:
+    """Compare des résultats à une référence.
+
+    Args:
+        results (dict): Les résultats.
+        baseline (dict): Les résultats de référence.
+        tolerance (float): La baisse de débit ou la hausse de mémoire acceptée, entre 0 et 1.
+
+    Returns:
+        list: Les messages des régressions.
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get('scenarios', {}).get(name)
+        if reference is None:
+            continue
+        if result['rate'] < reference['rate'] * (1 - tolerance):
+            regressions.append(f'{name} : {result["rate"]:,.0f} {result["unit"]}/s contre {reference["rate"]:,.0f} ({result["rate"] / reference["rate"] - 1:+.0%})')
+        if reference['peak'] > 0 and result['peak'] > reference['peak'] * (1 + tolerance):
+            regressions.append(f'{name} : {result["peak"]:,} octets contre {reference["peak"]:,} ({result["peak"] / reference["peak"] - 1:+.0%})')
+    return regressions
+
+
+def main() -> int:
+    """Lance la suite de mesures.
+
+    Returns:
+        int: Le code de sortie, 1 en cas de régression.
+    """
+    parser = argparse.ArgumentParser(description = 'Mesures de performance des chemins critiques de Pody.')
+    parser.add_argument('--rows', type = int, default = 100000, help = 'nombre de lignes de la table lue')
+    parser.add_argument('--repeat', type = int, default = 5, help = 'nombre de mesures par scénario')
+    parser.add_argument('--only', nargs = '+', choices = [ name for name, _ in SCENARIOS ], help = 'scénarios à lancer')
+    parser.add_argument('--save', help = 'fichier JSON où enregistrer les résultats')
+    parser.add_argument('--baseline', help = 'fichier JSON de référence, échec si un scénario régresse')
+    parser.add_argument('--tolerance', type = float, default = 0.2, help = 'régression acceptée par rapport à la référence (0.2 = 20 %%)')
+    parser.add_argument('--driver', default = 'memoire', choices = ('memoire', 'sqlite', 'auto', 'pure', 'c'),
+        help = 'pilote : en mémoire, SQLite, ou serveur MySQL local (base "benchmark") avec mysql-connector-python')
+    parser.add_argument('--host', default = 'localhost')
+    parser.add_argument('--port', type = int, default = 3306)
+    parser.add_argument('--user', default = 'root')
+    parser.add_argument('--password', default = '')
+    arguments = parser.parse_args()
+
+    logging.basicConfig()
+    scenarios = prepare(arguments.rows, arguments)
+    results = {}
+    for name, unit in SCENARIOS:
+        if not arguments.only is None and not name in arguments.only:
+            continue
+        function = scenarios[name]
+        rate = measure(function, arguments.repeat)
+        memory = peak(function)
+        results[name] = { 'rate': rate, 'unit': unit, 'peak': memory }
+        print(f'{name:<12}{rate:>16,.0f} {unit}/s{memory:>16,} octets')
+
+    if not arguments.save is None:
+        with open(arguments.save, 'w', encoding = 'utf-8') as file:
+            json.dump({
+                'python': platform.python_version(),
+                'driver': arguments.driver,
+                'rows': arguments.rows,
+                'scenarios': results
+            }, file, indent = 4)
+    if not arguments.baseline is None:
+        with open(arguments.baseline, encoding = 'utf-8') as file:
+            regressions = compare(results, json.load(file), arguments.tolerance)
+        for regression in regressions:
+            print(f'Régression : {regression}')
+        if len(regressions) > 0:
+            return 1
+        print('Aucune régression.')
+    return 0
+
+
+if __name__ == '__main__':
+    # Lancement depuis la racine du projet : python -m benchmark.suite
+    sys.exit(main())
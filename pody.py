@@ -86,9 +86,10 @@ try:
     
     all = ask('Générer le modèle de toutes les tables ? (O/N) (O par défaut) : ', 'O')
     table = None if all == 'O' or all == 'o' else ask('Nom de la table à générer : ')
+    slots = ask('Générer des modèles à __slots__, sans dictionnaire par instance ? (O/N) (N par défaut) : ', 'N')
         
     try:
-        Generator(socket).generateModels(table)
+        Generator(socket).generateModels(table, slots == 'O' or slots == 'o')
         subprocess.Popen(
             f'explorer /select,"{database}"' if os.name == 'nt' else
             f'open {os.getcwd()}')
@@ -0,0 +1,89 @@
+import unittest
+
+from Pody.configuration import Configuration
+from Pody.connection import Connection
+from Pody.factory.direction import Direction
+from Pody.factory.query import Query
+from Pody.factory.repository.model import Model
+
+
+
+class Releve(Model):
+    """Modèle de test dont les colonnes de tri peuvent être nulles.
+    
+    Args:
+        Model (Model): Modèle de base.
+    """
+    
+    
+    def __init__(self, _id : int = None, zone : str = None, niveau : int = None):
+        """Constructeur de la classe.
+        """
+        self._id = _id
+        self.zone = zone
+        self.niveau = niveau
+
+
+
+class TestPaginate(unittest.TestCase):
+    """Pagination par clé de Model.paginate(), comparée à un tri complet.
+    """
+    
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Crée la table "releve" sur une base SQLite en mémoire.
+        """
+        # La base d'un modèle est le premier composant de son module.
+        cls.connection = Connection(Configuration(Releve.__module__.split('.')[0], timer = False, driver = 'sqlite'))
+        cls.connection.runQuery(Query('DROP TABLE IF EXISTS releve'))
+        cls.connection.runQuery(Query('CREATE TABLE releve (id INTEGER PRIMARY KEY, zone TEXT, niveau INTEGER)'))
+        zones = (None, 'nord', None, None, 'sud', 'est', 'nord', 'ouest', 'sud', 'est')
+        Releve.inject([ Releve(index + 1, zone, None if index % 3 == 0 else index % 2) for index, zone in enumerate(zones) ])
+    
+    
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Ferme la connexion.
+        """
+        cls.connection.closeSocket()
+    
+    
+    def expected(self, order : tuple, direction : Direction) -> list:
+        """Retourne les clés de toutes les lignes dans l'ordre du tri complet.
+
+        Args:
+            order (tuple): Les colonnes de tri.
+            direction (Direction): La direction du tri.
+
+        Returns:
+            list: Les clés primaires.
+        """
+        columns = ', '.join(f'{column} {direction}' for column in order + ('id',))
+        self.connection.runQuery(Query(f'SELECT id FROM releve ORDER BY {columns}'))
+        return [ row['id'] for row in self.connection.fetchAll() ]
+    
+    
+    def test_nullable_order(self) -> None:
+        """Les pages se poursuivent après une ligne dont la valeur de tri est nulle.
+        """
+        for order in (('zone',), ('zone', 'niveau'), ('niveau', 'zone')):
+            for direction in (Direction.ASC, Direction.DESC):
+                for size in (1, 3, 4, 20):
+                    with self.subTest(order = order, direction = direction, size = size):
+                        pages = Releve.paginate(size, order, direction)
+                        self.assertEqual([ model._id for page in pages for model in page ], self.expected(order, direction))
+    
+    
+    def test_primary_key(self) -> None:
+        """Sans colonne de tri, les pages suivent les clés primaires.
+        """
+        for direction in (Direction.ASC, Direction.DESC):
+            pages = list(Releve.paginate(3, direction = direction))
+            self.assertEqual([ len(page) for page in pages ], [ 3, 3, 3, 1 ])
+            self.assertEqual([ model._id for page in pages for model in page ], self.expected((), direction))
+
+
+
+if __name__ == '__main__':
+    unittest.main()